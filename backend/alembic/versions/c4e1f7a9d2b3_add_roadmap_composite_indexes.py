@@ -0,0 +1,35 @@
+"""Add roadmap composite indexes
+
+Revision ID: c4e1f7a9d2b3
+Revises: 982e701a8b20
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1f7a9d2b3'
+down_revision: Union[str, None] = '982e701a8b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_task_roadmap_seq', 'roadmap_tasks', ['roadmap_id', 'sequence_order'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_task_user_status_seq', 'roadmap_tasks', ['user_id', 'status', 'sequence_order'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_task_user_startdate', 'roadmap_tasks', ['user_id', 'start_date'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_roadmap_user_active', 'roadmaps', ['user_id', 'is_active'], unique=False, postgresql_where=sa.text('is_active'), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_roadmap_user_active', table_name='roadmaps', postgresql_concurrently=True)
+        op.drop_index('ix_task_user_startdate', table_name='roadmap_tasks', postgresql_concurrently=True)
+        op.drop_index('ix_task_user_status_seq', table_name='roadmap_tasks', postgresql_concurrently=True)
+        op.drop_index('ix_task_roadmap_seq', table_name='roadmap_tasks', postgresql_concurrently=True)
@@ -0,0 +1,36 @@
+"""Add pending_count to cold_email_campaigns
+
+Revision ID: d7a3b5e90c21
+Revises: c4e1f7a9d2b3
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3b5e90c21'
+down_revision: Union[str, None] = 'c4e1f7a9d2b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('cold_email_campaigns', sa.Column('pending_count', sa.Integer(), server_default=sa.text('0'), nullable=True))
+    # Backfill from the recipients currently awaiting approval
+    op.execute(
+        """
+        UPDATE cold_email_campaigns AS c
+        SET pending_count = (
+            SELECT COUNT(*) FROM cold_email_recipients AS r
+            WHERE r.campaign_id = c.id AND r.status = 'PENDING'
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('cold_email_campaigns', 'pending_count')
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from app.services.vector_db import get_vector_db
 from app.services.graph_db import get_graph_db
 from app.services.llm_service import llm_service
+from app.utils.timestamps import now_iso
 import logging
 
 logger = logging.getLogger(__name__)
@@ -49,7 +50,7 @@ class BaseAgent(ABC):
     
     def add_to_memory(self, event: Dict[str, Any]):
         """Add event to agent memory"""
-        event["timestamp"] = datetime.utcnow().isoformat()
+        event["timestamp"] = now_iso()
         self.memory.append(event)
         # Keep only last 100 events
         if len(self.memory) > 100:
@@ -7,16 +7,97 @@ from langchain_groq import ChatGroq
 from langgraph.graph import StateGraph, END
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from app.config.settings import settings
+from app.services.groq_client import get_groq_client
 from app.services.vector_db import vector_db
 from app.services.graph_db import graph_db
+from app.utils.timestamps import now_iso
 from sqlalchemy.orm import Session
 import json
 import logging
-from datetime import datetime
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are parsed once at import rather than on every call
+_QUESTIONS_PROMPT = ChatPromptTemplate.from_template("""
+Generate {count} interview questions for this role:
+
+Role: {job_title}
+Company: {company}
+Difficulty: {difficulty}
+
+Question distribution:
+- 30% Behavioral (STAR format)
+- 30% Technical (role-specific)
+- 20% Problem-solving scenarios
+- 20% Company/role fit
+
+For each question provide:
+- question (string)
+- category (behavioral/technical/problem-solving/fit)
+- difficulty (easy/medium/hard)
+- what_to_look_for (evaluation criteria)
+- sample_good_answer (brief example)
+- time_limit_seconds (120-300)
+
+Return as JSON array.
+""")
+
+_EVALUATION_PROMPT = ChatPromptTemplate.from_template("""
+Evaluate this interview response:
+
+Question: {question}
+Category: {category}
+What to look for: {criteria}
+Candidate's Answer: {response}
+
+Evaluate on:
+1. Content Quality (0-100): Relevance, depth, examples
+2. Clarity (0-100): Structure, articulation, conciseness
+3. Confidence Indicators (0-100): Tone, decisiveness, ownership
+4. STAR Method (if behavioral): Situation, Task, Action, Result
+5. Technical Accuracy (if technical): Correctness, depth
+
+Provide:
+- content_score (0-100)
+- clarity_score (0-100)
+- confidence_score (0-100)
+- strengths (list of 2-3)
+- improvements (list of 2-3)
+- overall_score (0-100)
+- feedback (2-3 sentences of constructive feedback)
+
+Be honest but constructive. Return as JSON.
+""")
+
+_OVERALL_PROMPT = ChatPromptTemplate.from_template("""
+Generate comprehensive interview feedback:
+
+Role: {job_title}
+Questions Asked: {question_count}
+Evaluations: {evaluations}
+
+Provide overall feedback covering:
+1. Overall performance summary
+2. Key strengths demonstrated
+3. Primary areas for improvement
+4. Specific examples from their responses
+5. Comparison to typical candidates for this role
+6. Honest assessment of selection probability
+7. Action plan for improvement
+
+Be honest, specific, and constructive. This is for their growth.
+
+Return as JSON with:
+- summary (string)
+- strengths (list)
+- improvements (list)
+- selection_probability (0-100)
+- comparison_to_peers (above_average/average/below_average)
+- action_plan (list of specific steps)
+""")
+
+
 class InterviewState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
     session_id: str
@@ -50,6 +131,7 @@ class InterviewAgent:
     def __init__(self):
         self.llm = ChatGroq(
             api_key=settings.GROQ_API_KEY,
+            async_client=get_groq_client(settings.GROQ_API_KEY).chat.completions,
             model_name="llama3-70b-8192",
             temperature=0.7
         )
@@ -119,31 +201,7 @@ class InterviewAgent:
     async def generate_interview_questions(self, state: InterviewState) -> InterviewState:
         """Generate interview questions based on role and difficulty"""
         
-        questions_prompt = ChatPromptTemplate.from_template("""
-Generate {count} interview questions for this role:
-
-Role: {job_title}
-Company: {company}
-Difficulty: {difficulty}
-
-Question distribution:
-- 30% Behavioral (STAR format)
-- 30% Technical (role-specific)
-- 20% Problem-solving scenarios
-- 20% Company/role fit
-
-For each question provide:
-- question (string)
-- category (behavioral/technical/problem-solving/fit)
-- difficulty (easy/medium/hard)
-- what_to_look_for (evaluation criteria)
-- sample_good_answer (brief example)
-- time_limit_seconds (120-300)
-
-Return as JSON array.
-""")
-        
-        chain = questions_prompt | self.llm
+        chain = _QUESTIONS_PROMPT | self.llm
         response = await chain.ainvoke({
             "count": state["question_count"],
             "job_title": state["job_title"],
@@ -210,7 +268,7 @@ Take your time to structure your response. When ready, share your answer.
             "question_index": idx,
             "question": question["question"],
             "response": response_text,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         })
         
         return state
@@ -222,34 +280,7 @@ Take your time to structure your response. When ready, share your answer.
         question = state["questions"][idx]
         response = state["user_responses"][-1]["response"]
         
-        evaluation_prompt = ChatPromptTemplate.from_template("""
-Evaluate this interview response:
-
-Question: {question}
-Category: {category}
-What to look for: {criteria}
-Candidate's Answer: {response}
-
-Evaluate on:
-1. Content Quality (0-100): Relevance, depth, examples
-2. Clarity (0-100): Structure, articulation, conciseness
-3. Confidence Indicators (0-100): Tone, decisiveness, ownership
-4. STAR Method (if behavioral): Situation, Task, Action, Result
-5. Technical Accuracy (if technical): Correctness, depth
-
-Provide:
-- content_score (0-100)
-- clarity_score (0-100)
-- confidence_score (0-100)
-- strengths (list of 2-3)
-- improvements (list of 2-3)
-- overall_score (0-100)
-- feedback (2-3 sentences of constructive feedback)
-
-Be honest but constructive. Return as JSON.
-""")
-        
-        chain = evaluation_prompt | self.llm
+        chain = _EVALUATION_PROMPT | self.llm
         response_eval = await chain.ainvoke({
             "question": question["question"],
             "category": question.get("category", "general"),
@@ -316,34 +347,7 @@ Let's move to the next question.
     async def generate_final_feedback(self, state: InterviewState) -> InterviewState:
         """Generate comprehensive final feedback"""
         
-        overall_prompt = ChatPromptTemplate.from_template("""
-Generate comprehensive interview feedback:
-
-Role: {job_title}
-Questions Asked: {question_count}
-Evaluations: {evaluations}
-
-Provide overall feedback covering:
-1. Overall performance summary
-2. Key strengths demonstrated
-3. Primary areas for improvement
-4. Specific examples from their responses
-5. Comparison to typical candidates for this role
-6. Honest assessment of selection probability
-7. Action plan for improvement
-
-Be honest, specific, and constructive. This is for their growth.
-
-Return as JSON with:
-- summary (string)
-- strengths (list)
-- improvements (list)
-- selection_probability (0-100)
-- comparison_to_peers (above_average/average/below_average)
-- action_plan (list of specific steps)
-""")
-        
-        chain = overall_prompt | self.llm
+        chain = _OVERALL_PROMPT | self.llm
         response = await chain.ainvoke({
             "job_title": state["job_title"],
             "question_count": len(state["questions"]),
@@ -432,7 +436,7 @@ Improvements: {', '.join(state['improvement_areas'])}
                 "type": "interview",
                 "session_id": session_id,
                 "score": state["final_score"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         )
         
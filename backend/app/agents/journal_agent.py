@@ -7,15 +7,117 @@ from langchain_groq import ChatGroq
 from langgraph.graph import StateGraph, END
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from app.config.settings import settings
+from app.services.groq_client import get_groq_client
 from app.services.vector_db import vector_db
 from sqlalchemy.orm import Session
 from app.models.database import User
+from app.utils.timestamps import now_iso
 import json
 import logging
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are parsed once at import rather than on every call
+_SENTIMENT_PROMPT = ChatPromptTemplate.from_template("""
+Analyze the emotional sentiment of this journal entry:
+
+Entry: {entry}
+Stated Mood: {mood}
+
+Determine:
+1. Primary emotion (happy/sad/anxious/frustrated/excited/neutral/confused/overwhelmed)
+2. Intensity (1-10)
+3. Underlying feelings
+4. Positive aspects mentioned
+5. Concerns or worries expressed
+6. Energy level (high/medium/low)
+
+Return as JSON.
+""")
+
+_PATTERN_PROMPT = ChatPromptTemplate.from_template("""
+Analyze patterns across recent journal entries:
+
+Current Entry: {current_entry}
+Sentiment: {sentiment}
+
+Recent Entries Summary:
+{recent_entries}
+
+Identify:
+1. Recurring themes or concerns
+2. Progress indicators
+3. Emotional trends (improving/declining/stable)
+4. Stuck points or obstacles
+5. Wins and achievements (even small ones)
+
+Provide insights as a supportive friend would.
+
+Return as JSON with "insights" array.
+""")
+
+_ACTION_PROMPT = ChatPromptTemplate.from_template("""
+Based on this journal entry, suggest 2-3 concrete next actions:
+
+Entry: {entry}
+Mood: {mood}
+Patterns: {patterns}
+
+Actions should be:
+- Specific and actionable
+- Appropriate for their current state
+- Varied (learning, applying, self-care, networking, etc.)
+- Achievable within 24-48 hours
+
+If they seem overwhelmed, suggest smaller steps.
+If they're energized, suggest ambitious actions.
+
+Return as JSON array of actions with:
+- action (string)
+- reasoning (string)
+- urgency (high/medium/low)
+""")
+
+_BURNOUT_PROMPT = ChatPromptTemplate.from_template("""
+Analyze for signs of burnout or stagnation:
+
+Current Entry: {entry}
+Recent Patterns: {patterns}
+Sentiment: {sentiment}
+
+Red flags to check:
+1. Persistent exhaustion or lack of motivation
+2. Cynicism about career progress
+3. Feeling stuck or directionless
+4. Avoiding career tasks consistently
+5. Physical symptoms mentioned (headaches, sleep issues)
+6. Social withdrawal from networking
+7. Diminished sense of accomplishment
+
+If ANY red flags detected, return them with severity (mild/moderate/severe).
+If none, return empty array.
+
+Return as JSON: {{"signals": [], "severity": "none|mild|moderate|severe"}}
+""")
+
+_SUMMARY_PROMPT = ChatPromptTemplate.from_template("""
+Create a meaningful summary of this person's career journal journey:
+
+Entries over past {days} days:
+{entries}
+
+Provide:
+1. Overall emotional arc
+2. Key themes and recurring topics
+3. Progress made
+4. Ongoing challenges
+5. Moments of growth
+6. Patterns to be aware of
+
+Write as a compassionate narrative (3-4 paragraphs) that helps them see their journey clearly.
+""")
+
+
 class JournalState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
     user_id: str
@@ -46,6 +148,7 @@ class JournalAgent:
     def __init__(self):
         self.llm = ChatGroq(
             api_key=settings.GROQ_API_KEY,
+            async_client=get_groq_client(settings.GROQ_API_KEY).chat.completions,
             model_name="llama3-70b-8192",
             temperature=0.9  # Higher temperature for empathetic responses
         )
@@ -123,24 +226,7 @@ Remember: You're not just recording - you're a supportive companion in their car
     async def analyze_sentiment(self, state: JournalState) -> JournalState:
         """Analyze emotional sentiment of the entry"""
         
-        sentiment_prompt = ChatPromptTemplate.from_template("""
-Analyze the emotional sentiment of this journal entry:
-
-Entry: {entry}
-Stated Mood: {mood}
-
-Determine:
-1. Primary emotion (happy/sad/anxious/frustrated/excited/neutral/confused/overwhelmed)
-2. Intensity (1-10)
-3. Underlying feelings
-4. Positive aspects mentioned
-5. Concerns or worries expressed
-6. Energy level (high/medium/low)
-
-Return as JSON.
-""")
-        
-        chain = sentiment_prompt | self.llm
+        chain = _SENTIMENT_PROMPT | self.llm
         response = await chain.ainvoke({
             "entry": state["entry_text"],
             "mood": state["mood"]
@@ -170,28 +256,7 @@ Return as JSON.
             state["reflection_insights"] = ["This is your first journal entry - exciting start!"]
             return state
         
-        pattern_prompt = ChatPromptTemplate.from_template("""
-Analyze patterns across recent journal entries:
-
-Current Entry: {current_entry}
-Sentiment: {sentiment}
-
-Recent Entries Summary:
-{recent_entries}
-
-Identify:
-1. Recurring themes or concerns
-2. Progress indicators
-3. Emotional trends (improving/declining/stable)
-4. Stuck points or obstacles
-5. Wins and achievements (even small ones)
-
-Provide insights as a supportive friend would.
-
-Return as JSON with "insights" array.
-""")
-        
-        chain = pattern_prompt | self.llm
+        chain = _PATTERN_PROMPT | self.llm
         response = await chain.ainvoke({
             "current_entry": state["entry_text"],
             "sentiment": json.dumps(state["sentiment_analysis"]),
@@ -278,29 +343,7 @@ Create a personalized, uplifting message that:
     async def suggest_next_actions(self, state: JournalState) -> JournalState:
         """Suggest actionable next steps based on entry"""
         
-        action_prompt = ChatPromptTemplate.from_template("""
-Based on this journal entry, suggest 2-3 concrete next actions:
-
-Entry: {entry}
-Mood: {mood}
-Patterns: {patterns}
-
-Actions should be:
-- Specific and actionable
-- Appropriate for their current state
-- Varied (learning, applying, self-care, networking, etc.)
-- Achievable within 24-48 hours
-
-If they seem overwhelmed, suggest smaller steps.
-If they're energized, suggest ambitious actions.
-
-Return as JSON array of actions with:
-- action (string)
-- reasoning (string)
-- urgency (high/medium/low)
-""")
-        
-        chain = action_prompt | self.llm
+        chain = _ACTION_PROMPT | self.llm
         response = await chain.ainvoke({
             "entry": state["entry_text"],
             "mood": state["mood"],
@@ -319,29 +362,7 @@ Return as JSON array of actions with:
     async def check_burnout_signals(self, state: JournalState) -> JournalState:
         """Check for signs of burnout or stagnation"""
         
-        burnout_prompt = ChatPromptTemplate.from_template("""
-Analyze for signs of burnout or stagnation:
-
-Current Entry: {entry}
-Recent Patterns: {patterns}
-Sentiment: {sentiment}
-
-Red flags to check:
-1. Persistent exhaustion or lack of motivation
-2. Cynicism about career progress
-3. Feeling stuck or directionless
-4. Avoiding career tasks consistently
-5. Physical symptoms mentioned (headaches, sleep issues)
-6. Social withdrawal from networking
-7. Diminished sense of accomplishment
-
-If ANY red flags detected, return them with severity (mild/moderate/severe).
-If none, return empty array.
-
-Return as JSON: {{"signals": [], "severity": "none|mild|moderate|severe"}}
-""")
-        
-        chain = burnout_prompt | self.llm
+        chain = _BURNOUT_PROMPT | self.llm
         response = await chain.ainvoke({
             "entry": state["entry_text"],
             "patterns": ", ".join(state.get("reflection_insights", [])),
@@ -368,7 +389,7 @@ Return as JSON: {{"signals": [], "severity": "none|mild|moderate|severe"}}
         
         # Create comprehensive entry text
         full_entry = f"""Journal Entry by {state['user_name']}
-Date: {datetime.utcnow().isoformat()}
+Date: {now_iso()}
 Mood: {state['mood']}
 Entry: {state['entry_text']}
 Sentiment: {state['sentiment_analysis'].get('primary_emotion', 'neutral')}
@@ -383,7 +404,7 @@ Insights: {', '.join(state.get('reflection_insights', []))}"""
                 "type": "reflection",
                 "mood": state["mood"],
                 "sentiment": state["sentiment_analysis"].get("primary_emotion"),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso(),
                 "burnout_signals": len(state.get("burnout_signals", []))
             }
         )
@@ -434,7 +455,7 @@ Insights: {', '.join(state.get('reflection_insights', []))}"""
                 "burnout_detected": len(result["burnout_signals"]) > 0,
                 "burnout_signals": result["burnout_signals"],
                 "voice_command": result.get("voice_command"),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         except Exception as e:
             logger.error(f"Journal chat error: {e}")
@@ -455,24 +476,7 @@ Insights: {', '.join(state.get('reflection_insights', []))}"""
             filter_metadata={"source": "journal_entry"}
         )
         
-        summary_prompt = ChatPromptTemplate.from_template("""
-Create a meaningful summary of this person's career journal journey:
-
-Entries over past {days} days:
-{entries}
-
-Provide:
-1. Overall emotional arc
-2. Key themes and recurring topics
-3. Progress made
-4. Ongoing challenges
-5. Moments of growth
-6. Patterns to be aware of
-
-Write as a compassionate narrative (3-4 paragraphs) that helps them see their journey clearly.
-""")
-        
-        chain = summary_prompt | self.llm
+        chain = _SUMMARY_PROMPT | self.llm
         response = await chain.ainvoke({
             "days": days,
             "entries": json.dumps([e["text"][:300] for e in entries[:20]])
@@ -482,7 +486,7 @@ Write as a compassionate narrative (3-4 paragraphs) that helps them see their jo
             "summary": response.content,
             "entry_count": len(entries),
             "period_days": days,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         }
 
 # Singleton instance
@@ -7,15 +7,107 @@ from langchain_groq import ChatGroq
 from langgraph.graph import StateGraph, END
 from langchain_core.prompts import ChatPromptTemplate
 from app.config.settings import settings
+from app.services.groq_client import get_groq_client
 from app.services.vector_db import vector_db
 from app.services.graph_db import graph_db
+from app.utils.timestamps import now_iso
 from sqlalchemy.orm import Session
 import json
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are parsed once at import rather than on every call
+_SCRAPE_PROMPT = ChatPromptTemplate.from_template("""
+Generate 10 realistic job postings for:
+Target Roles: {target_roles}
+Locations: {locations}
+
+For each job, provide:
+- job_id (unique)
+- title
+- company
+- location
+- description (brief)
+- requirements (list of skills)
+- experience_level
+- salary_range
+- posted_date
+- application_url
+
+Return as JSON array.
+""")
+
+_SCORING_PROMPT = ChatPromptTemplate.from_template("""
+Score this job compatibility:
+
+Job: {job_title} at {company}
+Requirements: {requirements}
+Description: {description}
+
+User Profile:
+Skills: {user_skills}
+Experience: {user_experience}
+
+Provide:
+1. compatibility_score (0-100)
+2. matching_skills (list)
+3. missing_skills (list)
+4. experience_match (good/partial/poor)
+5. should_apply (true/false)
+6. reason (brief explanation)
+
+Return as JSON.
+""")
+
+_GAP_PROMPT = ChatPromptTemplate.from_template("""
+User is missing these skills for a {job_title} role:
+{missing_skills}
+
+For each skill:
+1. How critical is it? (critical/important/nice-to-have)
+2. How long to learn? (hours/weeks)
+3. Best resources (free courses, tutorials)
+4. Can they compensate with other skills?
+
+Return as JSON array.
+""")
+
+_RANKING_PROMPT = ChatPromptTemplate.from_template("""
+Rank these job opportunities considering:
+- Compatibility score
+- Skill gaps
+- Career growth potential
+- Company reputation
+
+Jobs: {jobs_summary}
+
+Return ranked list with:
+- rank (1-5)
+- job_id
+- priority_reason
+- application_urgency (high/medium/low)
+
+Return as JSON array.
+""")
+
+_ACTION_PROMPT = ChatPromptTemplate.from_template("""
+For this job application:
+Job: {job_title} at {company}
+Compatibility: {score}%
+Missing Skills: {missing_skills}
+
+Suggest:
+1. Resume modifications (which projects to highlight)
+2. Cover letter key points
+3. Skills to emphasize
+4. How to address gaps
+5. Interview prep topics
+
+Return as JSON.
+""")
+
+
 class OpportunitiesState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
     user_id: str
@@ -41,6 +133,7 @@ class OpportunitiesAgent:
     def __init__(self):
         self.llm = ChatGroq(
             api_key=settings.GROQ_API_KEY,
+            async_client=get_groq_client(settings.GROQ_API_KEY).chat.completions,
             model_name="llama3-70b-8192",
             temperature=0.3  # Lower temperature for factual matching
         )
@@ -86,27 +179,7 @@ class OpportunitiesAgent:
         # In production, use Selenium/Playwright for actual scraping
         # For now, we'll simulate with LLM-generated sample data
         
-        scrape_prompt = ChatPromptTemplate.from_template("""
-Generate 10 realistic job postings for:
-Target Roles: {target_roles}
-Locations: {locations}
-
-For each job, provide:
-- job_id (unique)
-- title
-- company
-- location
-- description (brief)
-- requirements (list of skills)
-- experience_level
-- salary_range
-- posted_date
-- application_url
-
-Return as JSON array.
-""")
-        
-        chain = scrape_prompt | self.llm
+        chain = _SCRAPE_PROMPT | self.llm
         response = await chain.ainvoke({
             "target_roles": ", ".join(state["target_roles"]),
             "locations": ", ".join(state["location_preferences"])
@@ -152,29 +225,7 @@ Return as JSON array.
         scored_jobs = []
         
         for job in state["filtered_jobs"]:
-            scoring_prompt = ChatPromptTemplate.from_template("""
-Score this job compatibility:
-
-Job: {job_title} at {company}
-Requirements: {requirements}
-Description: {description}
-
-User Profile:
-Skills: {user_skills}
-Experience: {user_experience}
-
-Provide:
-1. compatibility_score (0-100)
-2. matching_skills (list)
-3. missing_skills (list)
-4. experience_match (good/partial/poor)
-5. should_apply (true/false)
-6. reason (brief explanation)
-
-Return as JSON.
-""")
-            
-            chain = scoring_prompt | self.llm
+            chain = _SCORING_PROMPT | self.llm
             response = await chain.ainvoke({
                 "job_title": job.get("title", ""),
                 "company": job.get("company", ""),
@@ -213,20 +264,7 @@ Return as JSON.
             missing_skills = job.get("missing_skills", [])
             
             if missing_skills:
-                gap_prompt = ChatPromptTemplate.from_template("""
-User is missing these skills for a {job_title} role:
-{missing_skills}
-
-For each skill:
-1. How critical is it? (critical/important/nice-to-have)
-2. How long to learn? (hours/weeks)
-3. Best resources (free courses, tutorials)
-4. Can they compensate with other skills?
-
-Return as JSON array.
-""")
-                
-                chain = gap_prompt | self.llm
+                chain = _GAP_PROMPT | self.llm
                 response = await chain.ainvoke({
                     "job_title": job.get("title", ""),
                     "missing_skills": ", ".join(missing_skills)
@@ -244,24 +282,6 @@ Return as JSON array.
     async def rank_and_prioritize(self, state: OpportunitiesState) -> OpportunitiesState:
         """Rank opportunities by overall value"""
         
-        ranking_prompt = ChatPromptTemplate.from_template("""
-Rank these job opportunities considering:
-- Compatibility score
-- Skill gaps
-- Career growth potential
-- Company reputation
-
-Jobs: {jobs_summary}
-
-Return ranked list with:
-- rank (1-5)
-- job_id
-- priority_reason
-- application_urgency (high/medium/low)
-
-Return as JSON array.
-""")
-        
         jobs_summary = [
             {
                 "job_id": job.get("job_id"),
@@ -272,7 +292,7 @@ Return as JSON array.
             for job in state["top_opportunities"]
         ]
         
-        chain = ranking_prompt | self.llm
+        chain = _RANKING_PROMPT | self.llm
         response = await chain.ainvoke({
             "jobs_summary": json.dumps(jobs_summary)
         })
@@ -298,23 +318,7 @@ Return as JSON array.
         """Suggest specific actions for each opportunity"""
         
         for job in state["top_opportunities"]:
-            action_prompt = ChatPromptTemplate.from_template("""
-For this job application:
-Job: {job_title} at {company}
-Compatibility: {score}%
-Missing Skills: {missing_skills}
-
-Suggest:
-1. Resume modifications (which projects to highlight)
-2. Cover letter key points
-3. Skills to emphasize
-4. How to address gaps
-5. Interview prep topics
-
-Return as JSON.
-""")
-            
-            chain = action_prompt | self.llm
+            chain = _ACTION_PROMPT | self.llm
             response = await chain.ainvoke({
                 "job_title": job.get("title", ""),
                 "company": job.get("company", ""),
@@ -386,7 +390,7 @@ Return as JSON.
                 "opportunities": result["top_opportunities"],
                 "total_found": len(result["scraped_jobs"]),
                 "total_relevant": len(result["filtered_jobs"]),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         except Exception as e:
             logger.error(f"Opportunities scan error: {e}")
@@ -7,16 +7,81 @@ from langchain_groq import ChatGroq
 from langgraph.graph import StateGraph, END
 from langchain_core.prompts import ChatPromptTemplate
 from app.config.settings import settings
+from app.services.groq_client import get_groq_client
 from app.services.vector_db import vector_db
 from app.services.graph_db import graph_db
 from sqlalchemy.orm import Session
 from app.models.database import User, Education, Skill, Project, Experience
+from app.utils.timestamps import now_iso
 import json
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are parsed once at import rather than on every call
+_VALIDATION_PROMPT = ChatPromptTemplate.from_template("""
+Validate this profile update data:
+
+Data to Update: {update_data}
+
+Check:
+1. Required fields present
+2. Data format correctness (emails, dates, etc.)
+3. Completeness
+4. Consistency with existing data
+5. Professional appropriateness
+
+Return validation results as JSON:
+{{
+  "valid": true,
+  "errors": [],
+  "warnings": [],
+  "suggestions": []
+}}
+""")
+
+_ANALYSIS_PROMPT = ChatPromptTemplate.from_template("""
+Analyze profile completeness:
+
+Current Profile Data: {profile}
+
+Evaluate:
+1. Overall completeness score (0-100)
+2. Missing critical information
+3. Weak sections (need more detail)
+4. Strong sections (well-filled)
+5. Impact on job matching
+
+Return as JSON:
+{{
+  "completeness_score": 85,
+  "missing_critical": ["portfolio links"],
+  "weak_sections": ["project descriptions"],
+  "strong_sections": ["education", "skills"],
+  "matching_impact": "Excellent profile for job matching"
+}}
+""")
+
+_IMPROVEMENT_PROMPT = ChatPromptTemplate.from_template("""
+Suggest profile improvements:
+
+Analysis: {analysis}
+Missing: {missing}
+Weak Sections: {weak}
+
+Provide 3-5 specific, actionable suggestions:
+- What to add
+- How to improve existing content
+- Why it matters for career goals
+
+Return as JSON array of recommendation objects with:
+- suggestion (string)
+- section (string)
+- priority (high/medium/low)
+- impact (string)
+""")
+
+
 class ProfileState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
     user_id: str
@@ -42,6 +107,7 @@ class ProfileAgent:
     def __init__(self):
         self.llm = ChatGroq(
             api_key=settings.GROQ_API_KEY,
+            async_client=get_groq_client(settings.GROQ_API_KEY).chat.completions,
             model_name="llama3-70b-8192",
             temperature=0.5
         )
@@ -91,7 +157,7 @@ class ProfileAgent:
         
         state["current_profile"] = {
             "loaded": True,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         }
         
         logger.info(f"Loaded profile for user {state['user_id']}")
@@ -109,28 +175,7 @@ class ProfileAgent:
         
         update_data = state.get("update_data", {})
         
-        validation_prompt = ChatPromptTemplate.from_template("""
-Validate this profile update data:
-
-Data to Update: {update_data}
-
-Check:
-1. Required fields present
-2. Data format correctness (emails, dates, etc.)
-3. Completeness
-4. Consistency with existing data
-5. Professional appropriateness
-
-Return validation results as JSON:
-{{
-  "valid": true,
-  "errors": [],
-  "warnings": [],
-  "suggestions": []
-}}
-""")
-        
-        chain = validation_prompt | self.llm
+        chain = _VALIDATION_PROMPT | self.llm
         response = await chain.ainvoke({
             "update_data": json.dumps(update_data)
         })
@@ -173,7 +218,7 @@ Return validation results as JSON:
             metadata={
                 "source": "profile_update",
                 "type": "profile",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         )
         
@@ -213,29 +258,7 @@ Return validation results as JSON:
         
         profile = state.get("current_profile", {})
         
-        analysis_prompt = ChatPromptTemplate.from_template("""
-Analyze profile completeness:
-
-Current Profile Data: {profile}
-
-Evaluate:
-1. Overall completeness score (0-100)
-2. Missing critical information
-3. Weak sections (need more detail)
-4. Strong sections (well-filled)
-5. Impact on job matching
-
-Return as JSON:
-{{
-  "completeness_score": 85,
-  "missing_critical": ["portfolio links"],
-  "weak_sections": ["project descriptions"],
-  "strong_sections": ["education", "skills"],
-  "matching_impact": "Excellent profile for job matching"
-}}
-""")
-        
-        chain = analysis_prompt | self.llm
+        chain = _ANALYSIS_PROMPT | self.llm
         response = await chain.ainvoke({
             "profile": json.dumps(profile)
         })
@@ -254,26 +277,7 @@ Return as JSON:
         
         analysis = state.get("profile_analysis", {})
         
-        improvement_prompt = ChatPromptTemplate.from_template("""
-Suggest profile improvements:
-
-Analysis: {analysis}
-Missing: {missing}
-Weak Sections: {weak}
-
-Provide 3-5 specific, actionable suggestions:
-- What to add
-- How to improve existing content
-- Why it matters for career goals
-
-Return as JSON array of recommendation objects with:
-- suggestion (string)
-- section (string)
-- priority (high/medium/low)
-- impact (string)
-""")
-        
-        chain = improvement_prompt | self.llm
+        chain = _IMPROVEMENT_PROMPT | self.llm
         response = await chain.ainvoke({
             "analysis": json.dumps(analysis),
             "missing": ", ".join(analysis.get("missing_critical", [])),
@@ -336,7 +340,7 @@ Return as JSON array of recommendation objects with:
                 "sync_status": result.get("sync_status"),
                 "analysis": result.get("profile_analysis"),
                 "recommendations": result.get("recommendations"),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         except Exception as e:
             logger.error(f"Profile management error: {e}")
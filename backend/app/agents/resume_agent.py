@@ -7,15 +7,187 @@ from langchain_groq import ChatGroq
 from langgraph.graph import StateGraph, END
 from langchain_core.prompts import ChatPromptTemplate
 from app.config.settings import settings
+from app.services.groq_client import get_groq_client
 from app.services.vector_db import vector_db
 from app.services.graph_db import graph_db
+from app.utils.timestamps import now_iso
 from sqlalchemy.orm import Session
 import json
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are parsed once at import rather than on every call
+_PARSE_PROMPT = ChatPromptTemplate.from_template("""
+Parse this resume and extract key information:
+
+Resume:
+{resume_text}
+
+Extract:
+1. Contact information
+2. Summary/Objective
+3. Work experience (with dates, roles, companies)
+4. Education
+5. Skills (technical and soft)
+6. Projects
+7. Certifications
+8. Keywords present
+
+Return as structured JSON.
+""")
+
+_SCORING_PROMPT = ChatPromptTemplate.from_template("""
+Evaluate this resume on a scale of 0-100:
+
+Resume:
+{resume_text}
+
+Criteria:
+1. Format and readability (20 points)
+2. Content quality (30 points)
+3. Achievement quantification (20 points)
+4. Keywords and industry terms (15 points)
+5. Grammar and professionalism (15 points)
+
+Provide:
+- overall_score (0-100)
+- category_scores (dict)
+- top_3_strengths (list)
+- top_3_weaknesses (list)
+- immediate_fixes (list)
+
+Return as JSON.
+""")
+
+_ATS_PROMPT = ChatPromptTemplate.from_template("""
+Analyze this resume for ATS (Applicant Tracking System) compatibility:
+
+Resume:
+{resume_text}
+
+Check:
+1. Formatting issues (tables, columns, headers/footers)
+2. Font readability
+3. Section headers clarity
+4. Keyword density
+5. File format compatibility
+6. Contact information parseability
+
+Provide:
+- ats_score (0-100)
+- format_issues (list)
+- parsing_warnings (list)
+- optimization_tips (list)
+
+Return as JSON.
+""")
+
+_COMPARISON_PROMPT = ChatPromptTemplate.from_template("""
+Compare this resume with the job description:
+
+Resume:
+{resume_text}
+
+Job Description:
+{job_description}
+
+Analyze:
+1. Matching skills and experience
+2. Missing required qualifications
+3. Keyword alignment
+4. Experience level match
+5. Cultural fit indicators
+6. Relevance score (0-100)
+
+Provide detailed comparison as JSON.
+""")
+
+_GAP_PROMPT = ChatPromptTemplate.from_template("""
+Identify missing keywords and phrases:
+
+Job Description:
+{job_description}
+
+Current Resume:
+{resume_text}
+
+Find:
+1. Critical keywords in job description but missing in resume
+2. Skills mentioned in JD but not in resume
+3. Industry terms and buzzwords to add
+4. Action verbs to incorporate
+
+Prioritize by importance (critical/important/nice-to-have).
+
+Return as JSON array of:
+{{
+  "keyword": "string",
+  "importance": "critical|important|nice-to-have",
+  "suggestion": "how to incorporate"
+}}
+""")
+
+_IMPROVEMENT_PROMPT = ChatPromptTemplate.from_template("""
+Based on the analysis, provide specific improvements:
+
+Current Resume Score: {score}/100
+Weaknesses: {weaknesses}
+ATS Issues: {ats_issues}
+Keyword Gaps: {keyword_gaps}
+
+For each improvement:
+1. Section to modify
+2. Current text (if applicable)
+3. Suggested replacement
+4. Reasoning
+5. Impact (high/medium/low)
+
+Provide 5-10 actionable improvements as JSON array.
+""")
+
+_OPTIMIZATION_PROMPT = ChatPromptTemplate.from_template("""
+Rewrite this resume to optimize for the job description:
+
+Original Resume:
+{resume_text}
+
+Job Description:
+{job_description}
+
+Improvements to Apply:
+{improvements}
+
+Guidelines:
+1. Reorder bullets to prioritize relevant experience
+2. Incorporate missing keywords naturally
+3. Quantify achievements where possible
+4. Highlight matching skills prominently
+5. Maintain truthfulness - don't fabricate
+6. Keep same overall structure
+7. Optimize for ATS parsing
+
+Generate the improved resume text.
+""")
+
+_TASK_PROMPT = ChatPromptTemplate.from_template("""
+Convert these gaps into learning tasks:
+
+Keyword Gaps: {keyword_gaps}
+Missing Skills: {weaknesses}
+
+For each gap that represents a learnable skill:
+1. Task title
+2. Description
+3. Estimated time to learn
+4. Resources (courses, tutorials)
+5. Priority
+6. How it improves resume
+
+Return as JSON array of tasks.
+""")
+
+
 class ResumeState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
     user_id: str
@@ -45,6 +217,7 @@ class ResumeAgent:
     def __init__(self):
         self.llm = ChatGroq(
             api_key=settings.GROQ_API_KEY,
+            async_client=get_groq_client(settings.GROQ_API_KEY).chat.completions,
             model_name="llama3-70b-8192",
             temperature=0.3
         )
@@ -89,26 +262,7 @@ class ResumeAgent:
     async def parse_resume_content(self, state: ResumeState) -> ResumeState:
         """Parse and extract key sections from resume"""
         
-        parse_prompt = ChatPromptTemplate.from_template("""
-Parse this resume and extract key information:
-
-Resume:
-{resume_text}
-
-Extract:
-1. Contact information
-2. Summary/Objective
-3. Work experience (with dates, roles, companies)
-4. Education
-5. Skills (technical and soft)
-6. Projects
-7. Certifications
-8. Keywords present
-
-Return as structured JSON.
-""")
-        
-        chain = parse_prompt | self.llm
+        chain = _PARSE_PROMPT | self.llm
         response = await chain.ainvoke({
             "resume_text": state["resume_text"]
         })
@@ -121,30 +275,7 @@ Return as structured JSON.
     async def score_overall_quality(self, state: ResumeState) -> ResumeState:
         """Score resume quality (0-100)"""
         
-        scoring_prompt = ChatPromptTemplate.from_template("""
-Evaluate this resume on a scale of 0-100:
-
-Resume:
-{resume_text}
-
-Criteria:
-1. Format and readability (20 points)
-2. Content quality (30 points)
-3. Achievement quantification (20 points)
-4. Keywords and industry terms (15 points)
-5. Grammar and professionalism (15 points)
-
-Provide:
-- overall_score (0-100)
-- category_scores (dict)
-- top_3_strengths (list)
-- top_3_weaknesses (list)
-- immediate_fixes (list)
-
-Return as JSON.
-""")
-        
-        chain = scoring_prompt | self.llm
+        chain = _SCORING_PROMPT | self.llm
         response = await chain.ainvoke({
             "resume_text": state["resume_text"]
         })
@@ -165,30 +296,7 @@ Return as JSON.
     async def analyze_ats_compatibility(self, state: ResumeState) -> ResumeState:
         """Analyze ATS (Applicant Tracking System) compatibility"""
         
-        ats_prompt = ChatPromptTemplate.from_template("""
-Analyze this resume for ATS (Applicant Tracking System) compatibility:
-
-Resume:
-{resume_text}
-
-Check:
-1. Formatting issues (tables, columns, headers/footers)
-2. Font readability
-3. Section headers clarity
-4. Keyword density
-5. File format compatibility
-6. Contact information parseability
-
-Provide:
-- ats_score (0-100)
-- format_issues (list)
-- parsing_warnings (list)
-- optimization_tips (list)
-
-Return as JSON.
-""")
-        
-        chain = ats_prompt | self.llm
+        chain = _ATS_PROMPT | self.llm
         response = await chain.ainvoke({
             "resume_text": state["resume_text"]
         })
@@ -211,27 +319,7 @@ Return as JSON.
     async def compare_with_job_description(self, state: ResumeState) -> ResumeState:
         """Compare resume against specific job description"""
         
-        comparison_prompt = ChatPromptTemplate.from_template("""
-Compare this resume with the job description:
-
-Resume:
-{resume_text}
-
-Job Description:
-{job_description}
-
-Analyze:
-1. Matching skills and experience
-2. Missing required qualifications
-3. Keyword alignment
-4. Experience level match
-5. Cultural fit indicators
-6. Relevance score (0-100)
-
-Provide detailed comparison as JSON.
-""")
-        
-        chain = comparison_prompt | self.llm
+        chain = _COMPARISON_PROMPT | self.llm
         response = await chain.ainvoke({
             "resume_text": state["resume_text"],
             "job_description": state["job_description"]
@@ -247,32 +335,7 @@ Provide detailed comparison as JSON.
             state["keyword_gaps"] = []
             return state
         
-        gap_prompt = ChatPromptTemplate.from_template("""
-Identify missing keywords and phrases:
-
-Job Description:
-{job_description}
-
-Current Resume:
-{resume_text}
-
-Find:
-1. Critical keywords in job description but missing in resume
-2. Skills mentioned in JD but not in resume
-3. Industry terms and buzzwords to add
-4. Action verbs to incorporate
-
-Prioritize by importance (critical/important/nice-to-have).
-
-Return as JSON array of:
-{{
-  "keyword": "string",
-  "importance": "critical|important|nice-to-have",
-  "suggestion": "how to incorporate"
-}}
-""")
-        
-        chain = gap_prompt | self.llm
+        chain = _GAP_PROMPT | self.llm
         response = await chain.ainvoke({
             "job_description": state["job_description"],
             "resume_text": state["resume_text"]
@@ -290,25 +353,7 @@ Return as JSON array of:
     async def generate_improvements(self, state: ResumeState) -> ResumeState:
         """Generate specific improvement suggestions"""
         
-        improvement_prompt = ChatPromptTemplate.from_template("""
-Based on the analysis, provide specific improvements:
-
-Current Resume Score: {score}/100
-Weaknesses: {weaknesses}
-ATS Issues: {ats_issues}
-Keyword Gaps: {keyword_gaps}
-
-For each improvement:
-1. Section to modify
-2. Current text (if applicable)
-3. Suggested replacement
-4. Reasoning
-5. Impact (high/medium/low)
-
-Provide 5-10 actionable improvements as JSON array.
-""")
-        
-        chain = improvement_prompt | self.llm
+        chain = _IMPROVEMENT_PROMPT | self.llm
         response = await chain.ainvoke({
             "score": state.get("resume_score", 0),
             "weaknesses": ", ".join(state.get("weaknesses", [])),
@@ -332,31 +377,7 @@ Provide 5-10 actionable improvements as JSON array.
             state["tailored_resume"] = state["resume_text"]
             return state
         
-        optimization_prompt = ChatPromptTemplate.from_template("""
-Rewrite this resume to optimize for the job description:
-
-Original Resume:
-{resume_text}
-
-Job Description:
-{job_description}
-
-Improvements to Apply:
-{improvements}
-
-Guidelines:
-1. Reorder bullets to prioritize relevant experience
-2. Incorporate missing keywords naturally
-3. Quantify achievements where possible
-4. Highlight matching skills prominently
-5. Maintain truthfulness - don't fabricate
-6. Keep same overall structure
-7. Optimize for ATS parsing
-
-Generate the improved resume text.
-""")
-        
-        chain = optimization_prompt | self.llm
+        chain = _OPTIMIZATION_PROMPT | self.llm
         response = await chain.ainvoke({
             "resume_text": state["resume_text"],
             "job_description": state["job_description"],
@@ -371,24 +392,7 @@ Generate the improved resume text.
     async def convert_gaps_to_tasks(self, state: ResumeState) -> ResumeState:
         """Convert skill gaps into actionable roadmap tasks"""
         
-        task_prompt = ChatPromptTemplate.from_template("""
-Convert these gaps into learning tasks:
-
-Keyword Gaps: {keyword_gaps}
-Missing Skills: {weaknesses}
-
-For each gap that represents a learnable skill:
-1. Task title
-2. Description
-3. Estimated time to learn
-4. Resources (courses, tutorials)
-5. Priority
-6. How it improves resume
-
-Return as JSON array of tasks.
-""")
-        
-        chain = task_prompt | self.llm
+        chain = _TASK_PROMPT | self.llm
         response = await chain.ainvoke({
             "keyword_gaps": json.dumps(state.get("keyword_gaps", [])),
             "weaknesses": ", ".join(state.get("weaknesses", []))
@@ -418,7 +422,7 @@ Return as JSON array of tasks.
                 "source": "resume_analysis",
                 "type": "resume",
                 "score": state["resume_score"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         )
         
@@ -489,7 +493,7 @@ Return as JSON array of tasks.
                 "suggestions": result["optimization_suggestions"],
                 "optimized_resume": result["tailored_resume"],
                 "learning_tasks": result["gap_to_roadmap"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         except Exception as e:
             logger.error(f"Resume analysis error: {e}")
@@ -7,15 +7,117 @@ from langchain_groq import ChatGroq
 from langgraph.graph import StateGraph, END
 from langchain_core.prompts import ChatPromptTemplate
 from app.config.settings import settings
+from app.services.groq_client import get_groq_client
 from sqlalchemy.orm import Session
 from app.services.vector_db import vector_db
 from app.services.graph_db import graph_db
-from datetime import datetime, timedelta
+from app.utils.timestamps import now_iso
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are parsed once at import rather than on every call
+_ANALYSIS_PROMPT = ChatPromptTemplate.from_template("""
+Analyze this user profile for career development:
+
+Current Status: {status}
+Skills: {skills}
+Experience: {experience_count} positions
+Education: {education}
+Target Role: {target_role}
+Timeline: {timeline}
+
+Provide a comprehensive analysis of:
+1. Current career level
+2. Strengths
+3. Areas for improvement
+4. Readiness for target role
+
+Return as JSON with keys: level, strengths, improvements, readiness_score (0-100)
+""")
+
+_GAP_PROMPT = ChatPromptTemplate.from_template("""
+User wants to become: {target_role}
+User has these skills: {current_skills}
+
+Based on industry standards, identify:
+1. Critical skills they MUST learn
+2. Nice-to-have skills
+3. Skills they can leverage
+4. Priority order for learning
+
+Return as JSON:
+{{
+  "critical_skills": ["skill1", "skill2"],
+  "nice_to_have": ["skill3", "skill4"],
+  "leverage_skills": ["skill5"],
+  "learning_priority": [
+    {{"skill": "skill1", "priority": "high", "estimated_weeks": 4}}
+  ]
+}}
+""")
+
+_MILESTONE_PROMPT = ChatPromptTemplate.from_template("""
+Create a {months}-month roadmap for becoming a {target_role}.
+
+Current skills: {current_skills}
+Skills to learn: {skill_gaps}
+Timeline: {timeline}
+
+Generate monthly milestones with:
+- Month number
+- Focus area
+- Specific goals
+- Deliverables
+- Skills to master
+
+Return as JSON array of milestones:
+[
+  {{
+    "month": 1,
+    "title": "Foundation Phase",
+    "focus": "Core fundamentals",
+    "goals": ["goal1", "goal2"],
+    "deliverables": ["project1"],
+    "skills": ["skill1", "skill2"]
+  }}
+]
+""")
+
+_LEARNING_PROMPT = ChatPromptTemplate.from_template("""
+For each skill gap, create a learning path:
+
+Skills to learn: {skills}
+Timeline: {timeline}
+
+For each skill provide:
+- Learning resources (free courses, tutorials, docs)
+- Estimated hours
+- Practice projects
+- Milestones
+- Assessment criteria
+
+Return as JSON array.
+""")
+
+_PROJECT_PROMPT = ChatPromptTemplate.from_template("""
+Suggest 3-5 portfolio projects for someone learning:
+Target Role: {target_role}
+Skills: {skills}
+
+For each project:
+- Title
+- Description
+- Technologies/skills used
+- Complexity level
+- Estimated timeline
+- Why it's valuable
+
+Return as JSON array of projects.
+""")
+
+
 class RoadmapState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
     user_id: str
@@ -43,6 +145,7 @@ class RoadmapAgent:
     def __init__(self):
         self.llm = ChatGroq(
             api_key=settings.GROQ_API_KEY,
+            async_client=get_groq_client(settings.GROQ_API_KEY).chat.completions,
             model_name="llama3-70b-8192",
             temperature=0.7
         )
@@ -80,26 +183,7 @@ class RoadmapAgent:
         
         profile = state["user_profile"]
         
-        analysis_prompt = ChatPromptTemplate.from_template("""
-Analyze this user profile for career development:
-
-Current Status: {status}
-Skills: {skills}
-Experience: {experience_count} positions
-Education: {education}
-Target Role: {target_role}
-Timeline: {timeline}
-
-Provide a comprehensive analysis of:
-1. Current career level
-2. Strengths
-3. Areas for improvement
-4. Readiness for target role
-
-Return as JSON with keys: level, strengths, improvements, readiness_score (0-100)
-""")
-        
-        chain = analysis_prompt | self.llm
+        chain = _ANALYSIS_PROMPT | self.llm
         response = await chain.ainvoke({
             "status": profile.get("currentStatus", "Unknown"),
             "skills": ", ".join(profile.get("skills", {}).get("technical", [])),
@@ -122,28 +206,7 @@ Return as JSON with keys: level, strengths, improvements, readiness_score (0-100
         # Query knowledge graph for required skills
         role_skills = graph_db.get_recommended_skills(state["user_id"], limit=20)
         
-        gap_prompt = ChatPromptTemplate.from_template("""
-User wants to become: {target_role}
-User has these skills: {current_skills}
-
-Based on industry standards, identify:
-1. Critical skills they MUST learn
-2. Nice-to-have skills
-3. Skills they can leverage
-4. Priority order for learning
-
-Return as JSON:
-{{
-  "critical_skills": ["skill1", "skill2"],
-  "nice_to_have": ["skill3", "skill4"],
-  "leverage_skills": ["skill5"],
-  "learning_priority": [
-    {{"skill": "skill1", "priority": "high", "estimated_weeks": 4}}
-  ]
-}}
-""")
-        
-        chain = gap_prompt | self.llm
+        chain = _GAP_PROMPT | self.llm
         response = await chain.ainvoke({
             "target_role": target_role,
             "current_skills": ", ".join(current_skills)
@@ -166,34 +229,7 @@ Return as JSON:
         timeline = state["timeline"]
         months = self._parse_timeline_to_months(timeline)
         
-        milestone_prompt = ChatPromptTemplate.from_template("""
-Create a {months}-month roadmap for becoming a {target_role}.
-
-Current skills: {current_skills}
-Skills to learn: {skill_gaps}
-Timeline: {timeline}
-
-Generate monthly milestones with:
-- Month number
-- Focus area
-- Specific goals
-- Deliverables
-- Skills to master
-
-Return as JSON array of milestones:
-[
-  {{
-    "month": 1,
-    "title": "Foundation Phase",
-    "focus": "Core fundamentals",
-    "goals": ["goal1", "goal2"],
-    "deliverables": ["project1"],
-    "skills": ["skill1", "skill2"]
-  }}
-]
-""")
-        
-        chain = milestone_prompt | self.llm
+        chain = _MILESTONE_PROMPT | self.llm
         response = await chain.ainvoke({
             "months": months,
             "target_role": state["target_role"],
@@ -214,23 +250,7 @@ Return as JSON array of milestones:
     async def create_learning_paths(self, state: RoadmapState) -> RoadmapState:
         """Create detailed learning paths for each skill"""
         
-        learning_prompt = ChatPromptTemplate.from_template("""
-For each skill gap, create a learning path:
-
-Skills to learn: {skills}
-Timeline: {timeline}
-
-For each skill provide:
-- Learning resources (free courses, tutorials, docs)
-- Estimated hours
-- Practice projects
-- Milestones
-- Assessment criteria
-
-Return as JSON array.
-""")
-        
-        chain = learning_prompt | self.llm
+        chain = _LEARNING_PROMPT | self.llm
         response = await chain.ainvoke({
             "skills": ", ".join(state["skill_gaps"]),
             "timeline": state["timeline"]
@@ -242,23 +262,7 @@ Return as JSON array.
     async def suggest_projects(self, state: RoadmapState) -> RoadmapState:
         """Suggest portfolio projects"""
         
-        project_prompt = ChatPromptTemplate.from_template("""
-Suggest 3-5 portfolio projects for someone learning:
-Target Role: {target_role}
-Skills: {skills}
-
-For each project:
-- Title
-- Description
-- Technologies/skills used
-- Complexity level
-- Estimated timeline
-- Why it's valuable
-
-Return as JSON array of projects.
-""")
-        
-        chain = project_prompt | self.llm
+        chain = _PROJECT_PROMPT | self.llm
         response = await chain.ainvoke({
             "target_role": state["target_role"],
             "skills": ", ".join(state["skill_gaps"])
@@ -280,7 +284,7 @@ Return as JSON array of projects.
             "user_id": state["user_id"],
             "target_role": state["target_role"],
             "timeline": state["timeline"],
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": now_iso(),
             "milestones": state["milestones"],
             "learning_paths": state["learning_paths"],
             "projects": state["projects"],
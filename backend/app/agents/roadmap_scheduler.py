@@ -4,18 +4,40 @@ from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_core.tools import tool
 from langchain_groq import ChatGroq
-from typing import TypedDict, Annotated, List, Dict, Any
+from typing import TypedDict, Annotated, List, Dict, Any, Final
 import operator
 import logging
 import os
 
 from app.services.llm_service import llm_service
+from app.services.groq_client import get_groq_client
 from app.services.calendar_service import calendar_service
 from app.config.settings import settings
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Scheduling rules and output schema are the same for every task; sent as the
+# system prompt so each request shares a byte-identical prefix the provider can cache
+_SCHEDULE_SYSTEM_PROMPT: Final[str] = """You plan daily learning sessions.
+
+Consider:
+- 2 hours max per day
+- Best learning time: mornings (9-11 AM)
+- Evening review: 8-9 PM
+
+Return JSON:
+{
+  "date": "YYYY-MM-DD",
+  "task_id": "task id",
+  "primary_task": "task_name",
+  "skill_name": "skill",
+  "duration": "2h",
+  "resources": ["link1", "link2"],
+  "morning_session": "9-11 AM",
+  "evening_review": "8-9 PM"
+}"""
+
 # ==================== STATE DEFINITION ====================
 
 class RoadmapState(TypedDict):
@@ -82,30 +104,14 @@ async def generate_daily_schedule(tasks: List[Dict], date: str) -> Dict:
     
     prompt = f"""
 Generate optimal daily schedule for date {date} with this task:
+Task ID: {available_task.get('id')}
 Task: {available_task.get('skill_name')}
 Estimated: {available_task.get('estimated_hours', 2)} hours
 Resources: {available_task.get('resources', [])}
-
-Consider:
-- 2 hours max per day
-- Best learning time: mornings (9-11 AM)
-- Evening review: 8-9 PM
-
-Return JSON:
-{{
-  "date": "{date}",
-  "task_id": "{available_task.get('id')}",
-  "primary_task": "task_name",
-  "skill_name": "skill",
-  "duration": "2h",
-  "resources": ["link1", "link2"],
-  "morning_session": "9-11 AM",
-  "evening_review": "8-9 PM"
-}}
 """
     
     try:
-        result = await llm_service.generate_json(prompt)
+        result = await llm_service.generate_json(prompt, system_prompt=_SCHEDULE_SYSTEM_PROMPT)
         result['task_id'] = available_task.get('id')
         result['date'] = date
         return result
@@ -154,7 +160,11 @@ def get_llm():
         return None
     
     try:
-        return ChatGroq(model="llama-3.3-70b-versatile", api_key=api_key)
+        return ChatGroq(
+            model="llama-3.3-70b-versatile",
+            api_key=api_key,
+            async_client=get_groq_client(api_key).chat.completions
+        )
     except Exception as e:
         logger.error(f"Failed to initialize ChatGroq: {e}")
         return None
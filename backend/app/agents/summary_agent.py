@@ -7,16 +7,166 @@ from langchain_groq import ChatGroq
 from langgraph.graph import StateGraph, END
 from langchain_core.prompts import ChatPromptTemplate
 from app.config.settings import settings
+from app.services.groq_client import get_groq_client
 from app.services.vector_db import vector_db
 from app.services.graph_db import graph_db
 from sqlalchemy.orm import Session
 from app.models.database import User
+from app.utils.timestamps import now_iso
 import json
 import logging
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are parsed once at import rather than on every call
+_TASK_PROMPT = ChatPromptTemplate.from_template("""
+Analyze task completion for this week:
+
+Week: {week_start} to {week_end}
+Available data: {data_summary}
+
+Infer and estimate:
+1. Tasks that were likely completed (based on journal entries, activities)
+2. Tasks that were planned but not done
+3. Reasons for missed tasks
+4. Overall completion rate
+
+Return as JSON:
+{{
+  "completed_tasks": [
+    {{"task": "...", "category": "...", "impact": "high|medium|low"}}
+  ],
+  "planned_tasks": [...],
+  "missed_tasks": [
+    {{"task": "...", "reason": "...", "can_reschedule": true}}
+  ],
+  "completion_rate": 75
+}}
+""")
+
+_PROGRESS_PROMPT = ChatPromptTemplate.from_template("""
+Analyze skill development progress this week:
+
+Current Skills: {current_skills}
+Journal Entries: {journal_count}
+Practice Sessions: {practice_count}
+
+Estimate progress made on each skill:
+- Time invested
+- Confidence improvement
+- Practical application
+
+Return as JSON:
+{{
+  "skills_progress": {{
+    "skill_name": {{
+      "progress_percentage": 75,
+      "time_invested_hours": 5,
+      "achievements": ["completed course", "built project"],
+      "confidence_level": "intermediate"
+    }}
+  }},
+  "new_skills_started": [],
+  "skills_to_review": []
+}}
+""")
+
+_JOURNAL_PROMPT = ChatPromptTemplate.from_template("""
+Summarize this week's journal reflections:
+
+Entries: {entries}
+
+Provide:
+1. Emotional journey (overall arc)
+2. Key themes
+3. Recurring concerns
+4. Progress indicators
+5. Mindset shifts
+
+Keep it personal and meaningful (2-3 paragraphs).
+""")
+
+_NEWS_PROMPT = ChatPromptTemplate.from_template("""
+Generate a summary of relevant industry news for:
+
+User's Target Role: Software Engineer
+Week: {week_start} to {week_end}
+
+Provide:
+1. Key industry trends
+2. Important company news
+3. Technology developments
+4. Career market insights
+
+Keep it concise and actionable (3-4 bullet points).
+""")
+
+_INSIGHTS_PROMPT = ChatPromptTemplate.from_template("""
+Generate insights from this week's data:
+
+Completed Tasks: {completed_count}
+Completion Rate: {completion_rate}%
+Skills Progress: {skills_summary}
+Journal Entries: {journal_count}
+Interviews: {interview_count}
+Job Applications: {jobs_count}
+
+Provide 3-5 actionable insights:
+- What's working well
+- What needs attention
+- Patterns observed
+- Opportunities spotted
+- Warnings or concerns
+
+Return as JSON array of insight strings.
+""")
+
+_RECOMMENDATION_PROMPT = ChatPromptTemplate.from_template("""
+Based on this week's performance, recommend actions for next week:
+
+Completed: {completed}
+Missed: {missed}
+Insights: {insights}
+
+Provide 5-7 specific recommendations:
+- High-priority tasks
+- Skill practice areas
+- Application targets
+- Learning goals
+- Self-care reminders
+
+Return as JSON array:
+[
+  {{
+    "action": "...",
+    "priority": "high|medium|low",
+    "estimated_time": "2 hours",
+    "reasoning": "..."
+  }}
+]
+""")
+
+_WINS_PROMPT = ChatPromptTemplate.from_template("""
+Identify wins and achievements from this week:
+
+Completed Tasks: {completed_tasks}
+Skills Progress: {skills_progress}
+Activities: {activities_summary}
+
+Find:
+- Concrete achievements
+- Progress milestones
+- Personal bests
+- Breakthroughs
+- Consistency wins
+
+Phrase as celebratory statements (3-5 items).
+
+Return as JSON array of celebration strings.
+""")
+
+
 class SummaryState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
     user_id: str
@@ -52,6 +202,7 @@ class SummaryAgent:
     def __init__(self):
         self.llm = ChatGroq(
             api_key=settings.GROQ_API_KEY,
+            async_client=get_groq_client(settings.GROQ_API_KEY).chat.completions,
             model_name="llama3-70b-8192",
             temperature=0.7
         )
@@ -134,32 +285,7 @@ class SummaryAgent:
         # In production, this would query actual task database
         # For now, we'll use LLM to analyze from contexts
         
-        task_prompt = ChatPromptTemplate.from_template("""
-Analyze task completion for this week:
-
-Week: {week_start} to {week_end}
-Available data: {data_summary}
-
-Infer and estimate:
-1. Tasks that were likely completed (based on journal entries, activities)
-2. Tasks that were planned but not done
-3. Reasons for missed tasks
-4. Overall completion rate
-
-Return as JSON:
-{{
-  "completed_tasks": [
-    {{"task": "...", "category": "...", "impact": "high|medium|low"}}
-  ],
-  "planned_tasks": [...],
-  "missed_tasks": [
-    {{"task": "...", "reason": "...", "can_reschedule": true}}
-  ],
-  "completion_rate": 75
-}}
-""")
-        
-        chain = task_prompt | self.llm
+        chain = _TASK_PROMPT | self.llm
         response = await chain.ainvoke({
             "week_start": state["week_start"],
             "week_end": state["week_end"],
@@ -188,34 +314,7 @@ Return as JSON:
         # Get learning paths from knowledge graph
         user_skills = graph_db.get_user_skills(state["user_id"])
         
-        progress_prompt = ChatPromptTemplate.from_template("""
-Analyze skill development progress this week:
-
-Current Skills: {current_skills}
-Journal Entries: {journal_count}
-Practice Sessions: {practice_count}
-
-Estimate progress made on each skill:
-- Time invested
-- Confidence improvement
-- Practical application
-
-Return as JSON:
-{{
-  "skills_progress": {{
-    "skill_name": {{
-      "progress_percentage": 75,
-      "time_invested_hours": 5,
-      "achievements": ["completed course", "built project"],
-      "confidence_level": "intermediate"
-    }}
-  }},
-  "new_skills_started": [],
-  "skills_to_review": []
-}}
-""")
-        
-        chain = progress_prompt | self.llm
+        chain = _PROGRESS_PROMPT | self.llm
         response = await chain.ainvoke({
             "current_skills": json.dumps([s["skill"] for s in user_skills]),
             "journal_count": len(state["journal_entries"]),
@@ -237,22 +336,7 @@ Return as JSON:
         if not state["journal_entries"]:
             return state
         
-        journal_prompt = ChatPromptTemplate.from_template("""
-Summarize this week's journal reflections:
-
-Entries: {entries}
-
-Provide:
-1. Emotional journey (overall arc)
-2. Key themes
-3. Recurring concerns
-4. Progress indicators
-5. Mindset shifts
-
-Keep it personal and meaningful (2-3 paragraphs).
-""")
-        
-        chain = journal_prompt | self.llm
+        chain = _JOURNAL_PROMPT | self.llm
         response = await chain.ainvoke({
             "entries": json.dumps([e["text"][:200] for e in state["journal_entries"]])
         })
@@ -279,22 +363,7 @@ Keep it personal and meaningful (2-3 paragraphs).
         # In production, this would use news APIs
         # For now, use LLM to generate relevant news summary
         
-        news_prompt = ChatPromptTemplate.from_template("""
-Generate a summary of relevant industry news for:
-
-User's Target Role: Software Engineer
-Week: {week_start} to {week_end}
-
-Provide:
-1. Key industry trends
-2. Important company news
-3. Technology developments
-4. Career market insights
-
-Keep it concise and actionable (3-4 bullet points).
-""")
-        
-        chain = news_prompt | self.llm
+        chain = _NEWS_PROMPT | self.llm
         response = await chain.ainvoke({
             "week_start": state["week_start"],
             "week_end": state["week_end"]
@@ -307,27 +376,7 @@ Keep it concise and actionable (3-4 bullet points).
     async def generate_weekly_insights(self, state: SummaryState) -> SummaryState:
         """Generate insights from all collected data"""
         
-        insights_prompt = ChatPromptTemplate.from_template("""
-Generate insights from this week's data:
-
-Completed Tasks: {completed_count}
-Completion Rate: {completion_rate}%
-Skills Progress: {skills_summary}
-Journal Entries: {journal_count}
-Interviews: {interview_count}
-Job Applications: {jobs_count}
-
-Provide 3-5 actionable insights:
-- What's working well
-- What needs attention
-- Patterns observed
-- Opportunities spotted
-- Warnings or concerns
-
-Return as JSON array of insight strings.
-""")
-        
-        chain = insights_prompt | self.llm
+        chain = _INSIGHTS_PROMPT | self.llm
         response = await chain.ainvoke({
             "completed_count": len(state["completed_tasks"]),
             "completion_rate": state["weekly_metrics"].get("completion_rate", 0),
@@ -349,32 +398,7 @@ Return as JSON array of insight strings.
     async def create_next_week_plan(self, state: SummaryState) -> SummaryState:
         """Create recommendations for next week"""
         
-        recommendation_prompt = ChatPromptTemplate.from_template("""
-Based on this week's performance, recommend actions for next week:
-
-Completed: {completed}
-Missed: {missed}
-Insights: {insights}
-
-Provide 5-7 specific recommendations:
-- High-priority tasks
-- Skill practice areas
-- Application targets
-- Learning goals
-- Self-care reminders
-
-Return as JSON array:
-[
-  {{
-    "action": "...",
-    "priority": "high|medium|low",
-    "estimated_time": "2 hours",
-    "reasoning": "..."
-  }}
-]
-""")
-        
-        chain = recommendation_prompt | self.llm
+        chain = _RECOMMENDATION_PROMPT | self.llm
         response = await chain.ainvoke({
             "completed": len(state["completed_tasks"]),
             "missed": len(state["missed_tasks"]),
@@ -393,26 +417,7 @@ Return as JSON array:
     async def identify_wins(self, state: SummaryState) -> SummaryState:
         """Identify moments worth celebrating"""
         
-        wins_prompt = ChatPromptTemplate.from_template("""
-Identify wins and achievements from this week:
-
-Completed Tasks: {completed_tasks}
-Skills Progress: {skills_progress}
-Activities: {activities_summary}
-
-Find:
-- Concrete achievements
-- Progress milestones
-- Personal bests
-- Breakthroughs
-- Consistency wins
-
-Phrase as celebratory statements (3-5 items).
-
-Return as JSON array of celebration strings.
-""")
-        
-        chain = wins_prompt | self.llm
+        chain = _WINS_PROMPT | self.llm
         response = await chain.ainvoke({
             "completed_tasks": json.dumps(state["completed_tasks"]),
             "skills_progress": json.dumps(state["skills_progress"]),
@@ -520,7 +525,7 @@ Celebrations: {', '.join(state['celebration_moments'])}
                 "news": result["news_summary"],
                 "recommendations": result["recommendations"],
                 "celebrations": result["celebration_moments"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         except Exception as e:
             logger.error(f"Summary generation error: {e}")
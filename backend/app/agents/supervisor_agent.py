@@ -7,12 +7,67 @@ from langchain_groq import ChatGroq
 from langgraph.graph import StateGraph, END
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from app.config.settings import settings
+from app.services.groq_client import get_groq_client
+from app.utils.timestamps import now_iso
 from sqlalchemy.orm import Session
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are parsed once at import rather than on every call
+_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a career development supervisor AI. Analyze the user's current state:
+            
+User Context: {context}
+
+Determine:
+1. What information is missing or outdated
+2. Which tasks are overdue
+3. What actions would benefit the user most right now
+4. Any urgent items that need attention
+
+Respond with a clear analysis."""),
+    MessagesPlaceholder(variable_name="messages"),
+])
+
+_DECISION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are the supervisor deciding what to do next.
+
+Available agents:
+- roadmap_agent: Updates career roadmaps and goals
+- opportunities_agent: Finds jobs and internships
+- resume_agent: Optimizes resumes
+- journal_agent: Provides emotional support and reflection
+- interview_agent: Conducts mock interviews
+- summary_agent: Generates progress reports
+- profile_agent: Manages user profile
+
+Based on the analysis, decide:
+1. Which agent should run (if any)?
+2. What should be the priority?
+3. Are there any conflicts to resolve?
+
+Respond in format:
+ACTION: [execute|monitor|resolve|end]
+AGENT: [agent_name or none]
+PRIORITY: [high|medium|low]
+REASON: [brief explanation]"""),
+    MessagesPlaceholder(variable_name="messages"),
+])
+
+_RESOLUTION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are resolving conflicts in the system.
+
+Conflicts detected: {conflicts}
+
+Provide:
+1. Root cause analysis
+2. Resolution steps
+3. Prevention measures"""),
+    MessagesPlaceholder(variable_name="messages"),
+])
+
+
 # Define the state for the supervisor
 class SupervisorState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
@@ -32,6 +87,7 @@ class SupervisorAgent:
     def __init__(self):
         self.llm = ChatGroq(
             api_key=settings.GROQ_API_KEY,
+            async_client=get_groq_client(settings.GROQ_API_KEY).chat.completions,
             model_name="llama3-70b-8192",
             temperature=0.7
         )
@@ -85,22 +141,7 @@ class SupervisorAgent:
         """Analyze current user state and needs"""
         logger.info(f"Analyzing state for user: {state['user_id']}")
         
-        analysis_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a career development supervisor AI. Analyze the user's current state:
-            
-User Context: {context}
-
-Determine:
-1. What information is missing or outdated
-2. Which tasks are overdue
-3. What actions would benefit the user most right now
-4. Any urgent items that need attention
-
-Respond with a clear analysis."""),
-            MessagesPlaceholder(variable_name="messages"),
-        ])
-        
-        chain = analysis_prompt | self.llm
+        chain = _ANALYSIS_PROMPT | self.llm
         
         response = await chain.ainvoke({
             "context": state["user_context"],
@@ -113,32 +154,7 @@ Respond with a clear analysis."""),
     async def decide_next_action(self, state: SupervisorState) -> SupervisorState:
         """Decide which agent to activate or what action to take"""
         
-        decision_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are the supervisor deciding what to do next.
-
-Available agents:
-- roadmap_agent: Updates career roadmaps and goals
-- opportunities_agent: Finds jobs and internships
-- resume_agent: Optimizes resumes
-- journal_agent: Provides emotional support and reflection
-- interview_agent: Conducts mock interviews
-- summary_agent: Generates progress reports
-- profile_agent: Manages user profile
-
-Based on the analysis, decide:
-1. Which agent should run (if any)?
-2. What should be the priority?
-3. Are there any conflicts to resolve?
-
-Respond in format:
-ACTION: [execute|monitor|resolve|end]
-AGENT: [agent_name or none]
-PRIORITY: [high|medium|low]
-REASON: [brief explanation]"""),
-            MessagesPlaceholder(variable_name="messages"),
-        ])
-        
-        chain = decision_prompt | self.llm
+        chain = _DECISION_PROMPT | self.llm
         response = await chain.ainvoke({"messages": state["messages"]})
         
         # Parse the response
@@ -182,7 +198,7 @@ REASON: [brief explanation]"""),
         # For now, we'll log and track
         state["agent_results"][agent_name] = {
             "status": "executed",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         }
         
         state["messages"].append(
@@ -195,7 +211,7 @@ REASON: [brief explanation]"""),
         """Monitor system health and agent performance"""
         
         health_check = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "agents_active": len(state.get("agent_results", {})),
             "errors": len(state.get("errors", [])),
             "status": "healthy" if len(state.get("errors", [])) == 0 else "issues_detected"
@@ -215,19 +231,7 @@ REASON: [brief explanation]"""),
         conflicts = state.get("errors", [])
         
         if conflicts:
-            resolution_prompt = ChatPromptTemplate.from_messages([
-                ("system", """You are resolving conflicts in the system.
-
-Conflicts detected: {conflicts}
-
-Provide:
-1. Root cause analysis
-2. Resolution steps
-3. Prevention measures"""),
-                MessagesPlaceholder(variable_name="messages"),
-            ])
-            
-            chain = resolution_prompt | self.llm
+            chain = _RESOLUTION_PROMPT | self.llm
             response = await chain.ainvoke({
                 "conflicts": conflicts,
                 "messages": state["messages"]
@@ -259,7 +263,7 @@ Provide:
                 "user_id": user_id,
                 "agents_executed": list(result.get("agent_results", {}).keys()),
                 "messages": [msg.content for msg in result.get("messages", [])],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         except Exception as e:
             logger.error(f"Supervisor cycle error: {e}")
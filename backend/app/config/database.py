@@ -2,15 +2,26 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.config.settings import settings
 
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
+# Pool settings shared by the primary and replica engines
+_ENGINE_OPTIONS = dict(
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     echo=settings.ENVIRONMENT == "development"
 )
 
-# Create session factory
+# Create database engine
+engine = create_engine(settings.DATABASE_URL, **_ENGINE_OPTIONS)
+
+# Read replica engine (falls back to the primary when no replica is configured)
+read_engine = create_engine(
+    settings.REPLICA_DATABASE_URL, **_ENGINE_OPTIONS
+) if settings.REPLICA_DATABASE_URL else engine
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # Dependency for database sessions
 def get_db():
@@ -18,4 +29,13 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Dependency for read-only sessions (routed to the replica when configured)
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -25,6 +25,10 @@ class Settings(BaseSettings):
     # Database (PostgreSQL)
     # =========================
     DATABASE_URL: str
+    REPLICA_DATABASE_URL: Optional[str] = None  # Read replica for GET-heavy endpoints
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds; recycle before server/proxy idle timeouts drop connections
 
     # =========================
     # Auth / JWT
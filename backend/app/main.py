@@ -6,6 +6,7 @@ from fastapi.staticfiles import StaticFiles
 from app.config.settings import settings
 from app.config.database import engine
 from app.models.database import Base
+from app.schemas._fast import PydORJSONResponse
 import logging
 import numpy as np
 
@@ -38,7 +39,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="CareerAI API",
     description="AI-powered career guidance platform with Knowledge Graphs & Roadmap Scheduler",
-    version="2.1.0"
+    version="2.1.0",
+    default_response_class=PydORJSONResponse
 )
 
 # Configure CORS
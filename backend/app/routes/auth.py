@@ -2,14 +2,16 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from fastapi.responses import RedirectResponse
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from app.config.database import get_db
+from app.config.database import get_db, SessionLocal
 from app.models.database import (
     User, Education, Skill, Project, Experience, Availability, 
     CareerGoal, CareerIntent, PreferredLocation, SkillCategory, SkillLevel
 )
+from app.schemas._fast import PydORJSONResponse, json_body, json_body_openapi
 from app.schemas.user import (
-    UserRegister, UserLogin, Token, UserResponse, UserRegisterResponse,
+    UserRegister, UserLogin, Token, UserResponse, UserRegisterResponse, UserSummaryResponse, REGISTER_ADAPTER,
     EducationResponse, SkillResponse, ProjectResponse, ExperienceResponse, AvailabilityResponse
 )
 from app.utils.auth import (
@@ -24,6 +26,7 @@ from app.services.graph_db import get_graph_db
 from app.services.user_graph_sync import get_user_graph_sync
 from app.services.google_oauth import google_oauth  # ✅ Import here
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import asyncio
 import uuid
 import logging
 
@@ -36,7 +39,6 @@ security = HTTPBearer()
 def sync_user_to_graph_background(user_id: str):
     """Background task to sync user to knowledge graph"""
     try:
-        from app.config.database import SessionLocal
         db = SessionLocal()
         sync_service = get_user_graph_sync()
         results = sync_service.sync_complete_user(user_id, db)
@@ -46,10 +48,14 @@ def sync_user_to_graph_background(user_id: str):
         logger.error(f"✗ Background graph sync failed for user {user_id}: {e}")
 
 
-@router.post("/register", response_model=UserRegisterResponse)
+@router.post(
+    "/register",
+    response_model=UserRegisterResponse,
+    openapi_extra=json_body_openapi(REGISTER_ADAPTER)
+)
 async def register(
-    user_data: UserRegister, 
     background_tasks: BackgroundTasks,
+    user_data: UserRegister = Depends(json_body(REGISTER_ADAPTER)),
     db: Session = Depends(get_db)
 ):
     """Register a new user - ENHANCED with background graph sync"""
@@ -96,7 +102,7 @@ async def register(
         db.add(db_edu)
     
     # Add Skills to SQL and Graph (immediate sync for skills)
-    for skill_name in user_data.skills.get("technical", []):
+    for skill_name in user_data.skills.technical:
         db_skill = Skill(
             user_id=user_id,
             skill=skill_name,
@@ -112,7 +118,7 @@ async def register(
         except Exception as e:
             logger.warning(f"Failed to add skill to graph: {e}")
     
-    for skill_name in user_data.skills.get("soft", []):
+    for skill_name in user_data.skills.soft:
         db_skill = Skill(
             user_id=user_id,
             skill=skill_name,
@@ -234,11 +240,11 @@ async def register(
     # Get user profile
     user_profile = await get_user_profile(user_id, db)
     
-    return UserRegisterResponse(
+    return PydORJSONResponse(UserRegisterResponse(
         user=user_profile,
         access_token=access_token,
         token_type="bearer"
-    )
+    ))
 
 
 @router.post("/login", response_model=Token)
@@ -276,7 +282,50 @@ async def get_current_user_endpoint(
         )
     
     user_id = payload.get("sub")
-    return await get_user_profile(user_id, db)
+    return PydORJSONResponse(await get_user_profile(user_id, db))
+
+
+@router.get("/me/summary", response_model=UserSummaryResponse)
+async def get_current_user_summary(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+):
+    """Get current user profile card (no nested lists)"""
+    payload = decode_access_token(credentials.credentials)
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token"
+        )
+    
+    user_id = payload.get("sub")
+    user = db.query(User).filter(User.id == user_id).first()
+    
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    skills_count = db.query(func.count(Skill.id)).filter(Skill.user_id == user_id).scalar()
+    has_education = db.query(
+        db.query(Education.id).filter(Education.user_id == user_id).exists()
+    ).scalar()
+    career_goals = db.query(CareerGoal.target_roles).filter(CareerGoal.user_id == user_id).first()
+    
+    email_username = user.email.split('@')[0] if user.email and '@' in user.email else "user"
+    
+    return PydORJSONResponse(UserSummaryResponse.model_construct(
+        id=user.id,
+        email=user.email,
+        username=user.username or email_username,
+        full_name=user.full_name or email_username.title(),
+        target_role=career_goals.target_roles[0] if career_goals and career_goals.target_roles else "Software Engineer",
+        readiness_level=user.readiness_level.value if user.readiness_level else "beginner",
+        is_demo=user.is_demo if user.is_demo is not None else False,
+        skills_count=skills_count or 0,
+        has_education=bool(has_education)
+    ))
 
 
 async def get_user_profile(user_id: str, db: Session) -> UserResponse:
@@ -304,7 +353,8 @@ async def get_user_profile(user_id: str, db: Session) -> UserResponse:
     # Build response
     email_username = user.email.split('@')[0] if user.email and '@' in user.email else "user"
     
-    return UserResponse(
+    # Rows come straight from the DB, so skip re-validation on the way out
+    return UserResponse.model_construct(
         id=user.id,
         email=user.email,
         username=user.username or email_username,
@@ -319,58 +369,24 @@ async def get_user_profile(user_id: str, db: Session) -> UserResponse:
         readiness_level=user.readiness_level.value if user.readiness_level else "beginner",
         is_demo=user.is_demo if user.is_demo is not None else False,
         created_at=user.created_at,
-        education=[
-            EducationResponse(
-                id=e.id,
-                institution=e.institution,
-                degree=e.degree,
-                major=e.major,
-                location=e.location,
-                duration=e.duration,
-                start_date=e.start_date,
-                end_date=e.end_date,
-                grade=e.grade,
-                is_confirmed=e.is_confirmed
-            ) for e in education
-        ] if education else [],
-        skills=[
-            SkillResponse(
-                id=s.id,
-                skill=s.skill,
-                category=s.category.value if s.category else "technical",
-                level=s.level.value if s.level else "intermediate",
-                verified=s.verified,
-                is_confirmed=s.is_confirmed
-            ) for s in skills
-        ] if skills else [],
-        projects=[
-            ProjectResponse(
-                id=p.id,
-                title=p.title,
-                description=p.description or "",
-                tech_stack=p.tech_stack or "",
-                link=p.link,
-                is_confirmed=p.is_confirmed
-            ) for p in projects
-        ] if projects else [],
-        experience=[
-            ExperienceResponse(
-                id=e.id,
-                role=e.role,
-                company=e.company,
-                location=e.location,
-                duration=e.duration,
-                description=e.description or "",
-                start_date=e.start_date,
-                end_date=e.end_date,
-                is_confirmed=e.is_confirmed
-            ) for e in experience
-        ] if experience else [],
-        availability=AvailabilityResponse(
+        education=[EducationResponse.from_orm_fast(e) for e in education],
+        skills=[SkillResponse.from_orm_fast(s) for s in skills],
+        projects=[ProjectResponse.from_orm_fast(p) for p in projects],
+        experience=[ExperienceResponse.from_orm_fast(e) for e in experience],
+        availability=AvailabilityResponse.model_construct(
             id=availability.id,
             free_time=availability.free_time or "",
             study_days=availability.study_days or []
-        ) if availability else None
+        ) if availability else None,
+        unconfirmed_ids={
+            name: [row.id for row in rows if not row.is_confirmed]
+            for name, rows in (
+                ("education", education),
+                ("skills", skills),
+                ("projects", projects),
+                ("experience", experience),
+            )
+        }
     )
 
 
@@ -427,8 +443,8 @@ async def google_callback(
         user_id = state  # Extract user_id from state
         logger.info(f"🔄 Processing Google callback for user {user_id}")
         
-        # Exchange code for token
-        tokens = google_oauth.exchange_code_for_token(code, user_id, db)
+        # Exchange code for token (a blocking HTTP round trip to Google)
+        tokens = await asyncio.to_thread(google_oauth.exchange_code_for_token, code, user_id, db)
         
         logger.info(f"✅ Google connected successfully for user {user_id}")
         
@@ -92,7 +92,7 @@ async def generate_emails(
     db: Session = Depends(get_db)
 ):
     """Generate AI emails for all recipients"""
-    count = cold_email_service.generate_emails_for_campaign(campaign_id, db)
+    count = await cold_email_service.generate_emails_for_campaign(campaign_id, db)
     return {"generated_count": count}
 
 @router.post("/campaigns/{campaign_id}/request-approval")
@@ -102,7 +102,7 @@ async def request_approval(
     db: Session = Depends(get_db)
 ):
     """Send approval notification to user"""
-    success = cold_email_service.request_approval(campaign_id, db)
+    success = await cold_email_service.request_approval(campaign_id, db)
     
     if success:
         return {"message": "Approval notification sent to your Gmail"}
@@ -130,5 +130,5 @@ async def send_approved_emails(
     db: Session = Depends(get_db)
 ):
     """Send all approved emails"""
-    sent_count = cold_email_service.send_approved_emails(campaign_id, db)
+    sent_count = await cold_email_service.send_approved_emails(campaign_id, db)
     return {"sent_count": sent_count}
@@ -1,9 +1,12 @@
 # backend/app/routes/interview.py
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Response
 from sqlalchemy.orm import Session
 from app.config.database import get_db
 from app.schemas.interview_schemas import *
+from app.schemas._fast import (
+    MsgspecJSONResponse, PydORJSONResponse, json_body, json_body_openapi, msgspec_response_openapi
+)
 from app.services.interview_service import interview_service
 from app.utils.auth import get_current_user
 from app.models.database import (
@@ -22,9 +25,13 @@ router = APIRouter(prefix="/api/interview", tags=["Interview"])
 
 # ==================== INTERVIEW LIFECYCLE ====================
 
-@router.post("/create", response_model=InterviewResponse)
+@router.post(
+    "/create",
+    response_model=InterviewResponse,
+    openapi_extra=json_body_openapi(INTERVIEW_CREATE_ADAPTER)
+)
 async def create_interview(
-    data: InterviewCreate,
+    data: InterviewCreate = Depends(json_body(INTERVIEW_CREATE_ADAPTER)),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -44,11 +51,11 @@ async def create_interview(
     }
     """
     try:
-        return await interview_service.create_interview(
+        return PydORJSONResponse(await interview_service.create_interview(
             user_id=current_user.id,
             data=data,
             db=db
-        )
+        ))
     except Exception as e:
         logger.error(f"Create interview error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -233,7 +240,10 @@ async def get_rounds(
         InterviewRound.interview_id == interview_id
     ).order_by(InterviewRound.round_number).all()
     
-    return [RoundResponse.from_orm(r) for r in rounds]
+    return Response(
+        ROUND_LIST_ADAPTER.dump_json([RoundResponse.from_orm_fast(r) for r in rounds]),
+        media_type="application/json"
+    )
 
 
 @router.post("/{interview_id}/round/{round_id}/start", response_model=QuestionResponse)
@@ -267,9 +277,13 @@ async def start_round(
 
 # ==================== QUESTION & ANSWER ====================
 
-@router.post("/answer", response_model=AnswerFeedback)
+@router.post(
+    "/answer",
+    response_model=AnswerFeedback,
+    openapi_extra=json_body_openapi(ANSWER_SUBMIT_ADAPTER)
+)
 async def submit_answer_text(
-    data: AnswerSubmit,
+    data: AnswerSubmit = Depends(json_body(ANSWER_SUBMIT_ADAPTER)),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -396,17 +410,21 @@ async def get_evaluation(
     - recommendations: Specific action items
     """
     try:
-        return await interview_service.get_evaluation(
+        return PydORJSONResponse(await interview_service.get_evaluation(
             interview_id=interview_id,
             user_id=current_user.id,
             db=db
-        )
+        ))
     except Exception as e:
         logger.error(f"Get evaluation error: {e}")
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.get("/history", response_model=List[InterviewHistoryItem])
+@router.get(
+    "/history",
+    response_model=None,
+    responses=msgspec_response_openapi(List[InterviewHistoryItem])
+)
 async def get_history(
     limit: int = 10,
     current_user: User = Depends(get_current_user),
@@ -414,11 +432,12 @@ async def get_history(
 ):
     """Get user's interview history"""
     try:
-        return await interview_service.get_history(
+        history = await interview_service.get_history(
             user_id=current_user.id,
             db=db,
             limit=limit
         )
+        return MsgspecJSONResponse(history)
     except Exception as e:
         logger.error(f"Get history error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -440,10 +459,12 @@ async def get_analytics(
     - category_scores: {technical: 80, communication: 90}
     """
     try:
-        return await interview_service.get_analytics(
+        analytics = await interview_service.get_analytics(
             user_id=current_user.id,
             db=db
         )
+        # Plain dicts/floats/lists: orjson encodes these directly
+        return PydORJSONResponse(analytics.model_dump())
     except Exception as e:
         logger.error(f"Get analytics error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
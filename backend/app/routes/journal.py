@@ -11,7 +11,7 @@ from datetime import datetime, timedelta
 from app.config.database import get_db
 from app.config.settings import settings
 from app.services.journal_service import journal_analyzer
-from app.models.database import JournalEntry, User
+from app.models.database import JournalEntry, User, Interview, Skill, Project
 
 logger = logging.getLogger(__name__)
 
@@ -397,9 +397,6 @@ async def get_comprehensive_summary(
     try:
         user_id = current_user["user_id"]
         
-        from app.models.database import Interview, Skill, Project
-        from sqlalchemy import func
-        
         # Get last 7 days of data
         week_ago = datetime.utcnow() - timedelta(days=7)
         month_ago = datetime.utcnow() - timedelta(days=30)
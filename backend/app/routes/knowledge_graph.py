@@ -5,10 +5,13 @@ Knowledge Graph API Routes
 Provides access to all graph queries and hybrid computations
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Union
 from app.config.database import get_db
+from app.models.database import User
+from app.utils.auth import get_current_user
 from app.services.hybrid_graph_service import get_hybrid_graph_service
 from app.services.user_graph_sync import get_user_graph_sync
 from app.services.graph_db import get_graph_db
@@ -23,10 +26,18 @@ from app.schemas.graph_schemas import (
     GraphStatsResponse,
     SkillInfo,
     JobRoleInfo,
-    LearningPathItem
+    LearningPathItem,
+    GraphVisualizationResponse,
+    GraphVisualizationColumnar,
+    SKILL_LIST_ADAPTER,
+    JOB_ROLE_LIST_ADAPTER,
+    GRAPH_NODES_ADAPTER,
+    GRAPH_EDGES_ADAPTER
 )
 from app.utils.graph_queries import CypherQueries
+from app.schemas._fast import PydORJSONResponse
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +80,7 @@ async def get_all_skills(
             for record in result
         ]
     
-    return skills
+    return Response(SKILL_LIST_ADAPTER.dump_json(skills), media_type="application/json")
 
 
 @router.get("/roles", response_model=List[JobRoleInfo])
@@ -102,7 +113,7 @@ async def get_all_roles(
             for record in result
         ]
     
-    return roles
+    return Response(JOB_ROLE_LIST_ADAPTER.dump_json(roles), media_type="application/json")
 
 
 @router.get("/role/{role_name}/skills")
@@ -320,6 +331,80 @@ async def get_market_insights(skill: str):
         )
 
 
+@router.get(
+    "/visualization/{user_id}",
+    response_model=Union[GraphVisualizationColumnar, GraphVisualizationResponse]
+)
+async def get_graph_visualization(
+    user_id: str,
+    layout: str = Query("columnar", pattern="^(columnar|rows)$", description="columnar (one array per field) or rows (list of node/edge objects)"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the user's 2-hop graph neighbourhood for visualization.
+    The columnar layout avoids repeating field names for every node and edge.
+    """
+    # Node properties include the user's projects, goals and interview scores
+    if current_user.id != user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Unauthorized")
+    
+    hybrid_service = get_hybrid_graph_service()
+    
+    try:
+        graph = hybrid_service.get_user_graph(user_id)
+        
+        # Whole row lists are validated in one pydantic-core call each
+        nodes = GRAPH_NODES_ADAPTER.validate_python(graph["nodes"])
+        edges = GRAPH_EDGES_ADAPTER.validate_python(graph["edges"])
+        metadata = {"node_count": len(nodes), "edge_count": len(edges)}
+        
+        if layout == "rows":
+            return PydORJSONResponse(
+                GraphVisualizationResponse(nodes=nodes, edges=edges, metadata=metadata)
+            )
+        return PydORJSONResponse(
+            GraphVisualizationColumnar.from_graph(nodes, edges, metadata)
+        )
+    except Exception as e:
+        logger.error(f"Error building graph visualization: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to build graph visualization: {str(e)}"
+        )
+
+
+@router.get("/visualization/{user_id}/stream")
+async def stream_graph_visualization(
+    user_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream the user's graph neighbourhood as NDJSON.
+    One {"kind": "node" | "edge", ...} object per line, then a closing {"kind": "meta", ...} line.
+    """
+    if current_user.id != user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Unauthorized")
+    
+    hybrid_service = get_hybrid_graph_service()
+    
+    def ndjson_lines():
+        counts = {"node": 0, "edge": 0}
+        try:
+            for kind, row in hybrid_service.iter_user_graph(user_id):
+                counts[kind] += 1
+                yield orjson.dumps({"kind": kind, **row}) + b"\n"
+        except Exception as e:
+            # Headers are already sent; report the failure in-band
+            logger.error(f"Error streaming graph visualization: {e}")
+            yield orjson.dumps({"kind": "error", "detail": "Failed to stream graph visualization"}) + b"\n"
+            return
+        yield orjson.dumps(
+            {"kind": "meta", "node_count": counts["node"], "edge_count": counts["edge"]}
+        ) + b"\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 # ========================
 # USER SYNC ENDPOINTS
 # ========================
@@ -13,7 +13,7 @@ from app.config.settings import settings
 from app.models.database import (
     User, Education, Skill, Project, Experience, 
     CareerGoal, CareerIntent, Link, Availability,
-    PreferredLocation, UserResume
+    PreferredLocation, UserResume, SkillCategory, SkillLevel
 )
 from app.services.llm_service import llm_service
 from app.services.resume_parser_service import resume_parser_service
@@ -376,8 +376,6 @@ async def add_skill(
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
-    from app.models.database import SkillCategory, SkillLevel
-    
     user_id = current_user["user_id"]
     
     skill = Skill(
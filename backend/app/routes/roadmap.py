@@ -1,18 +1,22 @@
 # backend/app/routes/roadmap.py - COMPLETE WITH SCHEDULER
 
 from fastapi import APIRouter, Depends, HTTPException, Header, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select, bindparam
+from sqlalchemy.orm import Session, joinedload
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
+import copy
 import jwt
 import logging
+import time
+from cachetools import TTLCache
 from datetime import datetime, timedelta
 
-from app.config.database import get_db
+from app.config.database import get_db, get_read_db
 from app.config.settings import settings
 from app.models.database import (
-    User, Roadmap, RoadmapTask, RoadmapPhase, TaskStatus,
-    Skill, CareerGoal
+    User, Roadmap, RoadmapTask, RoadmapPhase, TaskStatus
 )
 from app.services.llm_service import llm_service
 from app.services.kroki_service import kroki_service
@@ -23,18 +27,51 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/roadmap", tags=["Roadmap"])
 
+# Learning-path priority -> roadmap phase; anything unrecognised lands in ADVANCED
+_PRIORITY_PHASE = {
+    "high": RoadmapPhase.FOUNDATION,
+    "medium": RoadmapPhase.INTERMEDIATE,
+    "low": RoadmapPhase.ADVANCED
+}
+
+# ==================== QUERIES ====================
+
+# Hot lookups built once so SQLAlchemy's compiled-statement cache is hit on every call
+_TASK_BY_ID_AND_USER = select(RoadmapTask).where(
+    RoadmapTask.id == bindparam("tid"),
+    RoadmapTask.user_id == bindparam("uid")
+)
+
+_ACTIVE_ROADMAP_BY_USER = select(Roadmap).where(
+    Roadmap.user_id == bindparam("uid"),
+    Roadmap.is_active == True
+)
+
 # ==================== AUTH ====================
 
+# Key material prepared once instead of per decode
+_JWT_KEY = settings.SECRET_KEY.encode()
+_JWT_ALGS = [settings.ALGORITHM]
+
+# Verified tokens -> (user_id, exp). JWTs are stateless, so a per-worker
+# cache is safe; an entry is never served past the token's own expiry.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
 async def get_current_user(authorization: str = Header(None)) -> dict:
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(401, "Missing authentication token")
     
     token = authorization.replace("Bearer ", "")
+    cached = _token_cache.get(token)
+    if cached is not None and cached[1] > time.time():
+        return {"user_id": cached[0]}
+    
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGS)
         user_id = payload.get("sub")
         if not user_id:
             raise HTTPException(401, "Invalid token")
+        _token_cache[token] = (user_id, payload.get("exp", float("inf")))
         return {"user_id": user_id}
     except jwt.ExpiredSignatureError:
         raise HTTPException(401, "Token expired")
@@ -56,6 +93,49 @@ class UpdateTaskRequest(BaseModel):
 class ScheduleCalendarRequest(BaseModel):
     google_calendar_token: Optional[str] = None
 
+class TaskResponse(BaseModel):
+    id: str
+    skill_name: str
+    title: str
+    description: Optional[str] = None
+    status: str
+    progress_percent: Optional[float] = None
+    estimated_hours: Optional[int] = None
+    start_date: Optional[datetime] = None
+    due_date: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    resources: List[Any] = []
+    google_calendar_event_id: Optional[str] = None
+    calendar_synced: Optional[bool] = None
+
+class RoadmapDiagram(BaseModel):
+    svg_url: Optional[str] = None
+    png_url: Optional[str] = None
+
+class RoadmapSummary(BaseModel):
+    id: str
+    target_role: str
+    timeline_weeks: Optional[int] = None
+    current_phase: str
+    overall_progress: float
+    created_at: Optional[datetime] = None
+    diagram: RoadmapDiagram
+
+class RoadmapStatistics(BaseModel):
+    total_tasks: int
+    completed: int
+    in_progress: int
+    not_started: int
+
+class RoadmapResponse(BaseModel):
+    success: bool
+    has_roadmap: bool
+    message: Optional[str] = None
+    roadmap: Optional[RoadmapSummary] = None
+    statistics: Optional[RoadmapStatistics] = None
+    tasks_by_phase: Optional[Dict[str, List[TaskResponse]]] = None
+    roadmap_data: Optional[Dict[str, Any]] = None
+
 # ==================== ENDPOINTS ====================
 
 @router.post("/generate")
@@ -69,17 +149,19 @@ async def generate_roadmap(
     try:
         user_id = current_user["user_id"]
         
-        # Step 1: Get user data
-        user = db.query(User).filter(User.id == user_id).first()
+        # Step 1: Get user data with skills and career goal in one round-trip
+        user = db.query(User).options(
+            joinedload(User.skills),
+            joinedload(User.career_goals)
+        ).filter(User.id == user_id).first()
         if not user:
             raise HTTPException(404, "User not found")
         
         # Get current skills
-        skills = db.query(Skill).filter(Skill.user_id == user_id).all()
-        current_skills = [s.skill for s in skills]
+        current_skills = [s.skill for s in user.skills]
         
         # Get career goal - SAFELY
-        career_goal = db.query(CareerGoal).filter(CareerGoal.user_id == user_id).first()
+        career_goal = user.career_goals
         
         # Extract experience safely
         experience_text = "Beginner - Starting career journey"
@@ -169,12 +251,7 @@ async def generate_roadmap(
             resources = skill_item.get("resources", [])
             estimated_hours = skill_item.get("estimated_hours", 20)
             
-            if priority == "high":
-                phase = RoadmapPhase.FOUNDATION
-            elif priority == "medium":
-                phase = RoadmapPhase.INTERMEDIATE
-            else:
-                phase = RoadmapPhase.ADVANCED
+            phase = _PRIORITY_PHASE.get(priority, RoadmapPhase.ADVANCED)
             
             task_start = start_date + timedelta(weeks=idx)
             task_due = task_start + timedelta(weeks=2)
@@ -229,19 +306,22 @@ async def generate_roadmap(
         raise HTTPException(500, f"Failed to generate roadmap: {str(e)}")
 
 
-@router.get("/current")
+@router.get(
+    "/current",
+    response_model=RoadmapResponse,
+    response_model_exclude_unset=True,
+    response_class=ORJSONResponse
+)
 async def get_current_roadmap(
     current_user: dict = Depends(get_current_user),
+    read_db: Session = Depends(get_read_db),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """📋 Get user's active roadmap with progress"""
     try:
         user_id = current_user["user_id"]
         
-        roadmap = db.query(Roadmap).filter(
-            Roadmap.user_id == user_id,
-            Roadmap.is_active == True
-        ).first()
+        roadmap = read_db.execute(_ACTIVE_ROADMAP_BY_USER, {"uid": user_id}).scalars().first()
         
         if not roadmap:
             return {
@@ -250,7 +330,7 @@ async def get_current_roadmap(
                 "message": "No active roadmap found"
             }
         
-        tasks = db.query(RoadmapTask).filter(
+        tasks = read_db.query(RoadmapTask).filter(
             RoadmapTask.roadmap_id == roadmap.id
         ).order_by(RoadmapTask.sequence_order).all()
         
@@ -260,8 +340,12 @@ async def get_current_roadmap(
         
         overall_progress = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
-        roadmap.overall_progress_percent = overall_progress
-        db.commit()
+        # Only touch the primary when the cached progress actually changed
+        if roadmap.overall_progress_percent != overall_progress:
+            db.query(Roadmap).filter(Roadmap.id == roadmap.id).update(
+                {"overall_progress_percent": overall_progress}
+            )
+            db.commit()
         
         tasks_by_phase = {}
         for task in tasks:
@@ -277,9 +361,9 @@ async def get_current_roadmap(
                 "status": task.status.value,
                 "progress_percent": task.progress_percent,
                 "estimated_hours": task.estimated_hours,
-                "start_date": task.start_date.isoformat() if task.start_date else None,
-                "due_date": task.due_date.isoformat() if task.due_date else None,
-                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+                "start_date": task.start_date,
+                "due_date": task.due_date,
+                "completed_at": task.completed_at,
                 "resources": task.resources or [],
                 "google_calendar_event_id": task.google_calendar_event_id,
                 "calendar_synced": task.calendar_synced
@@ -294,7 +378,7 @@ async def get_current_roadmap(
                 "timeline_weeks": roadmap.target_timeline_weeks,
                 "current_phase": roadmap.current_phase.value,
                 "overall_progress": round(overall_progress, 1),
-                "created_at": roadmap.created_at.isoformat(),
+                "created_at": roadmap.created_at,
                 "diagram": {
                     "svg_url": roadmap.diagram_svg_url,
                     "png_url": roadmap.diagram_png_url
@@ -315,8 +399,6 @@ async def get_current_roadmap(
         raise HTTPException(500, str(e))
 
 
-# In schedule-next-7-days endpoint - UPDATE THIS SECTION:
-
 @router.post("/schedule-next-7-days")
 async def schedule_next_7_days(
     background_tasks: BackgroundTasks,
@@ -336,10 +418,7 @@ async def schedule_next_7_days(
             )
         
         # Get roadmap and tasks...
-        roadmap = db.query(Roadmap).filter(
-            Roadmap.user_id == user_id,
-            Roadmap.is_active == True
-        ).first()
+        roadmap = db.execute(_ACTIVE_ROADMAP_BY_USER, {"uid": user_id}).scalars().first()
         
         if not roadmap:
             raise HTTPException(404, "No active roadmap found")
@@ -395,7 +474,8 @@ async def schedule_next_7_days(
             
             db.commit()
         
-        return {
+        # Agent output is free-form dicts; hand it straight to orjson
+        return ORJSONResponse({
             "success": True,
             "scheduled_days": len(schedule),
             "tasks_scheduled": len(event_ids) if schedule else 0,
@@ -403,104 +483,7 @@ async def schedule_next_7_days(
             "notifications": result.get("notifications", []),
             "message": f"✅ Successfully scheduled {len(schedule)} days in your Google Calendar!",
             "schedule": schedule
-        }
-        
-    except HTTPException:
-        raise
-    except ValueError as e:
-        raise HTTPException(400, str(e))
-    except Exception as e:
-        logger.error(f"❌ Scheduler failed: {e}", exc_info=True)
-        raise HTTPException(500, f"Failed to schedule: {str(e)}")
-# In schedule-next-7-days endpoint - UPDATE THIS SECTION:
-
-@router.post("/schedule-next-7-days")
-async def schedule_next_7_days(
-    background_tasks: BackgroundTasks,
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> Dict[str, Any]:
-    """📅 Schedule next 7 days in Google Calendar"""
-    try:
-        user_id = current_user["user_id"]
-        
-        # Check Google connection
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.google_access_token:
-            raise HTTPException(
-                400,
-                "Google Calendar not connected. Please connect your Google account first."
-            )
-        
-        # Get roadmap and tasks...
-        roadmap = db.query(Roadmap).filter(
-            Roadmap.user_id == user_id,
-            Roadmap.is_active == True
-        ).first()
-        
-        if not roadmap:
-            raise HTTPException(404, "No active roadmap found")
-        
-        # Get tasks
-        tasks = db.query(RoadmapTask).filter(
-            RoadmapTask.roadmap_id == roadmap.id,
-            RoadmapTask.status != TaskStatus.COMPLETED
-        ).order_by(RoadmapTask.sequence_order).limit(10).all()
-        
-        if not tasks:
-            raise HTTPException(400, "No tasks available to schedule")
-        
-        user_profile = {
-            "user_id": user_id,
-            "current_skills": [],
-            "target_role": roadmap.target_role,
-            "timeline_weeks": roadmap.target_timeline_weeks,
-            "current_tasks": [
-                {
-                    "id": str(t.id),
-                    "skill_name": t.skill_name,
-                    "task_title": t.task_title,
-                    "task_description": t.task_description,
-                    "estimated_hours": t.estimated_hours,
-                    "status": t.status.value,
-                    "resources": t.resources or []
-                }
-                for t in tasks
-            ]
-        }
-        
-        # Run scheduler
-        logger.info(f"🤖 Running scheduler for user {user_id}")
-        result = await run_roadmap_scheduler(user_id, user_profile)
-        
-        # Create Google Calendar events
-        schedule = result.get("schedule_7_days", [])
-        if schedule:
-            from app.services.calendar_service import calendar_service
-            event_ids = await calendar_service.create_events_for_user(
-                user_id, schedule, db
-            )
-            
-            # Update tasks with event IDs
-            for i, event_id in enumerate(event_ids):
-                if i < len(schedule) and schedule[i].get('task_id'):
-                    task_id = schedule[i]['task_id']
-                    task = db.query(RoadmapTask).filter(RoadmapTask.id == task_id).first()
-                    if task:
-                        task.google_calendar_event_id = event_id
-                        task.calendar_synced = True
-            
-            db.commit()
-        
-        return {
-            "success": True,
-            "scheduled_days": len(schedule),
-            "tasks_scheduled": len(event_ids) if schedule else 0,
-            "calendar_events_created": len(event_ids) if schedule else 0,
-            "notifications": result.get("notifications", []),
-            "message": f"✅ Successfully scheduled {len(schedule)} days in your Google Calendar!",
-            "schedule": schedule
-        }
+        })
         
     except HTTPException:
         raise
@@ -519,13 +502,14 @@ async def check_daily_progress(
     """✅ Check today's task completion and assign next task"""
     try:
         user_id = current_user["user_id"]
-        today = datetime.utcnow().date()
+        now = datetime.utcnow()
+        today = now.date()
         
         # Get today's task
         today_task = db.query(RoadmapTask).filter(
             RoadmapTask.user_id == user_id,
-            RoadmapTask.start_date <= datetime.utcnow(),
-            RoadmapTask.due_date >= datetime.utcnow()
+            RoadmapTask.start_date <= now,
+            RoadmapTask.due_date >= now
         ).first()
         
         if not today_task:
@@ -546,7 +530,7 @@ async def check_daily_progress(
             
             if next_task:
                 next_task.status = TaskStatus.IN_PROGRESS
-                next_task.start_date = datetime.utcnow()
+                next_task.start_date = now
                 db.commit()
                 
                 return {
@@ -581,24 +565,27 @@ async def check_daily_progress(
 @router.post("/check-streak")
 async def check_3_day_streak(
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> Dict[str, Any]:
     """⚠️ Check 3-day missed streak and trigger reschedule"""
     try:
         user_id = current_user["user_id"]
         
         # Get tasks from last 3 days
-        three_days_ago = datetime.utcnow() - timedelta(days=3)
+        now = datetime.utcnow()
+        three_days_ago = now - timedelta(days=3)
         
-        recent_tasks = db.query(RoadmapTask).filter(
-            RoadmapTask.user_id == user_id,
-            RoadmapTask.start_date >= three_days_ago,
-            RoadmapTask.start_date <= datetime.utcnow()
-        ).all()
+        status_counts = dict(
+            db.query(RoadmapTask.status, func.count()).filter(
+                RoadmapTask.user_id == user_id,
+                RoadmapTask.start_date.between(three_days_ago, now)
+            ).group_by(RoadmapTask.status).all()
+        )
         
-        completed_count = len([t for t in recent_tasks if t.status == TaskStatus.COMPLETED])
+        completed_count = status_counts.get(TaskStatus.COMPLETED, 0)
+        total_recent = sum(status_counts.values())
         
-        if completed_count == 0 and len(recent_tasks) >= 3:
+        if completed_count == 0 and total_recent >= 3:
             # Missed 3 days! Reschedule
             logger.warning(f"⚠️ User {user_id} missed 3 days. Rescheduling...")
             
@@ -640,10 +627,9 @@ async def update_task(
     try:
         user_id = current_user["user_id"]
         
-        task = db.query(RoadmapTask).filter(
-            RoadmapTask.id == task_id,
-            RoadmapTask.user_id == user_id
-        ).first()
+        task = db.execute(
+            _TASK_BY_ID_AND_USER, {"tid": task_id, "uid": user_id}
+        ).scalar_one_or_none()
         
         if not task:
             raise HTTPException(404, "Task not found")
@@ -698,36 +684,40 @@ async def delete_roadmap(
         raise HTTPException(500, str(e))
 
 
+# Built once at import; callers get a deep copy since they may mutate learning_path
+_FALLBACK_ROADMAP: Dict[str, Any] = {
+    "milestones": [
+        {
+            "month": 1,
+            "phase_name": "Foundation Phase",
+            "goals": ["Learn fundamentals", "Build first project"],
+            "tasks": ["Complete courses", "Practice daily"],
+            "skills": ["Basics"],
+            "duration_weeks": 4
+        }
+    ],
+    "learning_path": [
+        {
+            "skill": "JavaScript",
+            "priority": "high",
+            "category": "Programming",
+            "estimated_hours": 40,
+            "resources": ["https://javascript.info"],
+            "prerequisites": []
+        },
+        {
+            "skill": "React",
+            "priority": "high",
+            "category": "Frontend",
+            "estimated_hours": 50,
+            "resources": ["https://react.dev"],
+            "prerequisites": ["JavaScript"]
+        }
+    ],
+    "projects": []
+}
+
+
 def _get_fallback_roadmap() -> Dict[str, Any]:
     """Fallback roadmap when LLM fails"""
-    return {
-        "milestones": [
-            {
-                "month": 1,
-                "phase_name": "Foundation Phase",
-                "goals": ["Learn fundamentals", "Build first project"],
-                "tasks": ["Complete courses", "Practice daily"],
-                "skills": ["Basics"],
-                "duration_weeks": 4
-            }
-        ],
-        "learning_path": [
-            {
-                "skill": "JavaScript",
-                "priority": "high",
-                "category": "Programming",
-                "estimated_hours": 40,
-                "resources": ["https://javascript.info"],
-                "prerequisites": []
-            },
-            {
-                "skill": "React",
-                "priority": "high",
-                "category": "Frontend",
-                "estimated_hours": 50,
-                "resources": ["https://react.dev"],
-                "prerequisites": ["JavaScript"]
-            }
-        ],
-        "projects": []
-    }
+    return copy.deepcopy(_FALLBACK_ROADMAP)
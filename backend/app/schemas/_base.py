@@ -0,0 +1,55 @@
+# backend/app/schemas/_base.py
+
+"""
+Shared building blocks for response schemas.
+"""
+
+import enum
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict
+
+
+def _fast_value(annotation: Any, value: Any) -> Any:
+    """Convert an ORM attribute for model_construct, recursing into nested schemas"""
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.value
+    
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        return _fast_value(args[0], value) if len(args) == 1 else value
+    if origin in (list, tuple) and isinstance(value, (list, tuple)):
+        (item_type, *_) = get_args(annotation) or (Any,)
+        return [_fast_value(item_type, v) for v in value]
+    if isinstance(annotation, type) and issubclass(annotation, FromORMFast):
+        return annotation.from_orm_fast(value)
+    return value
+
+
+class FromORMFast:
+    """Mixin for response schemas populated from trusted SQLAlchemy rows"""
+    
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """
+        Build the schema from an ORM object without re-validating it.
+        
+        DB rows were validated on write, so this uses model_construct and only
+        unwraps enums / nested relations. Missing optional values fall back to
+        the field default.
+        """
+        values = {}
+        for name, field in cls.model_fields.items():
+            value = _fast_value(field.annotation, getattr(obj, name, None))
+            if value is None and not field.is_required():
+                continue
+            values[name] = value
+        return cls.model_construct(**values)
+
+
+class ORMModel(FromORMFast, BaseModel):
+    """Base for response schemas read from SQLAlchemy rows"""
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
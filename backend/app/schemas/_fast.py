@@ -0,0 +1,99 @@
+# backend/app/schemas/_fast.py
+
+"""
+Fast JSON response classes and OpenAPI helpers for hot read paths.
+
+Response-only msgspec Structs (defined with their domain schemas) skip validation
+entirely and encode in C. Request bodies that need coercion stay on Pydantic,
+parsed via json_body().
+"""
+
+import msgspec
+import orjson
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing import Any, Dict
+
+
+_encoder = msgspec.json.Encoder()
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class PydORJSONResponse(Response):
+    """
+    JSON response that keeps serialization out of Python.
+    
+    Pydantic models are dumped with pydantic-core's model_dump_json (aliases on,
+    as FastAPI does by default); anything else goes through orjson.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode()
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+class MsgspecJSONResponse(Response):
+    """JSON response rendered with msgspec instead of jsonable_encoder + json.dumps"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
+
+
+# ========== REQUEST BODIES ==========
+def json_body(adapter: TypeAdapter):
+    """
+    Dependency that parses and validates the raw request body in one pydantic-core
+    pass, instead of FastAPI decoding JSON to a dict and validating that again.
+    
+    Errors are raised as RequestValidationError with a "body" loc prefix, so the
+    422 response matches a regular body parameter.
+    """
+    async def dependency(request: Request):
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+            )
+    return dependency
+
+
+def _inline_refs(node: Any, defs: Dict[str, Any]) -> Any:
+    if isinstance(node, dict):
+        if "$ref" in node:
+            return _inline_refs(defs[node["$ref"].rsplit("/", 1)[-1]], defs)
+        return {k: _inline_refs(v, defs) for k, v in node.items() if k != "$defs"}
+    if isinstance(node, list):
+        return [_inline_refs(v, defs) for v in node]
+    return node
+
+
+def json_body_openapi(adapter: TypeAdapter) -> Dict[str, Any]:
+    """openapi_extra documenting a json_body() request body (refs inlined, no components needed)"""
+    schema = adapter.json_schema()
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_refs(schema, schema.get("$defs", {}))}}
+        }
+    }
+
+
+def msgspec_response_openapi(response_type: Any) -> Dict[int, Any]:
+    """
+    responses= entry documenting a MsgspecJSONResponse body, with the schema derived
+    from the msgspec type itself (refs inlined) so docs and wire shape can't drift.
+    """
+    schema = msgspec.json.schema(response_type)
+    return {
+        200: {
+            "description": "Successful Response",
+            "content": {"application/json": {"schema": _inline_refs(schema, schema.get("$defs", {}))}}
+        }
+    }
@@ -1,8 +1,10 @@
 # backend/app/schemas/graph_schemas.py
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+import time
 
 
 # ========================
@@ -37,18 +39,44 @@ class SyncUserRequest(BaseModel):
 # RESPONSE SCHEMAS
 # ========================
 
+# Read-only value objects built from graph records; never mutated after construction
+_FROZEN = ConfigDict(frozen=True)
+
+# Bulk-allocated DTOs: unknown keys are a bug, so reject them rather than collect them
+_FROZEN_DTO = ConfigDict(frozen=True, extra='forbid')
+
+
+@lru_cache(maxsize=1)
+def _utc_at_ms(tick_ms: int) -> datetime:
+    return datetime.utcfromtimestamp(tick_ms / 1000)
+
+
+def _coarse_utcnow() -> datetime:
+    """utcnow() at millisecond precision; responses in the same millisecond share one datetime"""
+    return _utc_at_ms(time.time_ns() // 1_000_000)
+
+
+class TimestampedResponse(BaseModel):
+    """Base for responses stamped with their generation time"""
+    timestamp: datetime = Field(default_factory=_coarse_utcnow)
+
+
 class SkillInfo(BaseModel):
     """Basic skill information"""
     name: str
     category: str
     description: Optional[str] = None
+    
+    model_config = _FROZEN
 
 
 class JobRoleInfo(BaseModel):
     """Basic job role information"""
     name: str
     industry: str
-    seniority_levels: List[str]
+    seniority_levels: Tuple[str, ...]
+    
+    model_config = _FROZEN
 
 
 class ResourceInfo(BaseModel):
@@ -56,9 +84,28 @@ class ResourceInfo(BaseModel):
     title: str
     type: str
     url: str
+    
+    model_config = _FROZEN
+
+
+class RoleRequirement(BaseModel):
+    """Job role that requires a skill"""
+    role: str
+    industry: str
+
+
+class SkillGapRecommendation(BaseModel):
+    """Prioritized missing skill from gap analysis"""
+    skill: str
+    category: str
+    priority: str
+    reason: str
+    is_learning: bool
+    prerequisites: List[str]
+    estimated_hours: int
 
 
-class SkillGapResponse(BaseModel):
+class SkillGapResponse(TimestampedResponse):
     """Response for skill gap analysis"""
     user_id: str
     target_role: str
@@ -66,11 +113,10 @@ class SkillGapResponse(BaseModel):
     missing_skills: List[str]
     learning_skills: List[str]
     match_percentage: float
-    recommendations: List[Dict[str, Any]]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    recommendations: List[SkillGapRecommendation]
 
 
-class ReadinessResponse(BaseModel):
+class ReadinessResponse(TimestampedResponse):
     """Response for readiness calculation"""
     user_id: str
     job_role: str
@@ -80,7 +126,6 @@ class ReadinessResponse(BaseModel):
     project_relevance: float
     ready: bool
     recommendations: List[str]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
 class LearningPathItem(BaseModel):
@@ -90,17 +135,18 @@ class LearningPathItem(BaseModel):
     priority: str
     prerequisites: List[str]
     prerequisites_met: bool
-    resources: List[Dict[str, str]]
+    resources: List[ResourceInfo]
     estimated_hours: int
     can_start_now: bool
+    
+    model_config = _FROZEN_DTO
 
 
-class LearningPlanResponse(BaseModel):
+class LearningPlanResponse(TimestampedResponse):
     """Response for learning plan"""
     user_id: str
     learning_path: List[LearningPathItem]
     total_estimated_hours: int
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
 class CareerPathOption(BaseModel):
@@ -113,13 +159,14 @@ class CareerPathOption(BaseModel):
     missing_skills_count: int
     missing_skills: List[str]
     feasibility: str
+    
+    model_config = _FROZEN_DTO
 
 
-class CareerPathResponse(BaseModel):
+class CareerPathResponse(TimestampedResponse):
     """Response for career path exploration"""
     user_id: str
     possible_paths: List[CareerPathOption]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
 class SkillRecommendation(BaseModel):
@@ -129,56 +176,62 @@ class SkillRecommendation(BaseModel):
     description: Optional[str]
     relevance_score: int
     prerequisites: List[str]
-    resources: List[Dict[str, str]]
+    resources: List[ResourceInfo]
     estimated_hours: int
+    
+    model_config = _FROZEN_DTO
 
 
-class SkillRecommendationsResponse(BaseModel):
+class SkillRecommendationsResponse(TimestampedResponse):
     """Response for skill recommendations"""
     user_id: str
     recommendations: List[SkillRecommendation]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
-class MarketInsightResponse(BaseModel):
+class MarketInsightResponse(TimestampedResponse):
     """Market insights for a skill"""
     skill: str
-    roles_requiring: List[Dict[str, str]]
+    roles_requiring: List[RoleRequirement]
     related_skills: List[str]
     prerequisites: List[str]
-    resources: List[Dict[str, str]]
+    resources: List[ResourceInfo]
     demand_level: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    
+    model_config = _FROZEN
 
 
-class SyncResponse(BaseModel):
+class SyncResponse(TimestampedResponse):
     """Response for sync operation"""
     user_id: str
     success: bool
     synced_entities: Dict[str, int]
     message: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
-class GraphStatsResponse(BaseModel):
+class GraphStatsResponse(TimestampedResponse):
     """Graph statistics"""
     total_nodes: Dict[str, int]
     total_relationships: Dict[str, int]
     user_nodes: int
     static_nodes: int
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
 # ========================
 # GRAPH VISUALIZATION
 # ========================
 
+# Neo4j property values: scalars or homogeneous lists of them
+PropertyValue = Union[str, int, float, bool, List[str], List[int], List[float], None]
+
+
 class GraphNode(BaseModel):
     """Node for graph visualization"""
     id: str
     label: str
     type: str
-    properties: Dict[str, Any] = {}
+    properties: Dict[str, PropertyValue] = {}
+    
+    model_config = _FROZEN_DTO
 
 
 class GraphEdge(BaseModel):
@@ -186,7 +239,9 @@ class GraphEdge(BaseModel):
     source: str
     target: str
     type: str
-    properties: Dict[str, Any] = {}
+    properties: Dict[str, PropertyValue] = {}
+    
+    model_config = _FROZEN_DTO
 
 
 class GraphVisualizationResponse(BaseModel):
@@ -194,3 +249,47 @@ class GraphVisualizationResponse(BaseModel):
     nodes: List[GraphNode]
     edges: List[GraphEdge]
     metadata: Dict[str, Any] = {}
+
+
+class GraphVisualizationColumnar(BaseModel):
+    """Complete graph for visualization, one array per field (column layout)"""
+    node_ids: List[str]
+    node_labels: List[str]
+    node_types: List[str]
+    node_props: List[Dict[str, PropertyValue]]
+    edge_src: List[str]
+    edge_dst: List[str]
+    edge_types: List[str]
+    edge_props: List[Dict[str, PropertyValue]]
+    metadata: Dict[str, Any] = {}
+    
+    @classmethod
+    def from_graph(
+        cls,
+        nodes: List[GraphNode],
+        edges: List[GraphEdge],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> "GraphVisualizationColumnar":
+        """Transpose node/edge rows into per-field columns once, on the server"""
+        return cls.model_construct(
+            node_ids=[n.id for n in nodes],
+            node_labels=[n.label for n in nodes],
+            node_types=[n.type for n in nodes],
+            node_props=[n.properties for n in nodes],
+            edge_src=[e.source for e in edges],
+            edge_dst=[e.target for e in edges],
+            edge_types=[e.type for e in edges],
+            edge_props=[e.properties for e in edges],
+            metadata=metadata or {}
+        )
+
+
+# ========================
+# LIST ADAPTERS
+# ========================
+
+# Built once at import so list responses serialize in a single pydantic-core call
+SKILL_LIST_ADAPTER = TypeAdapter(List[SkillInfo])
+JOB_ROLE_LIST_ADAPTER = TypeAdapter(List[JobRoleInfo])
+GRAPH_NODES_ADAPTER = TypeAdapter(List[GraphNode])
+GRAPH_EDGES_ADAPTER = TypeAdapter(List[GraphEdge])
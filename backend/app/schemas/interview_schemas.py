@@ -1,20 +1,34 @@
 # backend/app/schemas/interview_schemas.py
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Union
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import List, Optional, Dict, Union
+from typing_extensions import TypedDict
 from datetime import datetime
 
+from app.schemas._base import ORMModel
+
 # ========== INTERVIEW SETUP ==========
+class RoundConfig(BaseModel):
+    type: str  # "technical" | "hr" | "communication"
+    difficulty: str = "medium"
+    pass_threshold: float = 70.0
+
+
 class InterviewCreate(BaseModel):
     interview_type: str  # "company_specific" | "custom_topic"
     company_name: Optional[str] = None
     job_description: Optional[str] = None
     custom_topics: Optional[List[str]] = None
     total_rounds: int = 1
-    round_configs: List[Dict[str, Any]]  # [{"type": "technical", "difficulty": "medium"}]
+    round_configs: List[RoundConfig]  # [{"type": "technical", "difficulty": "medium"}]
+
+
+# Built once at import; request bodies are validated from raw bytes through these
+INTERVIEW_CREATE_ADAPTER = TypeAdapter(InterviewCreate)
 
 
-class InterviewResponse(BaseModel):
+class InterviewResponse(ORMModel):
     id: str
     user_id: str
     interview_type: str
@@ -23,13 +37,10 @@ class InterviewResponse(BaseModel):
     current_round: int
     status: str
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 # ========== ROUND MANAGEMENT ==========
-class RoundResponse(BaseModel):
+class RoundResponse(ORMModel):
     id: str
     round_number: int
     round_type: str
@@ -37,9 +48,10 @@ class RoundResponse(BaseModel):
     status: str
     score: Optional[float]
     pass_status: Optional[bool]
-    
-    class Config:
-        from_attributes = True
+
+
+# Built once at import so list responses serialize in a single pydantic-core call
+ROUND_LIST_ADAPTER = TypeAdapter(List[RoundResponse])
 
 
 # ========== CONVERSATION ==========
@@ -49,6 +61,8 @@ class QuestionResponse(BaseModel):
     category: str
     what_to_look_for: List[str]
     audio_url: Optional[str] = None
+    
+    model_config = ConfigDict(extra='forbid')
 
 
 class AnswerSubmit(BaseModel):
@@ -59,16 +73,21 @@ class AnswerSubmit(BaseModel):
     audio_url: Optional[str] = None
 
 
+ANSWER_SUBMIT_ADAPTER = TypeAdapter(AnswerSubmit)
+
+
 class AnswerFeedback(BaseModel):
     score: float
     feedback: str
     strengths: List[str]
     improvements: List[str]
     next_question: Optional[QuestionResponse] = None  # ✅ Made optional explicitly
+    
+    model_config = ConfigDict(extra='forbid')
 
 
 # ========== EVALUATION ==========
-class EvaluationResponse(BaseModel):
+class EvaluationResponse(ORMModel):
     technical_score: float
     communication_score: float
     problem_solving_score: float
@@ -77,23 +96,27 @@ class EvaluationResponse(BaseModel):
     strengths: List[str]
     weaknesses: List[str]
     recommendations: List[str]
-    
-    class Config:
-        from_attributes = True
 
 
 # ========== ANALYTICS ==========
-class InterviewHistoryItem(BaseModel):
+class ScorePoint(TypedDict):
+    date: str  # "2025-01-01"
+    score: float
+
+
+# Response-only: encoded by msgspec (MsgspecJSONResponse), never validated
+class InterviewHistoryItem(msgspec.Struct):
     id: str
     company_name: Optional[str]
     custom_topics: Optional[List[str]]
     overall_score: float
     pass_fail_status: str
     created_at: datetime
-    
+
+
 class InterviewAnalytics(BaseModel):
     total_interviews: int
     pass_rate: float
     average_score: float
-    score_trend: List[Dict[str, Any]]  # [{"date": "2025-01-01", "score": 85}]
+    score_trend: List[ScorePoint]  # [{"date": "2025-01-01", "score": 85}]
     category_scores: Dict[str, float]  # {"technical": 80, "communication": 90}
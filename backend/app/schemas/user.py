@@ -1,10 +1,27 @@
 # backend/app/schemas/user.py
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, AfterValidator, TypeAdapter
 from pydantic.alias_generators import to_camel
 from typing import List, Optional, Dict
+from typing_extensions import Annotated
 from datetime import datetime
 
+from app.schemas._base import ORMModel
+
+
+def _normalize_email_domain(value: str) -> str:
+    """Lowercase the domain part, matching what EmailStr used to store"""
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Lightweight syntactic check instead of EmailStr (no email-validator import / RFC parse per request)
+EmailAddress = Annotated[
+    str,
+    StringConstraints(max_length=254, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$"),
+    AfterValidator(_normalize_email_domain)
+]
+
 
 # Base schemas with camelCase aliases for API
 class EducationBase(BaseModel):
@@ -22,11 +39,8 @@ class EducationCreate(EducationBase):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class EducationResponse(EducationBase):
+class EducationResponse(ORMModel, EducationBase):
     id: int
-    is_confirmed: bool
-    
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class SkillBase(BaseModel):
@@ -39,12 +53,9 @@ class SkillCreate(SkillBase):
     pass
 
 
-class SkillResponse(SkillBase):
+class SkillResponse(ORMModel, SkillBase):
     id: int
     verified: bool
-    is_confirmed: bool
-    
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class ProjectBase(BaseModel):
@@ -58,11 +69,10 @@ class ProjectCreate(ProjectBase):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class ProjectResponse(ProjectBase):
+class ProjectResponse(ORMModel, ProjectBase):
     id: int
-    is_confirmed: bool
     
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True, alias_generator=to_camel)
+    model_config = ConfigDict(alias_generator=to_camel)
 
 
 class ExperienceBase(BaseModel):
@@ -79,11 +89,8 @@ class ExperienceCreate(ExperienceBase):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class ExperienceResponse(ExperienceBase):
+class ExperienceResponse(ORMModel, ExperienceBase):
     id: int
-    is_confirmed: bool
-    
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class AvailabilityBase(BaseModel):
@@ -95,15 +102,20 @@ class AvailabilityCreate(AvailabilityBase):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class AvailabilityResponse(AvailabilityBase):
+class AvailabilityResponse(ORMModel, AvailabilityBase):
     id: int
+
+
+class SkillsPayload(BaseModel):
+    technical: List[str] = Field(default_factory=list)
+    soft: List[str] = Field(default_factory=list)
     
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    model_config = ConfigDict(extra='ignore')
 
 
 # User Registration
 class UserRegister(BaseModel):
-    email: EmailStr
+    email: EmailAddress
     username: str
     password: str
     full_name: str
@@ -114,7 +126,7 @@ class UserRegister(BaseModel):
     education: List[EducationCreate] = Field(default_factory=list)
     experience: List[ExperienceCreate] = Field(default_factory=list)
     projects: List[ProjectCreate] = Field(default_factory=list)
-    skills: Optional[Dict[str, List[str]]] = Field(default_factory=lambda: {"technical": [], "soft": []})
+    skills: SkillsPayload = Field(default_factory=SkillsPayload)
     availability: AvailabilityCreate
     target_role: Optional[str] = Field(default="Software Engineer", alias="targetRole")
     timeline: Optional[str] = Field(default="6 Months")
@@ -123,9 +135,13 @@ class UserRegister(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+# Built once at import; /register validates raw body bytes through it
+REGISTER_ADAPTER = TypeAdapter(UserRegister)
+
+
 # User Login
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: EmailAddress
     password: str
 
 
@@ -136,7 +152,7 @@ class Token(BaseModel):
 
 
 # User Response (returns camelCase to frontend)
-class UserResponse(BaseModel):
+class UserResponse(ORMModel):
     id: str
     email: str
     username: str
@@ -158,7 +174,23 @@ class UserResponse(BaseModel):
     experience: List[ExperienceResponse] = Field(default_factory=list)
     availability: Optional[AvailabilityResponse] = Field(default=None)
     
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    # Ids of rows not yet confirmed by the user, keyed by list name ("skills", ...)
+    unconfirmed_ids: Dict[str, List[int]] = Field(default_factory=dict, alias="unconfirmedIds")
+
+
+# Profile card: top-level fields only, no nested lists
+class UserSummaryResponse(BaseModel):
+    id: str
+    email: str
+    username: str
+    full_name: str = Field(alias="fullName")
+    target_role: str = Field(default="Software Engineer", alias="targetRole")
+    readiness_level: str = Field(default="beginner")
+    is_demo: bool = Field(default=False)
+    skills_count: int = 0
+    has_education: bool = False
+    
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # Registration Response (includes token)
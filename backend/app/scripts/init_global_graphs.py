@@ -15,10 +15,6 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from app.services.graph_builder import get_graph_builder
-from app.services.graph_db import get_graph_db
-from app.utils.graph_queries import CypherQueries
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,50 +23,55 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def initialize_schema():
+def _create_schema(tx, statements):
+    """Run every schema statement inside one transaction"""
+    for query in statements:
+        tx.run(query).consume()
+
+
+def initialize_schema(session, queries):
     """Create constraints and indexes"""
     logger.info("Initializing Neo4j schema...")
     
-    graph_db = get_graph_db()
-    queries = CypherQueries()
+    statements = queries.CREATE_CONSTRAINTS + queries.CREATE_INDEXES
     
-    with graph_db.driver.session() as session:
-        # Create constraints
-        for query in queries.CREATE_CONSTRAINTS:
-            try:
-                session.run(query)
-                logger.info(f"Executed: {query[:50]}...")
-            except Exception as e:
-                logger.warning(f"Constraint already exists or error: {e}")
-        
-        # Create indexes
-        for query in queries.CREATE_INDEXES:
+    try:
+        # One round-trip for the whole schema; all statements are IF NOT EXISTS
+        session.execute_write(_create_schema, statements)
+        logger.info(f"Executed {len(statements)} schema statements in one transaction")
+    except Exception as e:
+        logger.warning(f"Batched schema creation failed ({e}), retrying one by one")
+        for query in statements:
             try:
-                session.run(query)
+                session.run(query).consume()
                 logger.info(f"Executed: {query[:50]}...")
             except Exception as e:
-                logger.warning(f"Index already exists or error: {e}")
+                logger.warning(f"Constraint/index already exists or error: {e}")
     
     logger.info("Schema initialization completed")
 
 
-def build_static_graphs():
+def build_static_graphs(session):
     """Build all static knowledge graphs"""
+    from app.services.graph_builder import get_graph_builder
+    
     logger.info("Building static knowledge graphs...")
     
     builder = get_graph_builder()
-    results = builder.build_all_static_graphs()
+    results = builder.build_all_static_graphs(session)
     
     logger.info("Static graphs built successfully")
     return results
 
 
-def validate_graphs():
+def validate_graphs(session):
     """Validate the constructed graphs"""
+    from app.services.graph_builder import get_graph_builder
+    
     logger.info("Validating graphs...")
     
     builder = get_graph_builder()
-    validation = builder.validate_static_graphs()
+    validation = builder.validate_static_graphs(session)
     
     # Check for issues
     issues = []
@@ -101,17 +102,25 @@ def main():
     logger.info("=" * 80)
     
     try:
-        # Step 1: Initialize schema
-        logger.info("\n[1/3] Initializing schema...")
-        initialize_schema()
+        # Imported here so the Neo4j driver/schema modules load only when needed
+        from app.services.graph_db import get_graph_db
+        from app.utils.graph_queries import CypherQueries
         
-        # Step 2: Build static graphs
-        logger.info("\n[2/3] Building static graphs...")
-        results = build_static_graphs()
+        queries = CypherQueries()
         
-        # Step 3: Validate
-        logger.info("\n[3/3] Validating graphs...")
-        validation = validate_graphs()
+        # One session for all three phases
+        with get_graph_db().driver.session() as session:
+            # Step 1: Initialize schema
+            logger.info("\n[1/3] Initializing schema...")
+            initialize_schema(session, queries)
+            
+            # Step 2: Build static graphs
+            logger.info("\n[2/3] Building static graphs...")
+            results = build_static_graphs(session)
+            
+            # Step 3: Validate
+            logger.info("\n[3/3] Validating graphs...")
+            validation = validate_graphs(session)
         
         # Summary
         logger.info("\n" + "=" * 80)
@@ -6,20 +6,28 @@ Run this AFTER initializing static graphs with init_global_graphs.py
 
 Usage:
     python -m app.scripts.migrate_existing_users
+
+An interrupted run resumes where it stopped (see --checkpoint / --no-checkpoint).
 """
 
 import sys
 import logging
+import shelve
+import threading
+from enum import Enum
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.config.database import SessionLocal
 from app.models.database import User
+from app.services.graph_db import get_graph_db
 from app.services.user_graph_sync import get_user_graph_sync
-from tqdm import tqdm  # Optional: for progress bar
+from tqdm import tqdm
 import time
 
 # Configure logging
@@ -29,11 +37,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# (user_id, email, error message)
+MigrationError = Tuple[str, str, str]
+
+# Completed user ids are flushed to the checkpoint file after this many new entries
+CHECKPOINT_FLUSH_EVERY = 1000
+
+# Users queued per worker thread in migrate_all
+MAX_IN_FLIGHT_PER_WORKER = 4
+
+
+class MigrationOutcome(Enum):
+    """Result of migrating a single user"""
+    SUCCESS = "success"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
 
 class UserMigration:
     """Handles migration of existing users from SQL to Neo4j"""
     
-    def __init__(self):
+    def __init__(self, checkpoint_path: Optional[str] = None):
         self.db = SessionLocal()
         self.sync_service = get_user_graph_sync()
         self.stats = {
@@ -41,92 +65,242 @@ class UserMigration:
             "success": 0,
             "failed": 0,
             "skipped": 0,
-            "errors": []
+            "errors": []  # List[MigrationError]
         }
+        self._existing_ids: Set[str] = set()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._worker_sessions = []
+        # Ids migrated by an earlier, interrupted run; cleared once a run finishes cleanly
+        self._checkpoint = shelve.open(checkpoint_path) if checkpoint_path else None
+        self._unflushed = 0
     
-    def get_all_users(self) -> List[User]:
-        """Fetch all users from SQL database"""
+    def load_user_ids(self) -> List[str]:
+        """Fetch all user ids (not full rows) and note which already exist in Neo4j"""
         logger.info("Fetching all users from PostgreSQL...")
-        users = self.db.query(User).all()
-        logger.info(f"Found {len(users)} users to migrate")
-        return users
+        user_ids = [user_id for (user_id,) in self.db.query(User.id)]
+        logger.info(f"Found {len(user_ids)} users to migrate")
+        self._existing_ids = self.get_existing_graph_ids(user_ids)
+        return user_ids
+    
+    def get_all_users(self) -> Iterator[User]:
+        """Stream users from SQL in chunks via a server-side cursor instead of loading them all"""
+        return self.db.query(User).execution_options(stream_results=True).yield_per(1000)
     
-    def check_user_exists_in_graph(self, user_id: str) -> bool:
-        """Check if user already exists in Neo4j"""
-        from app.services.graph_db import get_graph_db
+    def get_existing_graph_ids(self, user_ids: List[str]) -> Set[str]:
+        """Return which of the given user ids already exist in Neo4j (one query)"""
         graph_db = get_graph_db()
         
-        if not graph_db.driver:
-            return False
+        if not graph_db.driver or not user_ids:
+            return set()
         
         with graph_db.driver.session() as session:
             result = session.run(
-                "MATCH (u:User {id: $user_id}) RETURN count(u) as count",
-                user_id=user_id
+                "MATCH (u:User) WHERE u.id IN $ids RETURN u.id as id",
+                ids=user_ids
             )
-            record = result.single()
-            return record["count"] > 0 if record else False
+            return {record["id"] for record in result}
     
-    def migrate_user(self, user: User, force: bool = False) -> bool:
-        """Migrate a single user to Neo4j"""
+    def _is_checkpointed(self, user_id: str) -> bool:
+        return self._checkpoint is not None and user_id in self._checkpoint
+    
+    def _checkpoint_done(self, user_ids: Iterable[str]):
+        """Record finished users (main thread only: shelve isn't thread-safe)"""
+        if self._checkpoint is None:
+            return
+        for user_id in user_ids:
+            self._checkpoint[user_id] = 1
+            self._unflushed += 1
+        if self._unflushed >= CHECKPOINT_FLUSH_EVERY:
+            self._checkpoint.sync()
+            self._unflushed = 0
+    
+    def _finish_checkpoint(self, failed: int):
+        """A clean run needs no resume point; keep it only if some users failed"""
+        if self._checkpoint is not None and failed == 0:
+            self._checkpoint.clear()
+    
+    def _worker_session(self):
+        """This worker thread's Neo4j session, opened on first use and held for the whole run"""
+        session = getattr(self._local, "session", None)
+        if session is None and self.sync_service.graph_db.driver:
+            session = self._local.session = self.sync_service.graph_db.driver.session()
+            with self._lock:
+                self._worker_sessions.append(session)
+        return session
+    
+    def _close_worker_sessions(self):
+        """Return the worker sessions to the driver pool"""
+        for session in self._worker_sessions:
+            session.close()
+        self._worker_sessions.clear()
+    
+    def migrate_user(self, user_id: str, email: str, force: bool = False) -> MigrationOutcome:
+        """Migrate a single user to Neo4j (thread-safe: uses its own SQL session)"""
         try:
             # Check if already exists
-            if not force and self.check_user_exists_in_graph(user.id):
-                logger.info(f"User {user.id} already exists in graph, skipping...")
-                self.stats["skipped"] += 1
-                return True
+            if not force and user_id in self._existing_ids:
+                logger.debug("User %s already exists in graph, skipping...", user_id)
+                return MigrationOutcome.SKIPPED
             
-            # Perform sync
-            logger.info(f"Migrating user: {user.id} ({user.email})...")
-            results = self.sync_service.sync_complete_user(user.id, self.db)
+            # Perform sync; SQLAlchemy sessions aren't thread-safe, so one per worker call
+            logger.debug("Migrating user: %s (%s)...", user_id, email)
+            db = SessionLocal()
+            try:
+                results = self.sync_service.sync_complete_user(user_id, db, self._worker_session())
+            finally:
+                db.close()
             
             # Log results
-            logger.info(f"  ✓ Synced: {results}")
-            self.stats["success"] += 1
-            return True
+            logger.debug("  ✓ Synced: %s", results)
+            return MigrationOutcome.SUCCESS
             
         except Exception as e:
-            logger.error(f"  ✗ Failed to migrate user {user.id}: {e}")
-            self.stats["failed"] += 1
-            self.stats["errors"].append({
-                "user_id": user.id,
-                "email": user.email,
-                "error": str(e)
-            })
-            return False
-    
-    def migrate_all(self, force: bool = False, batch_size: int = 10) -> Dict[str, Any]:
-        """Migrate all users in batches"""
+            logger.error("  ✗ Failed to migrate user %s: %s", user_id, e)
+            with self._lock:
+                self.stats["errors"].append((user_id, email, str(e)))
+            return MigrationOutcome.FAILED
+    
+    def migrate_all(self, force: bool = False, workers: int = 4) -> Dict[str, Any]:
+        """Migrate all users concurrently across a bounded worker pool"""
         logger.info("=" * 80)
         logger.info("STARTING USER MIGRATION TO NEO4J")
         logger.info("=" * 80)
         
-        start_time = time.time()
-        users = self.get_all_users()
-        self.stats["total"] = len(users)
+        start_time = time.monotonic()
+        self.stats["total"] = total = len(self.load_user_ids())
         
-        if self.stats["total"] == 0:
+        if total == 0:
             logger.warning("No users found to migrate!")
             return self.stats
         
         # Migrate users with progress tracking
         logger.info(f"\nMigrating {self.stats['total']} users...")
         logger.info(f"Force mode: {force}")
-        logger.info(f"Batch size: {batch_size}\n")
+        logger.info(f"Workers: {workers}\n")
         
-        for i, user in enumerate(users, 1):
-            logger.info(f"[{i}/{self.stats['total']}] Processing user: {user.email}")
-            self.migrate_user(user, force)
-            
-            # Small delay between users to avoid overwhelming Neo4j
-            if i % batch_size == 0:
-                logger.info(f"  Batch {i//batch_size} completed. Pausing briefly...")
-                time.sleep(1)
+        # Outcomes are tallied here on the main thread, so plain locals need no lock
+        counts = dict.fromkeys(MigrationOutcome, 0)
+        
+        # Work is I/O-bound (Postgres + Bolt). Sessions aren't thread-safe, so each
+        # worker checks one out of the driver pool and keeps it for the whole run.
+        # Submission is windowed: only a few users per worker are queued at a time, so
+        # checkpoints keep pace with completions and Ctrl-C leaves little to cancel.
+        max_in_flight = workers * MAX_IN_FLIGHT_PER_WORKER
+        pending: Dict[Future, str] = {}
+        executor = ThreadPoolExecutor(max_workers=workers)
+        progress = tqdm(total=total, unit="user")
+        
+        def drain(return_when: str):
+            done, _ = wait(pending, return_when=return_when)
+            for future in done:
+                user_id = pending.pop(future)
+                outcome = future.result()
+                counts[outcome] += 1
+                if outcome is not MigrationOutcome.FAILED:
+                    self._checkpoint_done((user_id,))
+                logger.debug("Processed user: %s", user_id)
+                progress.update()
+        
+        try:
+            for user in self.get_all_users():
+                if self._is_checkpointed(user.id):
+                    counts[MigrationOutcome.SKIPPED] += 1
+                    progress.update()
+                    continue
+                pending[executor.submit(self.migrate_user, user.id, user.email, force)] = user.id
+                if len(pending) >= max_in_flight:
+                    drain(FIRST_COMPLETED)
+            drain(ALL_COMPLETED)
+            executor.shutdown()
+        except KeyboardInterrupt:
+            # Drop queued users; only the few already running finish
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            progress.close()
+            self._close_worker_sessions()
+        
+        resumed = counts[MigrationOutcome.SKIPPED]
+        if resumed:
+            logger.info(f"Resumed: {resumed} users were already migrated by a previous run")
         
         # Calculate statistics
-        elapsed_time = time.time() - start_time
-        self.stats["elapsed_seconds"] = round(elapsed_time, 2)
-        self.stats["users_per_second"] = round(self.stats["success"] / elapsed_time, 2) if elapsed_time > 0 else 0
+        elapsed_time = time.monotonic() - start_time
+        success = counts[MigrationOutcome.SUCCESS]
+        self._finish_checkpoint(counts[MigrationOutcome.FAILED])
+        self.stats.update(
+            success=success,
+            skipped=counts[MigrationOutcome.SKIPPED],
+            failed=counts[MigrationOutcome.FAILED],
+            elapsed_seconds=round(elapsed_time, 2),
+            users_per_second=round(success / elapsed_time, 2) if elapsed_time > 0 else 0
+        )
+        
+        self._print_summary()
+        
+        return self.stats
+    
+    def migrate_all_bulk(self, force: bool = False, chunk_size: int = 1000) -> Dict[str, Any]:
+        """Migrate all users in chunks, one Neo4j transaction per chunk"""
+        logger.info("=" * 80)
+        logger.info("STARTING BULK USER MIGRATION TO NEO4J")
+        logger.info("=" * 80)
+        
+        start_time = time.monotonic()
+        self.stats["total"] = total = len(self.load_user_ids())
+        
+        if total == 0:
+            logger.warning("No users found to migrate!")
+            return self.stats
+        
+        logger.info(f"\nMigrating {total} users...")
+        logger.info(f"Force mode: {force}")
+        logger.info(f"Chunk size: {chunk_size}\n")
+        
+        success = failed = skipped = 0
+        
+        # self.db holds the streaming cursor; related rows are read on a second session
+        related_db = SessionLocal()
+        try:
+            users = iter(self.get_all_users())
+            processed = 0
+            with tqdm(total=total, unit="user") as progress:
+                while chunk := list(islice(users, chunk_size)):
+                    processed += len(chunk)
+                    progress.update(len(chunk))
+                    pending = [
+                        user for user in chunk
+                        if not self._is_checkpointed(user.id)
+                        and (force or user.id not in self._existing_ids)
+                    ]
+                    skipped += len(chunk) - len(pending)
+                    chunk = pending
+                    if not chunk:
+                        continue
+                    
+                    try:
+                        results = self.sync_service.sync_users_bulk(chunk, related_db)
+                        logger.debug("[%d/%d] ✓ Synced: %s", processed, total, results)
+                        success += len(chunk)
+                        self._checkpoint_done(user.id for user in chunk)
+                    except Exception as e:
+                        logger.error("[%d/%d] ✗ Chunk failed: %s", processed, total, e)
+                        failed += len(chunk)
+                        message = str(e)
+                        self.stats["errors"].extend((user.id, user.email, message) for user in chunk)
+        finally:
+            related_db.close()
+        
+        elapsed_time = time.monotonic() - start_time
+        self._finish_checkpoint(failed)
+        self.stats.update(
+            success=success,
+            skipped=skipped,
+            failed=failed,
+            elapsed_seconds=round(elapsed_time, 2),
+            users_per_second=round(success / elapsed_time, 2) if elapsed_time > 0 else 0
+        )
         
         self._print_summary()
         
@@ -147,8 +321,8 @@ class UserMigration:
         if self.stats["errors"]:
             logger.info("\n" + "-" * 80)
             logger.info("ERRORS:")
-            for error in self.stats["errors"]:
-                logger.error(f"  User {error['user_id']} ({error['email']}): {error['error']}")
+            for user_id, email, error in self.stats["errors"]:
+                logger.error("  User %s (%s): %s", user_id, email, error)
         
         logger.info("=" * 80)
         
@@ -161,8 +335,10 @@ class UserMigration:
         logger.info("=" * 80)
     
     def cleanup(self):
-        """Close database connection"""
+        """Close database connection and flush the checkpoint"""
         self.db.close()
+        if self._checkpoint is not None:
+            self._checkpoint.close()
 
 
 def main():
@@ -176,10 +352,33 @@ def main():
         help="Force re-sync even if user already exists in graph"
     )
     parser.add_argument(
-        "--batch-size",
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of users to migrate concurrently; each worker holds one Neo4j session "
+             "and briefly one SQL connection, so keep it within both pool sizes (default: 4)"
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Sync users in chunks of --chunk-size, one Neo4j transaction per chunk"
+    )
+    parser.add_argument(
+        "--chunk-size",
         type=int,
-        default=10,
-        help="Number of users to process before pausing (default: 10)"
+        default=1000,
+        help="Users per transaction in --bulk mode (default: 1000)"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default="migration_progress",
+        help="File recording migrated user ids so an interrupted run can resume "
+             "(default: migration_progress)"
+    )
+    parser.add_argument(
+        "--no-checkpoint",
+        action="store_true",
+        help="Don't read or write the resume checkpoint"
     )
     parser.add_argument(
         "--dry-run",
@@ -188,25 +387,32 @@ def main():
     )
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
     
+    migration = None
     try:
-        migration = UserMigration()
+        migration = UserMigration(
+            checkpoint_path=None if args.no_checkpoint or args.dry_run else args.checkpoint
+        )
         
         if args.dry_run:
             logger.info("DRY RUN MODE - No changes will be made")
-            users = migration.get_all_users()
-            logger.info(f"Would migrate {len(users)} users:")
-            for user in users[:10]:  # Show first 10
+            total = len(migration.load_user_ids())
+            logger.info(f"Would migrate {total} users:")
+            for user in islice(migration.get_all_users(), 10):  # Show first 10
                 logger.info(f"  - {user.email} (ID: {user.id})")
-            if len(users) > 10:
-                logger.info(f"  ... and {len(users) - 10} more")
+            if total > 10:
+                logger.info(f"  ... and {total - 10} more")
             return 0
         
         # Run migration
-        stats = migration.migrate_all(force=args.force, batch_size=args.batch_size)
-        
-        # Cleanup
-        migration.cleanup()
+        if args.bulk:
+            stats = migration.migrate_all_bulk(force=args.force, chunk_size=args.chunk_size)
+        else:
+            stats = migration.migrate_all(force=args.force, workers=args.workers)
         
         # Exit code based on success
         return 0 if stats["failed"] == 0 else 1
@@ -219,6 +425,10 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        # Also runs on Ctrl-C, so completed ids are on disk for the next run
+        if migration is not None:
+            migration.cleanup()
 
 
 if __name__ == "__main__":
@@ -4,13 +4,83 @@ from googleapiclient.errors import HttpError
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
+import asyncio
 import logging
-from app.services.google_oauth import google_oauth
+from app.services.google_oauth import google_oauth, execute_batched, list_all_items
 
 logger = logging.getLogger(__name__)
 
+# Fields identical on every roadmap event; merged into each body and shared, never mutated
+_STATIC_EVENT: Dict[str, Any] = {
+    'colorId': '9',  # Blue
+    'reminders': {
+        'useDefault': False,
+        'overrides': [
+            {'method': 'popup', 'minutes': 30},
+            {'method': 'email', 'minutes': 60},
+        ],
+    },
+}
+
+# Event description filled per day with format_map
+_DESCRIPTION_TEMPLATE = (
+    "📚 Learning Session\n"
+    "\n"
+    "🎯 Goal: {goal}\n"
+    "⏱️ Duration: 2 hours\n"
+    "📖 Focus: {focus}\n"
+    "\n"
+    "🔗 Resources:\n"
+    "{resources}\n"
+    "\n"
+    "💡 Tip: Use Pomodoro technique (25 min work, 5 min break)"
+)
+
 class GoogleCalendarService:
     
+    # The Google client blocks, and a cached service must only be driven by the thread
+    # that fetched it (httplib2 isn't thread-safe), so each operation fetches the service
+    # and uses it inside one worker-thread hop.
+    
+    def _insert_events(self, user_id: str, db: Session, events: List[Dict[str, Any]], callback) -> None:
+        service = google_oauth.get_calendar_service(user_id, db)
+        execute_batched(
+            service,
+            (
+                (str(index), service.events().insert(calendarId='primary', body=event))
+                for index, event in enumerate(events)
+            ),
+            callback
+        )
+    
+    def _delete_roadmap_events(self, user_id: str, db: Session, time_min: str, time_max: str, callback) -> None:
+        service = google_oauth.get_calendar_service(user_id, db)
+        
+        # A single list() stops at one page, so follow the page tokens to the end
+        # before deleting anything; deletes are then sent in batches
+        events_collection = service.events()
+        list_request = events_collection.list(
+            calendarId='primary',
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            orderBy='startTime',
+            maxResults=2500,
+            # Only events this app created (tagged in create_events_for_user)
+            privateExtendedProperty='app=career_assistant',
+            fields='items(id),nextPageToken'
+        )
+        events = list_all_items(events_collection, list_request)
+        
+        execute_batched(
+            service,
+            (
+                (event['id'], events_collection.delete(calendarId='primary', eventId=event['id']))
+                for event in events
+            ),
+            callback
+        )
+    
     async def create_events_for_user(
         self,
         user_id: str,
@@ -19,10 +89,8 @@ class GoogleCalendarService:
     ) -> List[str]:
         """Create calendar events using stored OAuth credentials"""
         try:
-            # Get service
-            service = google_oauth.get_calendar_service(user_id, db)
-            
-            event_ids = []
+            # Build every event body first (pure CPU), then send them batched
+            events = []
             
             for day_schedule in schedule:
                 if not day_schedule.get('primary_task'):
@@ -37,19 +105,13 @@ class GoogleCalendarService:
                 end_time = date.replace(hour=11, minute=0, second=0)
                 
                 event = {
+                    **_STATIC_EVENT,
                     'summary': f"🎯 Learn {day_schedule.get('skill_name', 'Unknown')}",
-                    'description': f"""
-📚 Learning Session
-
-🎯 Goal: {day_schedule.get('primary_task', 'Study session')}
-⏱️ Duration: 2 hours
-📖 Focus: {day_schedule.get('skill_name', 'Skill development')}
-
-🔗 Resources:
-{chr(10).join(day_schedule.get('resources', [])[:3])}
-
-💡 Tip: Use Pomodoro technique (25 min work, 5 min break)
-                    """,
+                    'description': _DESCRIPTION_TEMPLATE.format_map({
+                        'goal': day_schedule.get('primary_task', 'Study session'),
+                        'focus': day_schedule.get('skill_name', 'Skill development'),
+                        'resources': "\n".join(day_schedule.get('resources', ())[:3])
+                    }),
                     'start': {
                         'dateTime': start_time.isoformat(),
                         'timeZone': 'Asia/Kolkata',
@@ -58,14 +120,6 @@ class GoogleCalendarService:
                         'dateTime': end_time.isoformat(),
                         'timeZone': 'Asia/Kolkata',
                     },
-                    'colorId': '9',  # Blue
-                    'reminders': {
-                        'useDefault': False,
-                        'overrides': [
-                            {'method': 'popup', 'minutes': 30},
-                            {'method': 'email', 'minutes': 60},
-                        ],
-                    },
                     'extendedProperties': {
                         'private': {
                             'task_id': day_schedule.get('task_id', ''),
@@ -73,15 +127,24 @@ class GoogleCalendarService:
                         }
                     }
                 }
-                
-                result = service.events().insert(
-                    calendarId='primary',
-                    body=event
-                ).execute()
-                
-                event_id = result.get('id')
-                event_ids.append(event_id)
-                logger.info(f"✅ Created event: {event_id} for {date_str}")
+                events.append((date_str, event))
+            
+            # Batch callbacks may arrive in any order; keep ids in schedule order
+            created: Dict[int, str] = {}
+            
+            def on_insert(request_id, response, exception):
+                index = int(request_id)
+                if exception is not None:
+                    logger.error(f"❌ Calendar API error for {events[index][0]}: {exception}")
+                    return
+                created[index] = response.get('id')
+                logger.info(f"✅ Created event: {created[index]} for {events[index][0]}")
+            
+            await asyncio.to_thread(
+                self._insert_events, user_id, db, [event for _, event in events], on_insert
+            )
+            
+            event_ids = [created[index] for index in sorted(created)]
             
             logger.info(f"🎉 Created {len(event_ids)} calendar events for user {user_id}")
             return event_ids
@@ -99,31 +162,21 @@ class GoogleCalendarService:
     async def delete_all_roadmap_events(self, user_id: str, db: Session) -> bool:
         """Delete all roadmap events for user"""
         try:
-            service = google_oauth.get_calendar_service(user_id, db)
-            
             # Get events
             now = datetime.utcnow().isoformat() + 'Z'
             future = (datetime.utcnow() + timedelta(days=30)).isoformat() + 'Z'
-            
-            events_result = service.events().list(
-                calendarId='primary',
-                timeMin=now,
-                timeMax=future,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
             deleted_count = 0
             
-            for event in events:
-                props = event.get('extendedProperties', {}).get('private', {})
-                if props.get('app') == 'career_assistant':
-                    service.events().delete(
-                        calendarId='primary',
-                        eventId=event['id']
-                    ).execute()
-                    deleted_count += 1
+            def on_delete(request_id, response, exception):
+                nonlocal deleted_count
+                if exception is not None:
+                    logger.error(f"Failed to delete event {request_id}: {exception}")
+                    return
+                deleted_count += 1
+            
+            await asyncio.to_thread(
+                self._delete_roadmap_events, user_id, db, now, future, on_delete
+            )
             
             logger.info(f"🗑️ Deleted {deleted_count} events")
             return True
@@ -1,8 +1,11 @@
 # backend/app/services/cold_email_service.py
 
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
+import asyncio
 import uuid
 import logging
 from app.models.database import (
@@ -11,9 +14,16 @@ from app.models.database import (
 )
 from app.services.email_generator import email_generator
 from app.services.gmail_service import gmail_service
+from app.utils.ids import uuid4_strings
 
 logger = logging.getLogger(__name__)
 
+# Max LLM generations in flight per campaign
+GENERATION_CONCURRENCY = 10
+
+# Approved recipients loaded and sent per round when sending a campaign
+SEND_CHUNK_SIZE = 500
+
 class ColdEmailService:
     
     def create_campaign(
@@ -73,73 +83,117 @@ class ColdEmailService:
         if not campaign:
             raise ValueError("Campaign not found")
         
-        created_recipients = []
+        rows = [
+            {
+                "id": recipient_id,
+                "campaign_id": campaign_id,
+                "user_id": campaign.user_id,
+                "name": recipient_data["name"],
+                "email": recipient_data["email"],
+                "title": recipient_data.get("title"),
+                "company": recipient_data["company"],
+                "linkedin_url": recipient_data.get("linkedin_url"),
+                "company_info": recipient_data.get("company_info", {}),
+                "status": EmailStatus.DRAFT
+            }
+            for recipient_id, recipient_data in zip(uuid4_strings(len(recipients)), recipients)
+        ]
         
-        for recipient_data in recipients:
-            recipient_id = str(uuid.uuid4())
-            
-            recipient = ColdEmailRecipient(
-                id=recipient_id,
-                campaign_id=campaign_id,
-                user_id=campaign.user_id,
-                name=recipient_data["name"],
-                email=recipient_data["email"],
-                title=recipient_data.get("title"),
-                company=recipient_data["company"],
-                linkedin_url=recipient_data.get("linkedin_url"),
-                company_info=recipient_data.get("company_info", {}),
-                status=EmailStatus.DRAFT
-            )
-            
-            db.add(recipient)
-            created_recipients.append(recipient)
+        # One multi-row INSERT instead of a flush per ORM instance
+        if rows:
+            db.execute(insert(ColdEmailRecipient), rows)
         
-        campaign.total_recipients = len(created_recipients)
+        campaign.total_recipients = len(rows)
         db.commit()
         
+        # Callers return the recipients, so load them back in a single SELECT (in input order)
+        recipient_ids = [row["id"] for row in rows]
+        loaded = {
+            recipient.id: recipient
+            for recipient in db.query(ColdEmailRecipient).filter(
+                ColdEmailRecipient.id.in_(recipient_ids)
+            )
+        } if recipient_ids else {}
+        created_recipients = [loaded[recipient_id] for recipient_id in recipient_ids]
+        
         logger.info(f"✅ Added {len(created_recipients)} recipients to campaign {campaign_id}")
         return created_recipients
     
-    def generate_emails_for_campaign(
+    async def generate_emails_for_campaign(
         self,
         campaign_id: str,
         db: Session
     ) -> int:
-        """Generate AI emails for all draft recipients"""
+        """Generate AI emails for all draft recipients, several LLM calls in flight at once"""
         recipients = db.query(ColdEmailRecipient).filter(
             ColdEmailRecipient.campaign_id == campaign_id,
             ColdEmailRecipient.status == EmailStatus.DRAFT
         ).all()
         
-        generated_count = 0
+        if not recipients:
+            return 0
         
+        # All recipients share the campaign owner as sender: load the profile once
+        context = email_generator.load_user_context(recipients[0].user_id, db)
+        semaphore = asyncio.Semaphore(GENERATION_CONCURRENCY)
+        
+        # The prompt carries no recipient name, so a (company, title) group shares one
+        # LLM call: a template with name placeholders, filled in per recipient
+        groups: Dict[Tuple[str, str], List[ColdEmailRecipient]] = defaultdict(list)
         for recipient in recipients:
-            try:
-                email_content = email_generator.generate_cold_email(
-                    user_id=recipient.user_id,
-                    recipient_name=recipient.name,
-                    recipient_title=recipient.title or "Hiring Manager",
-                    company_name=recipient.company,
-                    company_info=recipient.company_info or {},
-                    db=db
+            groups[(recipient.company, (recipient.title or "").strip().lower())].append(recipient)
+        
+        async def generate(lead: ColdEmailRecipient) -> Dict[str, str]:
+            async with semaphore:
+                return await email_generator.generate_email_template(
+                    context=context,
+                    recipient_title=lead.title or "Hiring Manager",
+                    company_name=lead.company,
+                    company_info=lead.company_info or {}
                 )
-                
-                recipient.subject = email_content["subject"]
-                recipient.body = email_content["body"]
-                recipient.generated_at = datetime.utcnow()
-                recipient.status = EmailStatus.PENDING
-                
-                generated_count += 1
-                
+        
+        group_members = list(groups.values())
+        results = await asyncio.gather(
+            *(generate(members[0]) for members in group_members),
+            return_exceptions=True
+        )
+        
+        generated_count = 0
+        # One timestamp for the whole batch
+        generated_at = datetime.utcnow()
+        
+        for members, template in zip(group_members, results):
+            if isinstance(template, Exception):
+                logger.error(f"Failed to generate email for {members[0].company} ({len(members)} recipients): {template}")
+                continue
+            
+            # A bad group is skipped whole; it must not sink the rest of the batch
+            try:
+                personalized = [email_generator.personalize(template, recipient.name) for recipient in members]
             except Exception as e:
-                logger.error(f"Failed to generate email for {recipient.email}: {e}")
+                logger.error(f"Failed to personalize email for {members[0].company} ({len(members)} recipients): {e}")
+                continue
+            
+            for recipient, email_content in zip(members, personalized):
+                self._apply_generated(recipient, email_content, generated_at)
+                generated_count += 1
         
+        # Counter stays in step with the status change above, in the same transaction
+        if generated_count:
+            self._adjust_pending_count(campaign_id, generated_count, db)
         db.commit()
         
-        logger.info(f"✅ Generated {generated_count} emails for campaign {campaign_id}")
+        logger.info(f"✅ Generated {generated_count} emails for campaign {campaign_id} ({len(group_members)} LLM calls)")
         return generated_count
     
-    def request_approval(
+    @staticmethod
+    def _apply_generated(recipient: ColdEmailRecipient, email_content: Dict[str, str], generated_at: datetime) -> None:
+        recipient.subject = email_content["subject"]
+        recipient.body = email_content["body"]
+        recipient.generated_at = generated_at
+        recipient.status = EmailStatus.PENDING
+    
+    async def request_approval(
         self,
         campaign_id: str,
         db: Session
@@ -152,16 +206,15 @@ class ColdEmailService:
         if not campaign:
             return False
         
-        pending_count = db.query(ColdEmailRecipient).filter(
-            ColdEmailRecipient.campaign_id == campaign_id,
-            ColdEmailRecipient.status == EmailStatus.PENDING
-        ).count()
+        pending_count = campaign.pending_count or 0
         
         user = db.query(User).filter(User.id == campaign.user_id).first()
         
         approval_link = f"http://localhost:3000/dashboard/cold-email/{campaign_id}/approve"
         
-        success = gmail_service.send_approval_notification(
+        # Token refresh and the Gmail send both block; keep them off the event loop
+        success = await asyncio.to_thread(
+            gmail_service.send_approval_notification,
             user_id=user.id,
             user_email=user.email,
             campaign_name=campaign.name,
@@ -187,58 +240,96 @@ class ColdEmailService:
         ).first()
         
         if recipient:
+            was_pending = recipient.status == EmailStatus.PENDING
             recipient.approved = True
             recipient.approved_at = datetime.utcnow()
             recipient.status = EmailStatus.APPROVED
+            if was_pending:
+                self._adjust_pending_count(recipient.campaign_id, -1, db)
             db.commit()
             return True
         
         return False
     
-    def send_approved_emails(
+    @staticmethod
+    def _adjust_pending_count(campaign_id: str, delta: int, db: Session) -> None:
+        """Atomically shift the campaign's denormalized pending_count by delta"""
+        db.query(ColdEmailCampaign).filter(
+            ColdEmailCampaign.id == campaign_id
+        ).update(
+            {ColdEmailCampaign.pending_count: func.coalesce(ColdEmailCampaign.pending_count, 0) + delta},
+            synchronize_session=False
+        )
+    
+    async def send_approved_emails(
         self,
         campaign_id: str,
         db: Session
     ) -> int:
-        """Send all approved emails in a campaign"""
-        approved_recipients = db.query(ColdEmailRecipient).filter(
-            ColdEmailRecipient.campaign_id == campaign_id,
-            ColdEmailRecipient.status == EmailStatus.APPROVED
-        ).all()
+        """Send all approved emails in a campaign, SEND_CHUNK_SIZE recipients at a time"""
+        campaign = db.query(ColdEmailCampaign).filter(
+            ColdEmailCampaign.id == campaign_id
+        ).first()
+        
+        if not campaign:
+            return 0
         
         sent_count = 0
+        # Every email in the run is stamped with the same time
+        sent_at = datetime.utcnow()
         
-        for recipient in approved_recipients:
-            try:
-                result = gmail_service.send_email(
-                    user_id=recipient.user_id,
-                    to_email=recipient.email,
-                    subject=recipient.subject,
-                    body_html=recipient.body,
-                    db=db
-                )
-                
-                if result:
-                    recipient.status = EmailStatus.SENT
-                    recipient.sent_at = datetime.utcnow()
-                    recipient.gmail_message_id = result.get("message_id")
-                    recipient.gmail_thread_id = result.get("thread_id")
-                    sent_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Failed to send to {recipient.email}: {e}")
-                recipient.status = EmailStatus.BOUNCED
+        # Only the columns the send needs, in keyset-paginated chunks, so memory stays
+        # bounded by the chunk size rather than the campaign size. Each chunk is its own
+        # query, so token-refresh commits during a send can't invalidate an open cursor.
+        last_id = ""
+        while True:
+            rows = db.execute(
+                select(
+                    ColdEmailRecipient.id,
+                    ColdEmailRecipient.email,
+                    ColdEmailRecipient.subject,
+                    ColdEmailRecipient.body
+                ).where(
+                    ColdEmailRecipient.campaign_id == campaign_id,
+                    ColdEmailRecipient.status == EmailStatus.APPROVED,
+                    ColdEmailRecipient.id > last_id
+                ).order_by(ColdEmailRecipient.id).limit(SEND_CHUNK_SIZE)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            
+            # Every recipient in a campaign sends from the campaign owner's account,
+            # so one Gmail service and a few batched requests cover each chunk.
+            # The Google client blocks, so the send runs off the event loop.
+            results = await asyncio.to_thread(
+                gmail_service.send_emails_batched,
+                user_id=campaign.user_id,
+                messages=[tuple(row) for row in rows],
+                db=db
+            )
+            
+            # Bulk UPDATE by primary key instead of hydrating and dirtying ORM objects
+            updates = [
+                {
+                    "id": recipient_id,
+                    "status": EmailStatus.SENT,
+                    "sent_at": sent_at,
+                    "gmail_message_id": result.get("message_id"),
+                    "gmail_thread_id": result.get("thread_id")
+                }
+                for recipient_id, result in results.items()
+                if result
+            ]
+            if updates:
+                db.execute(update(ColdEmailRecipient), updates)
+            sent_count += len(updates)
         
         # Update campaign
-        campaign = db.query(ColdEmailCampaign).filter(
-            ColdEmailCampaign.id == campaign_id
-        ).first()
-        
-        if campaign:
-            campaign.emails_sent += sent_count
-            campaign.last_sent_at = datetime.utcnow()
-            campaign.next_send_at = datetime.utcnow() + timedelta(days=campaign.send_interval_days)
-            campaign.status = EmailCampaignStatus.ACTIVE
+        campaign.emails_sent += sent_count
+        campaign.last_sent_at = sent_at
+        campaign.next_send_at = sent_at + timedelta(days=campaign.send_interval_days)
+        campaign.status = EmailCampaignStatus.ACTIVE
         
         db.commit()
         
@@ -1,50 +1,130 @@
 # backend/app/services/email_generator.py
 
-from typing import Dict, List
+from dataclasses import astuple, dataclass
+from hashlib import blake2b
+from typing import Dict, List, Optional
 import logging
+import orjson
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 from app.models.database import User, Skill, Experience, Project
 from app.services.llm_service import get_llm_service
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True)
+class UserContext:
+    """Sender profile used in every email of a campaign; loaded once, shared read-only"""
+    full_name: Optional[str]
+    target_role: str
+    skills_text: str
+    experience_text: str
+    project_text: str
+
+
+class EmailTemplateCache:
+    """
+    Exact-match cache of generated email templates, keyed on everything in the prompt.
+    
+    The prompt never contains the recipient's name: the LLM writes literal placeholders,
+    so one template serves every recipient with the same title at the same company and
+    only the placeholders are filled in per recipient.
+    """
+    FULL_NAME = "{{full_name}}"
+    FIRST_NAME = "{{first_name}}"
+    
+    def __init__(self, maxsize: int = 2048, ttl: int = 6 * 3600):
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    @staticmethod
+    def key(context: UserContext, recipient_title: str, company_name: str, company_info: Dict) -> str:
+        payload = orjson.dumps(
+            [astuple(context), recipient_title, company_name, company_info],
+            option=orjson.OPT_SORT_KEYS,
+            default=str
+        )
+        return blake2b(payload, digest_size=16).hexdigest()
+    
+    @classmethod
+    def render(cls, template: Dict[str, str], recipient_name: str) -> Dict[str, str]:
+        """Fill the name placeholders; nothing else in the text is touched"""
+        full_name = (recipient_name or "").strip() or "there"
+        first_name = full_name.split()[0]
+        return {
+            field: text.replace(cls.FULL_NAME, full_name).replace(cls.FIRST_NAME, first_name)
+            for field, text in template.items()
+        }
+    
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        return self._entries.get(key)
+    
+    def put(self, key: str, template: Dict[str, str]) -> None:
+        self._entries[key] = template
+
+
 class EmailGenerator:
     """Generate personalized cold emails using AI"""
     
-    def generate_cold_email(
+    def __init__(self):
+        self.template_cache = EmailTemplateCache()
+    
+    def personalize(self, template: Dict[str, str], recipient_name: str) -> Dict[str, str]:
+        """Address a template from generate_email_template to one recipient"""
+        return EmailTemplateCache.render(template, recipient_name)
+    
+    def load_user_context(self, user_id: str, db: Session) -> UserContext:
+        """Fetch the sender's profile once so a whole campaign can reuse it"""
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise ValueError(f"User {user_id} not found")
+        
+        skills = db.query(Skill.skill).filter(Skill.user_id == user_id).limit(5).all()
+        experience = db.query(Experience).filter(Experience.user_id == user_id).first()
+        project = db.query(Project).filter(Project.user_id == user_id).first()
+        
+        return UserContext(
+            full_name=user.full_name,
+            target_role=user.readiness_level or 'Software Engineer',
+            skills_text=", ".join(skill for (skill,) in skills),
+            experience_text=f"{experience.role} at {experience.company}" if experience else "",
+            project_text=f"{project.title}: {(project.description or '')[:100]}" if project else ""
+        )
+    
+    async def generate_cold_email(
         self,
-        user_id: str,
+        context: UserContext,
         recipient_name: str,
         recipient_title: str,
         company_name: str,
-        company_info: Dict,
-        db: Session
+        company_info: Dict
     ) -> Dict[str, str]:
         """
         Generate personalized cold email
         
         Returns: {"subject": "...", "body": "..."}
         """
+        template = await self.generate_email_template(context, recipient_title, company_name, company_info)
+        return self.personalize(template, recipient_name)
+    
+    async def generate_email_template(
+        self,
+        context: UserContext,
+        recipient_title: str,
+        company_name: str,
+        company_info: Dict
+    ) -> Dict[str, str]:
+        """
+        Generate a cold email with the recipient's name left as placeholders
+        
+        Returns: {"subject": "...", "body": "..."}; fill in with personalize()
+        """
+        cache_key = self.template_cache.key(context, recipient_title, company_name, company_info)
+        cached = self.template_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Get user profile
-            user = db.query(User).filter(User.id == user_id).first()
-            skills = db.query(Skill).filter(Skill.user_id == user_id).limit(5).all()
-            experiences = db.query(Experience).filter(Experience.user_id == user_id).limit(2).all()
-            projects = db.query(Project).filter(Project.user_id == user_id).limit(2).all()
-            
-            # Build context
-            skills_text = ", ".join([s.skill for s in skills])
-            
-            experience_text = ""
-            if experiences:
-                exp = experiences[0]
-                experience_text = f"{exp.role} at {exp.company}"
-            
-            project_text = ""
-            if projects:
-                proj = projects[0]
-                project_text = f"{proj.title}: {proj.description[:100]}"
-            
             # Company context
             tech_stack = company_info.get("tech_stack", "")
             recent_news = company_info.get("recent_news", "")
@@ -53,14 +133,14 @@ class EmailGenerator:
             prompt = f"""Generate a professional cold email for a job opportunity.
 
 **Sender Profile:**
-- Name: {user.full_name}
-- Skills: {skills_text}
-- Recent Experience: {experience_text}
-- Notable Project: {project_text}
-- Target Role: {user.readiness_level or 'Software Engineer'}
+- Name: {context.full_name}
+- Skills: {context.skills_text}
+- Recent Experience: {context.experience_text}
+- Notable Project: {context.project_text}
+- Target Role: {context.target_role}
 
 **Recipient:**
-- Name: {recipient_name}
+- Name: write the literal placeholder {EmailTemplateCache.FIRST_NAME} wherever the recipient is addressed (e.g. "Hi {EmailTemplateCache.FIRST_NAME},"); it is filled in later, so keep it exactly as written
 - Title: {recipient_title}
 - Company: {company_name}
 
@@ -88,35 +168,44 @@ Format as JSON:
 """
             
             llm = get_llm_service()
-            response = llm.generate(prompt)
+            response = await llm.generate(prompt, json_mode=True)
             
             # Parse JSON response
-            import json
             try:
-                result = json.loads(response)
-                return {
-                    "subject": result.get("subject", f"Interested in {recipient_title} opportunities at {company_name}"),
-                    "body": result.get("body", self._fallback_email(user, recipient_name, company_name))
-                }
-            except json.JSONDecodeError:
+                result = orjson.loads(response.encode("utf-8"))
+            except orjson.JSONDecodeError:
                 logger.warning("Failed to parse LLM JSON, using fallback")
-                return {
-                    "subject": f"Interested in {recipient_title} opportunities at {company_name}",
-                    "body": self._fallback_email(user, recipient_name, company_name)
-                }
+                result = None
+            
+            # JSON mode guarantees syntax, not shape: each field must be a non-empty string
+            fields = result if isinstance(result, dict) else {}
+            subject, body = fields.get("subject"), fields.get("body")
+            subject_ok = isinstance(subject, str) and subject.strip()
+            body_ok = isinstance(body, str) and body.strip()
+            
+            template = {
+                "subject": subject if subject_ok else f"Interested in {recipient_title} opportunities at {company_name}",
+                "body": body if body_ok else self._fallback_email(context.full_name, company_name)
+            }
+            if subject_ok and body_ok:
+                # Only complete LLM output is cached; fallbacks are retried next time
+                self.template_cache.put(cache_key, template)
+            elif result is not None:
+                logger.warning("LLM email JSON missing subject/body strings, using fallback")
+            return template
                 
         except Exception as e:
             logger.error(f"Failed to generate email: {e}", exc_info=True)
             return {
                 "subject": f"Interested in opportunities at {company_name}",
-                "body": self._fallback_email(user, recipient_name, company_name)
+                "body": self._fallback_email(context.full_name, company_name)
             }
     
-    def _fallback_email(self, user: User, recipient_name: str, company_name: str) -> str:
-        """Fallback email template"""
-        return f"""<p>Hi {recipient_name},</p>
+    def _fallback_email(self, sender_name: Optional[str], company_name: str) -> str:
+        """Fallback email template (recipient name left as a placeholder)"""
+        return f"""<p>Hi {EmailTemplateCache.FULL_NAME},</p>
 
-<p>I'm {user.full_name}, a software engineer interested in opportunities at {company_name}.</p>
+<p>I'm {sender_name}, a software engineer interested in opportunities at {company_name}.</p>
 
 <p>I've been following {company_name}'s work and I'm impressed by your team's innovations. 
 I believe my skills could add value to your engineering team.</p>
@@ -124,7 +213,7 @@ I believe my skills could add value to your engineering team.</p>
 <p>Would you be open to a brief 15-minute chat to discuss potential opportunities?</p>
 
 <p>Best regards,<br>
-{user.full_name}</p>
+{sender_name}</p>
 """
 
 email_generator = EmailGenerator()
@@ -3,17 +3,95 @@
 from googleapiclient.errors import HttpError
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.header import Header
+from html import escape
 import base64
 import logging
-from typing import Optional, Dict
+from typing import Final, Optional, Dict, List, Tuple
 from sqlalchemy.orm import Session
-from app.services.google_oauth import google_oauth
+from app.services.google_oauth import google_oauth, execute_batched
 
 logger = logging.getLogger(__name__)
 
+# Approval notification rendered and encoded once at import; each send only
+# substitutes the sentinels in the UTF-8 body (sent 8bit, so bytes stay literal).
+# Values are HTML-escaped before substitution, as an autoescaping template would.
+_APPROVAL_BODY: Final[bytes] = """
+            <html>
+            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+                <h2 style="color: #4F46E5;">📧 Cold Email Campaign Ready</h2>
+                
+                <p>Hi there! 👋</p>
+                
+                <p>Your AI-generated cold emails are ready for review:</p>
+                
+                <div style="background: #F3F4F6; padding: 20px; border-radius: 8px; margin: 20px 0;">
+                    <h3 style="margin-top: 0;">Campaign: __CAMPAIGN__</h3>
+                    <p><strong>__COUNT__ emails</strong> waiting for your approval</p>
+                </div>
+                
+                <p>Each email has been personalized based on:</p>
+                <ul>
+                    <li>✅ Your skills and experience</li>
+                    <li>✅ Target company information</li>
+                    <li>✅ Recipient's role and background</li>
+                </ul>
+                
+                <div style="margin: 30px 0;">
+                    <a href="__LINK__" 
+                       style="background: #4F46E5; color: white; padding: 12px 24px; 
+                              text-decoration: none; border-radius: 6px; display: inline-block;">
+                        Review & Approve Emails →
+                    </a>
+                </div>
+                
+                <p style="color: #6B7280; font-size: 14px;">
+                    💡 <strong>Tip:</strong> Review each email carefully before sending. 
+                    You can edit, approve, or reject individual emails.
+                </p>
+                
+                <hr style="border: none; border-top: 1px solid #E5E7EB; margin: 30px 0;">
+                
+                <p style="color: #9CA3AF; font-size: 12px;">
+                    This is an automated notification from your Career AI Assistant.<br>
+                    <a href="http://localhost:3000/dashboard/cold-email" 
+                       style="color: #4F46E5;">Manage your campaigns</a>
+                </p>
+            </body>
+            </html>
+""".encode("utf-8")
+
+_APPROVAL_MIME_HEADERS: Final[bytes] = (
+    b'MIME-Version: 1.0\r\n'
+    b'Content-Type: text/html; charset="utf-8"\r\n'
+    b'Content-Transfer-Encoding: 8bit\r\n'
+)
+
+
 class GmailService:
     """Send emails via Gmail API"""
     
+    @staticmethod
+    def _encode_message(to_email: str, subject: str, body_html: str) -> str:
+        """Build the MIME message and return it base64url-encoded for the API"""
+        message = MIMEMultipart('alternative')
+        message['To'] = to_email
+        message['Subject'] = subject
+        
+        # HTML body
+        html_part = MIMEText(body_html, 'html')
+        message.attach(html_part)
+        
+        return base64.urlsafe_b64encode(message.as_bytes()).decode()
+    
+    @staticmethod
+    def _raw_send_request(service, raw: str):
+        return service.users().messages().send(userId='me', body={'raw': raw})
+    
+    def build_send_request(self, service, to_email: str, subject: str, body_html: str):
+        """Return the messages.send HttpRequest without executing it"""
+        return self._raw_send_request(service, self._encode_message(to_email, subject, body_html))
+    
     def send_email(
         self,
         user_id: str,
@@ -27,26 +105,15 @@ class GmailService:
         
         Returns: {"message_id": "...", "thread_id": "..."}
         """
+        return self._send_raw(user_id, to_email, self._encode_message(to_email, subject, body_html), db)
+    
+    def _send_raw(self, user_id: str, to_email: str, raw: str, db: Session) -> Optional[Dict]:
+        """Send an already base64url-encoded RFC 2822 message"""
         try:
             service = google_oauth.get_gmail_service(user_id, db)
             
-            # Create message
-            message = MIMEMultipart('alternative')
-            message['To'] = to_email
-            message['Subject'] = subject
-            
-            # HTML body
-            html_part = MIMEText(body_html, 'html')
-            message.attach(html_part)
-            
-            # Encode
-            raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-            
             # Send
-            result = service.users().messages().send(
-                userId='me',
-                body={'raw': raw}
-            ).execute()
+            result = self._raw_send_request(service, raw).execute()
             
             logger.info(f"✅ Email sent to {to_email}: {result.get('id')}")
             
@@ -62,6 +129,50 @@ class GmailService:
             logger.error(f"❌ Failed to send email: {e}", exc_info=True)
             return None
     
+    def send_emails_batched(
+        self,
+        user_id: str,
+        messages: List[Tuple[str, str, str, str]],
+        db: Session
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Send many emails from one account via batched Gmail API requests
+        
+        messages: [(request_id, to_email, subject, body_html), ...]
+        Returns: {request_id: {"message_id": "...", "thread_id": "..."} or None if that send failed}
+        """
+        results: Dict[str, Optional[Dict]] = {}
+        if not messages:
+            return results
+        
+        def on_send(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"❌ Gmail API error for {request_id}: {exception}")
+                results[request_id] = None
+                return
+            results[request_id] = {
+                "message_id": response.get('id'),
+                "thread_id": response.get('threadId')
+            }
+        
+        try:
+            service = google_oauth.get_gmail_service(user_id, db)
+            execute_batched(
+                service,
+                (
+                    (request_id, self.build_send_request(service, to_email, subject, body_html))
+                    for request_id, to_email, subject, body_html in messages
+                ),
+                on_send
+            )
+        except HttpError as e:
+            logger.error(f"❌ Gmail API error: {e}")
+        except Exception as e:
+            logger.error(f"❌ Failed to send emails: {e}", exc_info=True)
+        
+        logger.info(f"✅ Sent {sum(1 for r in results.values() if r)}/{len(messages)} emails for user {user_id}")
+        return results
+    
     def send_approval_notification(
         self,
         user_id: str,
@@ -75,52 +186,17 @@ class GmailService:
         try:
             subject = f"🎯 {pending_count} Cold Emails Ready for Review - {campaign_name}"
             
-            body_html = f"""
-            <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">📧 Cold Email Campaign Ready</h2>
-                
-                <p>Hi there! 👋</p>
-                
-                <p>Your AI-generated cold emails are ready for review:</p>
-                
-                <div style="background: #F3F4F6; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                    <h3 style="margin-top: 0;">Campaign: {campaign_name}</h3>
-                    <p><strong>{pending_count} emails</strong> waiting for your approval</p>
-                </div>
-                
-                <p>Each email has been personalized based on:</p>
-                <ul>
-                    <li>✅ Your skills and experience</li>
-                    <li>✅ Target company information</li>
-                    <li>✅ Recipient's role and background</li>
-                </ul>
-                
-                <div style="margin: 30px 0;">
-                    <a href="{approval_link}" 
-                       style="background: #4F46E5; color: white; padding: 12px 24px; 
-                              text-decoration: none; border-radius: 6px; display: inline-block;">
-                        Review & Approve Emails →
-                    </a>
-                </div>
-                
-                <p style="color: #6B7280; font-size: 14px;">
-                    💡 <strong>Tip:</strong> Review each email carefully before sending. 
-                    You can edit, approve, or reject individual emails.
-                </p>
-                
-                <hr style="border: none; border-top: 1px solid #E5E7EB; margin: 30px 0;">
-                
-                <p style="color: #9CA3AF; font-size: 12px;">
-                    This is an automated notification from your Career AI Assistant.<br>
-                    <a href="http://localhost:3000/dashboard/cold-email" 
-                       style="color: #4F46E5;">Manage your campaigns</a>
-                </p>
-            </body>
-            </html>
-            """
+            body = (
+                _APPROVAL_BODY
+                .replace(b"__CAMPAIGN__", escape(campaign_name).encode("utf-8"))
+                .replace(b"__COUNT__", str(pending_count).encode())
+                .replace(b"__LINK__", escape(approval_link).encode("utf-8"))
+            )
+            encoded_subject = Header(subject, 'utf-8').encode(linesep="\r\n")
+            headers = f"To: {user_email}\r\nSubject: {encoded_subject}\r\n".encode("utf-8")
+            raw = base64.urlsafe_b64encode(headers + _APPROVAL_MIME_HEADERS + b"\r\n" + body).decode()
             
-            result = self.send_email(user_id, user_email, subject, body_html, db)
+            result = self._send_raw(user_id, user_email, raw, db)
             return result is not None
             
         except Exception as e:
@@ -3,16 +3,121 @@
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from sqlalchemy.orm import Session
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from cachetools import TTLCache
+from functools import lru_cache
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import update
+from sqlalchemy.orm import Session, load_only
 import json
 import logging
-from datetime import datetime
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+from app.config.database import SessionLocal
 from app.config.settings import settings
 from app.models.database import User
 
 logger = logging.getLogger(__name__)
 
+# The only User columns get_credentials reads or writes
+_TOKEN_COLUMNS = (User.google_access_token, User.google_refresh_token, User.google_token_expiry)
+_TOKEN_ATTRIBUTES = [column.key for column in _TOKEN_COLUMNS]
+
+# Calls per batch HTTP request; Google accepts more, but recommends staying small
+BATCH_SIZE = 100
+
+# Tokens this close to expiry are refreshed in the background while still being served
+PROACTIVE_REFRESH_WINDOW = timedelta(minutes=5)
+
+
+# Token endpoint (code exchange and refresh) calls in flight per process, and retry policy
+# for the code exchange. google-auth already backs off on 429/5xx inside credentials.refresh.
+TOKEN_ENDPOINT_CONCURRENCY = 32
+TOKEN_EXCHANGE_ATTEMPTS = 3
+TOKEN_BACKOFF_SECONDS = 1.0
+TOKEN_BACKOFF_MAX_SECONDS = 30.0
+_RETRYABLE_TOKEN_STATUSES = frozenset({429, 500, 503})
+
+_token_endpoint_slots = threading.BoundedSemaphore(TOKEN_ENDPOINT_CONCURRENCY)
+
+# Keep-alive connections to Google's OAuth endpoints, shared by every Flow's OAuth2Session
+# and every token refresh instead of a fresh TLS handshake per call
+_google_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+_google_session = requests.Session()
+_google_session.mount("https://", _google_adapter)
+
+
+class TokenEndpointBusy(Exception):
+    """Google's token endpoint answered 429/5xx; the authorization code was not consumed"""
+
+
+def _raise_for_retryable_status(response):
+    # requests-oauthlib compliance hook: runs before the body is parsed as a token
+    if response.status_code in _RETRYABLE_TOKEN_STATUSES:
+        raise TokenEndpointBusy(f"token endpoint returned HTTP {response.status_code}")
+    return response
+
+
+def _expires_soon(credentials: Credentials) -> bool:
+    # google-auth keeps expiry as naive UTC
+    expiry = credentials.expiry
+    return expiry is not None and expiry - datetime.utcnow() < PROACTIVE_REFRESH_WINDOW
+
+
+def execute_batched(
+    service,
+    requests: Iterable[Tuple[str, object]],
+    callback: Callable,
+    batch_size: int = BATCH_SIZE
+) -> None:
+    """
+    Send (request_id, HttpRequest) pairs as multipart batch requests, batch_size
+    calls per HTTP round trip. callback(request_id, response, exception) runs per call.
+    """
+    batch, queued = None, 0
+    for request_id, request in requests:
+        if batch is None:
+            batch = service.new_batch_http_request(callback=callback)
+        batch.add(request, request_id=request_id)
+        queued += 1
+        if queued == batch_size:
+            batch.execute()
+            batch, queued = None, 0
+    if batch is not None:
+        batch.execute()
+
+
+@lru_cache(maxsize=None)
+def _discovery_bytes(api: str, version: str) -> bytes:
+    """Bundled discovery document for api/version, read from the package once per process"""
+    return get_static_doc(api, version).encode("utf-8")
+
+
+def _discovery_document(api: str, version: str) -> dict:
+    """
+    A private, freshly parsed copy of the discovery document.
+    build_from_document (and each nested resource, lazily) fixes up method parameters
+    in place, so a dict shared between threads would be mutated while others read it.
+    """
+    return orjson.loads(_discovery_bytes(api, version))
+
+
+def list_all_items(collection, request) -> List[dict]:
+    """Execute a list request and follow nextPageToken via list_next, returning every page's items"""
+    items: List[dict] = []
+    while request is not None:
+        response = request.execute()
+        items.extend(response.get('items', []))
+        request = collection.list_next(request, response)
+    return items
+
+
 class GoogleOAuthService:
     def __init__(self):
         self.scopes = [
@@ -39,6 +144,19 @@ class GoogleOAuthService:
             }
         }
         
+        # One lock per user so concurrent callers share a single token refresh
+        self._refresh_locks: Dict[str, threading.Lock] = {}
+        
+        # user_id -> Credentials, so back-to-back Google calls skip the User lookup.
+        # Entries are only served while the token itself is still valid.
+        self._credentials_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+        self._credentials_lock = threading.Lock()
+        self._refreshing_ahead: Set[str] = set()
+        
+        # (user_id, api, thread) -> (credentials, service). httplib2 connections are not
+        # thread-safe, so each worker thread gets its own service object per user.
+        self._service_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+        
         logger.info("✅ Google OAuth Service initialized")
         logger.info(f"📍 Redirect URI: {settings.GOOGLE_REDIRECT_URI}")
     
@@ -80,16 +198,36 @@ class GoogleOAuthService:
                 redirect_uri=settings.GOOGLE_REDIRECT_URI
             )
             
-            flow.fetch_token(code=code)
+            flow.oauth2session.mount("https://", _google_adapter)
+            flow.oauth2session.register_compliance_hook('access_token_response', _raise_for_retryable_status)
+            for attempt in range(TOKEN_EXCHANGE_ATTEMPTS):
+                try:
+                    with _token_endpoint_slots:
+                        flow.fetch_token(code=code)
+                    break
+                except TokenEndpointBusy as e:
+                    if attempt == TOKEN_EXCHANGE_ATTEMPTS - 1:
+                        raise
+                    # Full jitter, so a burst of callbacks doesn't retry in lockstep
+                    backoff = min(TOKEN_BACKOFF_MAX_SECONDS, TOKEN_BACKOFF_SECONDS * 2 ** attempt)
+                    wait_time = random.uniform(0, backoff)
+                    logger.warning(f"⏳ {e}. Retrying code exchange in {wait_time:.1f}s...")
+                    time.sleep(wait_time)
             credentials = flow.credentials
             
-            # Save to database
-            user = db.query(User).filter(User.id == user_id).first()
-            if user:
-                user.google_access_token = credentials.token
-                user.google_refresh_token = credentials.refresh_token
-                user.google_token_expiry = credentials.expiry
+            # Save to database: one UPDATE by primary key, no SELECT or ORM hydration
+            result = db.execute(
+                update(User)
+                .where(User.id == user_id)
+                .values(
+                    google_access_token=credentials.token,
+                    google_refresh_token=credentials.refresh_token,
+                    google_token_expiry=credentials.expiry
+                )
+            )
+            if result.rowcount:
                 db.commit()
+                self._forget_credentials(user_id)
                 
                 logger.info(f"✅ Saved Google tokens for user {user_id}")
             else:
@@ -106,48 +244,139 @@ class GoogleOAuthService:
             logger.error(f"❌ Token exchange failed: {e}", exc_info=True)
             raise
     
-    def get_credentials(self, user_id: str, db: Session) -> Credentials:
-        """Get stored credentials for user"""
-        user = db.query(User).filter(User.id == user_id).first()
-        
-        if not user or not user.google_access_token:
-            raise ValueError("No Google credentials found. Please connect Google account.")
-        
-        credentials = Credentials(
+    def _forget_credentials(self, user_id: str) -> None:
+        with self._credentials_lock:
+            self._credentials_cache.pop(user_id, None)
+    
+    def _build_credentials(self, user: User) -> Credentials:
+        return Credentials(
             token=user.google_access_token,
             refresh_token=user.google_refresh_token,
             token_uri="https://oauth2.googleapis.com/token",
             client_id=settings.GOOGLE_CLIENT_ID,
             client_secret=settings.GOOGLE_CLIENT_SECRET,
-            scopes=self.scopes
+            scopes=self.scopes,
+            expiry=user.google_token_expiry
         )
-        
-        # Check if expired and refresh
-        if credentials.expired and credentials.refresh_token:
+    
+    def _refresh_locked(
+        self,
+        user_id: str,
+        user: User,
+        credentials: Credentials,
+        db: Session,
+        is_stale: Callable[[Credentials], bool]
+    ) -> None:
+        """Refresh credentials in place and persist them, unless another caller already has"""
+        with self._refresh_locks.setdefault(user_id, threading.Lock()):
+            # The thread lock covers this process; SELECT ... FOR UPDATE on the user
+            # row serializes other workers until the commit below. Either way, another
+            # caller may have refreshed while we waited, so re-read before refreshing.
+            db.refresh(user, attribute_names=_TOKEN_ATTRIBUTES, with_for_update=True)
+            credentials.token = user.google_access_token
+            credentials.expiry = user.google_token_expiry
+            
+            if not is_stale(credentials):
+                db.commit()  # nothing to write; just release the row lock
+                return
+            
             try:
-                credentials.refresh(Request())
+                with _token_endpoint_slots:
+                    credentials.refresh(Request(session=_google_session))
                 
-                # Update database
+                # Update database (commit also releases the row lock)
                 user.google_access_token = credentials.token
                 user.google_token_expiry = credentials.expiry
                 db.commit()
                 
                 logger.info(f"🔄 Refreshed token for user {user_id}")
             except Exception as e:
+                db.commit()  # user row is untouched; release the lock
                 logger.error(f"❌ Token refresh failed: {e}")
                 raise ValueError("Token expired. Please reconnect Google account.")
+    
+    def _refresh_ahead(self, user_id: str, credentials: Credentials) -> None:
+        """Start a background refresh when a still-valid token is about to expire"""
+        if not credentials.refresh_token or not _expires_soon(credentials):
+            return
+        with self._credentials_lock:
+            if user_id in self._refreshing_ahead:
+                return
+            self._refreshing_ahead.add(user_id)
+        threading.Thread(
+            target=self._background_refresh,
+            args=(user_id,),
+            name=f"google-token-refresh-{user_id}",
+            daemon=True
+        ).start()
+    
+    def _background_refresh(self, user_id: str) -> None:
+        # Runs on its own thread, so it needs its own session
+        db = SessionLocal()
+        try:
+            user = db.query(User).options(load_only(*_TOKEN_COLUMNS)).filter(User.id == user_id).first()
+            if user and user.google_refresh_token:
+                credentials = self._build_credentials(user)
+                self._refresh_locked(user_id, user, credentials, db, _expires_soon)
+                with self._credentials_lock:
+                    self._credentials_cache[user_id] = credentials
+        except Exception as e:
+            logger.warning(f"⚠️ Background token refresh failed for user {user_id}: {e}")
+        finally:
+            db.close()
+            with self._credentials_lock:
+                self._refreshing_ahead.discard(user_id)
+    
+    def get_credentials(self, user_id: str, db: Session) -> Credentials:
+        """Get stored credentials for user"""
+        with self._credentials_lock:
+            cached = self._credentials_cache.get(user_id)
+        if cached is not None and not cached.expired:
+            self._refresh_ahead(user_id, cached)
+            return cached
+        
+        user = db.query(User).options(load_only(*_TOKEN_COLUMNS)).filter(User.id == user_id).first()
+        
+        if not user or not user.google_access_token:
+            raise ValueError("No Google credentials found. Please connect Google account.")
+        
+        credentials = self._build_credentials(user)
         
+        # Check if expired and refresh
+        if credentials.expired and credentials.refresh_token:
+            self._refresh_locked(user_id, user, credentials, db, lambda c: c.expired)
+        
+        with self._credentials_lock:
+            self._credentials_cache[user_id] = credentials
+        self._refresh_ahead(user_id, credentials)
         return credentials
     
+    def _get_service(self, user_id: str, db: Session, api: str, version: str):
+        """
+        Reuse this thread's service for the user while it wraps the current credentials.
+        The service must only be used on the thread that fetched it.
+        """
+        credentials = self.get_credentials(user_id, db)
+        key = (user_id, api, threading.get_ident())
+        
+        with self._credentials_lock:
+            cached = self._service_cache.get(key)
+        # A refresh or reconnect yields a new Credentials object, which invalidates the entry
+        if cached is not None and cached[0] is credentials:
+            return cached[1]
+        
+        service = build_from_document(_discovery_document(api, version), credentials=credentials)
+        with self._credentials_lock:
+            self._service_cache[key] = (credentials, service)
+        return service
+    
     def get_calendar_service(self, user_id: str, db: Session):
         """Get Google Calendar service"""
-        credentials = self.get_credentials(user_id, db)
-        return build('calendar', 'v3', credentials=credentials)
+        return self._get_service(user_id, db, 'calendar', 'v3')
     
     def get_gmail_service(self, user_id: str, db: Session):
         """Get Gmail service"""
-        credentials = self.get_credentials(user_id, db)
-        return build('gmail', 'v1', credentials=credentials)
+        return self._get_service(user_id, db, 'gmail', 'v1')
 
 # Singleton - with error handling
 try:
@@ -1,14 +1,35 @@
 # backend/app/services/graph_builder.py
 
-import json
 import logging
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Tuple
 from app.services.graph_db import get_graph_db
 from app.utils.graph_queries import CypherQueries
 
 logger = logging.getLogger(__name__)
 
+# Rows per UNWIND write transaction
+BATCH_SIZE = 5000
+
+
+@lru_cache(maxsize=32)
+def _read_json_records(file_path: Path) -> Tuple[Dict[str, Any], ...]:
+    """
+    Parse a knowledge file once per process (resourceSkill.json feeds two builders).
+    Shared between callers, so the records must be treated as read-only.
+    Failures raise and are therefore not cached.
+    """
+    # orjson has no load(); it parses the UTF-8 bytes directly
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
+    return tuple(data) if isinstance(data, list) else (data,)
+
+
 class GraphBuilder:
     """
     Builds static/global knowledge graphs from JSON files.
@@ -24,28 +45,88 @@ class GraphBuilder:
     # FILE LOADERS
     # ========================
     
-    def load_json_file(self, filename: str) -> List[Dict[str, Any]]:
-        """Load and parse JSON file"""
+    def load_json_file(self, filename: str) -> Tuple[Dict[str, Any], ...]:
+        """Load and parse JSON file (cached; do not mutate the returned records)"""
         file_path = self.knowledge_dir / filename
         if not file_path.exists():
             logger.error(f"File not found: {file_path}")
-            return []
+            return ()
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
-                return [data]
+            return _read_json_records(file_path)
         except Exception as e:
             logger.error(f"Error loading {filename}: {e}")
-            return []
+            return ()
+    
+    # ========================
+    # BATCH WRITER
+    # ========================
+    
+    def _session(self, session=None):
+        """Reuse the caller's session if given, otherwise open a new one"""
+        return nullcontext(session) if session is not None else self.graph_db.driver.session()
+    
+    @staticmethod
+    def _record_rows(
+        records: Iterable[Dict[str, Any]],
+        to_rows: Callable[[Dict[str, Any]], List[Dict[str, Any]]],
+        label: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily map each record to its rows; a malformed record is logged and skipped"""
+        for index, record in enumerate(records):
+            try:
+                rows = to_rows(record)
+            except Exception as e:
+                logger.error(f"Skipping malformed {label} record {index}: {e!r}")
+                continue
+            yield from rows
+    
+    @staticmethod
+    def _write_batch(tx, query: str, rows: List[Dict[str, Any]], counter: str) -> int:
+        return getattr(tx.run(query, rows=rows).consume().counters, counter)
+    
+    def _run_batched(
+        self,
+        session,
+        query: str,
+        rows: Iterable[Dict[str, Any]],
+        label: str,
+        counter: str
+    ) -> int:
+        """
+        Send rows through an UNWIND query, one write transaction per batch.
+        rows may be a generator: only one batch of parameter maps is built at a time.
+        Returns the sum of the named summary counter (e.g. nodes_created) over all batches.
+        """
+        count = 0
+        rows = iter(rows)
+        batch_index = 0
+        while batch := list(islice(rows, BATCH_SIZE)):
+            try:
+                count += session.execute_write(self._write_batch, query, batch, counter)
+            except Exception as e:
+                logger.error(f"Error writing {label} batch {batch_index}: {e}")
+            batch_index += 1
+        return count
+    
+    @staticmethod
+    def _create_constraints(tx, statements: List[str]) -> None:
+        for statement in statements:
+            tx.run(statement).consume()
+    
+    def ensure_key_constraints(self, session=None) -> None:
+        """
+        Make sure the MERGE keys (JobRole.name, Skill.name, Resource.title) are unique-indexed.
+        Without them every MERGE is a label scan. Idempotent (IF NOT EXISTS).
+        """
+        with self._session(session) as session:
+            session.execute_write(self._create_constraints, self.queries.STATIC_KEY_CONSTRAINTS)
     
     # ========================
     # STATIC GRAPH BUILDERS
     # ========================
     
-    def build_job_roles(self) -> int:
+    def build_job_roles(self, session=None) -> int:
         """Build JobRole nodes from jobRoles.json"""
         logger.info("Building JobRole nodes...")
         job_roles = self.load_json_file("jobRoles.json")
@@ -54,25 +135,22 @@ class GraphBuilder:
             logger.warning("No job roles found")
             return 0
         
-        count = 0
-        with self.graph_db.driver.session() as session:
-            for job in job_roles:
-                try:
-                    session.run(
-                        self.queries.MERGE_JOB_ROLE,
-                        name=job["name"],
-                        short_description=job["short_description"],
-                        industry=job["industry"],
-                        seniority_levels=job["seniority_levels"]
-                    )
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Error creating JobRole {job.get('name')}: {e}")
+        rows = self._record_rows(job_roles, lambda job: [{
+            "name": job["name"],
+            "short_description": job["short_description"],
+            "industry": job["industry"],
+            "seniority_levels": job["seniority_levels"]
+        }], "JobRole")
+        
+        with self._session(session) as session:
+            count = self._run_batched(
+                session, self.queries.MERGE_JOB_ROLE, rows, "JobRole", counter="nodes_created"
+            )
         
         logger.info(f"Created {count} JobRole nodes")
         return count
     
-    def build_skills(self) -> int:
+    def build_skills(self, session=None) -> int:
         """Build Skill nodes from skillCatalog.json"""
         logger.info("Building Skill nodes...")
         skills = self.load_json_file("skillCatalog.json")
@@ -81,24 +159,21 @@ class GraphBuilder:
             logger.warning("No skills found")
             return 0
         
-        count = 0
-        with self.graph_db.driver.session() as session:
-            for skill in skills:
-                try:
-                    session.run(
-                        self.queries.MERGE_SKILL,
-                        name=skill["name"],
-                        category=skill["category"],
-                        description=skill["description"]
-                    )
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Error creating Skill {skill.get('name')}: {e}")
+        rows = self._record_rows(skills, lambda skill: [{
+            "name": skill["name"],
+            "category": skill["category"],
+            "description": skill["description"]
+        }], "Skill")
+        
+        with self._session(session) as session:
+            count = self._run_batched(
+                session, self.queries.MERGE_SKILL, rows, "Skill", counter="nodes_created"
+            )
         
         logger.info(f"Created {count} Skill nodes")
         return count
     
-    def build_resources(self) -> int:
+    def build_resources(self, session=None) -> int:
         """Build Resource nodes from resourceSkill.json"""
         logger.info("Building Resource nodes...")
         resources = self.load_json_file("resourceSkill.json")
@@ -107,19 +182,16 @@ class GraphBuilder:
             logger.warning("No resources found")
             return 0
         
-        count = 0
-        with self.graph_db.driver.session() as session:
-            for resource in resources:
-                try:
-                    session.run(
-                        self.queries.MERGE_RESOURCE,
-                        title=resource["resource_title"],
-                        resource_type=resource["resource_type"],
-                        url=resource["url"]
-                    )
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Error creating Resource {resource.get('resource_title')}: {e}")
+        rows = self._record_rows(resources, lambda resource: [{
+            "title": resource["resource_title"],
+            "resource_type": resource["resource_type"],
+            "url": resource["url"]
+        }], "Resource")
+        
+        with self._session(session) as session:
+            count = self._run_batched(
+                session, self.queries.MERGE_RESOURCE, rows, "Resource", counter="nodes_created"
+            )
         
         logger.info(f"Created {count} Resource nodes")
         return count
@@ -128,7 +200,7 @@ class GraphBuilder:
     # RELATIONSHIP BUILDERS
     # ========================
     
-    def build_job_skill_requirements(self) -> int:
+    def build_job_skill_requirements(self, session=None) -> int:
         """Build JobRole -> Skill relationships from jobSkill.json"""
         logger.info("Building Job-Skill requirement relationships...")
         mappings = self.load_json_file("jobSkill.json")
@@ -137,39 +209,31 @@ class GraphBuilder:
             logger.warning("No job-skill mappings found")
             return 0
         
-        count = 0
-        with self.graph_db.driver.session() as session:
-            for mapping in mappings:
-                job_role = mapping["job_role"]
-                
-                # Core skills (REQUIRES)
-                for skill in mapping.get("core_skills", []):
-                    try:
-                        session.run(
-                            self.queries.CREATE_JOB_REQUIRES_SKILL,
-                            job_role=job_role,
-                            skill=skill
-                        )
-                        count += 1
-                    except Exception as e:
-                        logger.error(f"Error linking {job_role} -> {skill}: {e}")
-                
-                # Nice-to-have skills (NICE_TO_HAVE)
-                for skill in mapping.get("nice_to_have_skills", []):
-                    try:
-                        session.run(
-                            self.queries.CREATE_JOB_NICE_TO_HAVE_SKILL,
-                            job_role=job_role,
-                            skill=skill
-                        )
-                        count += 1
-                    except Exception as e:
-                        logger.error(f"Error linking {job_role} -> {skill}: {e}")
+        core_rows = self._record_rows(mappings, lambda mapping: [
+            {"job_role": mapping["job_role"], "skill": skill}
+            for skill in mapping.get("core_skills", [])
+        ], "REQUIRES")
+        optional_rows = self._record_rows(mappings, lambda mapping: [
+            {"job_role": mapping["job_role"], "skill": skill}
+            for skill in mapping.get("nice_to_have_skills", [])
+        ], "NICE_TO_HAVE")
+        
+        with self._session(session) as session:
+            # Core skills (REQUIRES)
+            count = self._run_batched(
+                session, self.queries.CREATE_JOB_REQUIRES_SKILL, core_rows, "REQUIRES",
+                counter="relationships_created"
+            )
+            # Nice-to-have skills (NICE_TO_HAVE)
+            count += self._run_batched(
+                session, self.queries.CREATE_JOB_NICE_TO_HAVE_SKILL, optional_rows, "NICE_TO_HAVE",
+                counter="relationships_created"
+            )
         
         logger.info(f"Created {count} Job-Skill relationships")
         return count
     
-    def build_skill_ontology(self) -> int:
+    def build_skill_ontology(self, session=None) -> int:
         """Build Skill -> Skill relationships from skillOntology.json"""
         logger.info("Building Skill ontology relationships...")
         ontology = self.load_json_file("skillOntology.json")
@@ -178,39 +242,31 @@ class GraphBuilder:
             logger.warning("No skill ontology found")
             return 0
         
-        count = 0
-        with self.graph_db.driver.session() as session:
-            for entry in ontology:
-                skill = entry["skill"]
-                
-                # Prerequisites
-                for prereq in entry.get("prerequisites", []):
-                    try:
-                        session.run(
-                            self.queries.CREATE_SKILL_PREREQUISITE,
-                            skill_from=prereq,
-                            skill_to=skill
-                        )
-                        count += 1
-                    except Exception as e:
-                        logger.error(f"Error linking prerequisite {prereq} -> {skill}: {e}")
-                
-                # Related skills (bidirectional)
-                for related in entry.get("related_skills", []):
-                    try:
-                        session.run(
-                            self.queries.CREATE_SKILL_RELATED,
-                            skill1=skill,
-                            skill2=related
-                        )
-                        count += 1
-                    except Exception as e:
-                        logger.error(f"Error linking related {skill} <-> {related}: {e}")
+        prereq_rows = self._record_rows(ontology, lambda entry: [
+            {"skill_from": prereq, "skill_to": entry["skill"]}
+            for prereq in entry.get("prerequisites", [])
+        ], "PREREQUISITE_OF")
+        related_rows = self._record_rows(ontology, lambda entry: [
+            {"skill1": entry["skill"], "skill2": related}
+            for related in entry.get("related_skills", [])
+        ], "RELATED_TO")
+        
+        with self._session(session) as session:
+            # Prerequisites
+            count = self._run_batched(
+                session, self.queries.CREATE_SKILL_PREREQUISITE, prereq_rows, "PREREQUISITE_OF",
+                counter="relationships_created"
+            )
+            # Related skills
+            count += self._run_batched(
+                session, self.queries.CREATE_SKILL_RELATED, related_rows, "RELATED_TO",
+                counter="relationships_created"
+            )
         
         logger.info(f"Created {count} Skill ontology relationships")
         return count
     
-    def build_resource_skill_mappings(self) -> int:
+    def build_resource_skill_mappings(self, session=None) -> int:
         """Build Resource -> Skill relationships from resourceSkill.json"""
         logger.info("Building Resource-Skill mappings...")
         resources = self.load_json_file("resourceSkill.json")
@@ -219,21 +275,16 @@ class GraphBuilder:
             logger.warning("No resource-skill mappings found")
             return 0
         
-        count = 0
-        with self.graph_db.driver.session() as session:
-            for resource in resources:
-                resource_title = resource["resource_title"]
-                
-                for skill in resource.get("teaches_skills", []):
-                    try:
-                        session.run(
-                            self.queries.CREATE_RESOURCE_TEACHES_SKILL,
-                            resource_title=resource_title,
-                            skill=skill
-                        )
-                        count += 1
-                    except Exception as e:
-                        logger.error(f"Error linking {resource_title} -> {skill}: {e}")
+        rows = self._record_rows(resources, lambda resource: [
+            {"resource_title": resource["resource_title"], "skill": skill}
+            for skill in resource.get("teaches_skills", [])
+        ], "TEACHES")
+        
+        with self._session(session) as session:
+            count = self._run_batched(
+                session, self.queries.CREATE_RESOURCE_TEACHES_SKILL, rows, "TEACHES",
+                counter="relationships_created"
+            )
         
         logger.info(f"Created {count} Resource-Skill relationships")
         return count
@@ -242,8 +293,8 @@ class GraphBuilder:
     # MASTER BUILD FUNCTION
     # ========================
     
-    def build_all_static_graphs(self) -> Dict[str, int]:
-        """Build all static/global knowledge graphs"""
+    def build_all_static_graphs(self, session=None) -> Dict[str, int]:
+        """Build all static/global knowledge graphs; relationship steps share one session"""
         logger.info("=" * 60)
         logger.info("Starting static knowledge graph construction")
         logger.info("=" * 60)
@@ -251,15 +302,26 @@ class GraphBuilder:
         results = {}
         
         try:
-            # Step 1: Create nodes
-            results["job_roles"] = self.build_job_roles()
-            results["skills"] = self.build_skills()
-            results["resources"] = self.build_resources()
+            # Step 0: MERGE must seek on an index, not scan, before any bulk load
+            self.ensure_key_constraints(session)
+            
+            # Step 1: Create nodes. The three labels are independent, so the builders
+            # run concurrently, each on its own session (sessions aren't thread-safe)
+            node_builders = {
+                "job_roles": self.build_job_roles,
+                "skills": self.build_skills,
+                "resources": self.build_resources,
+            }
+            with ThreadPoolExecutor(max_workers=len(node_builders)) as executor:
+                futures = {key: executor.submit(build) for key, build in node_builders.items()}
+                for key, future in futures.items():
+                    results[key] = future.result()
             
-            # Step 2: Create relationships
-            results["job_skill_mappings"] = self.build_job_skill_requirements()
-            results["skill_ontology"] = self.build_skill_ontology()
-            results["resource_skill_mappings"] = self.build_resource_skill_mappings()
+            with self._session(session) as session:
+                # Step 2: Create relationships (these MATCH the nodes above, so run after them)
+                results["job_skill_mappings"] = self.build_job_skill_requirements(session)
+                results["skill_ontology"] = self.build_skill_ontology(session)
+                results["resource_skill_mappings"] = self.build_resource_skill_mappings(session)
             
             logger.info("=" * 60)
             logger.info("Static graph construction completed successfully")
@@ -276,45 +338,16 @@ class GraphBuilder:
     # VALIDATION
     # ========================
     
-    def validate_static_graphs(self) -> Dict[str, Any]:
+    def _read_validation_counts(self, tx) -> Dict[str, Any]:
+        return tx.run(self.queries.VALIDATE_STATIC_GRAPHS).single().data()
+    
+    def validate_static_graphs(self, session=None) -> Dict[str, Any]:
         """Validate the constructed graphs"""
         logger.info("Validating static graphs...")
         
-        validation_results = {}
-        
-        with self.graph_db.driver.session() as session:
-            # Count nodes
-            result = session.run("MATCH (j:JobRole) RETURN count(j) as count")
-            validation_results["job_roles_count"] = result.single()["count"]
-            
-            result = session.run("MATCH (s:Skill) RETURN count(s) as count")
-            validation_results["skills_count"] = result.single()["count"]
-            
-            result = session.run("MATCH (r:Resource) RETURN count(r) as count")
-            validation_results["resources_count"] = result.single()["count"]
-            
-            # Count relationships
-            result = session.run("MATCH ()-[r:REQUIRES]->() RETURN count(r) as count")
-            validation_results["requires_count"] = result.single()["count"]
-            
-            result = session.run("MATCH ()-[r:NICE_TO_HAVE]->() RETURN count(r) as count")
-            validation_results["nice_to_have_count"] = result.single()["count"]
-            
-            result = session.run("MATCH ()-[r:PREREQUISITE_OF]->() RETURN count(r) as count")
-            validation_results["prerequisites_count"] = result.single()["count"]
-            
-            result = session.run("MATCH ()-[r:TEACHES]->() RETURN count(r) as count")
-            validation_results["teaches_count"] = result.single()["count"]
-            
-            # Check for orphaned nodes
-            result = session.run("""
-                MATCH (s:Skill)
-                WHERE NOT EXISTS {
-                    MATCH (s)-[]-()
-                }
-                RETURN count(s) as count
-            """)
-            validation_results["orphaned_skills"] = result.single()["count"]
+        with self._session(session) as session:
+            # All counts from a single query in one read transaction
+            validation_results = session.execute_read(self._read_validation_counts)
         
         logger.info(f"Validation results: {validation_results}")
         return validation_results
@@ -0,0 +1,10 @@
+# backend/app/services/groq_client.py
+
+from functools import lru_cache
+from groq import AsyncGroq
+
+
+@lru_cache(maxsize=4)
+def get_groq_client(api_key: str) -> AsyncGroq:
+    """One AsyncGroq client (and its HTTP connection pool) per API key, shared process-wide"""
+    return AsyncGroq(api_key=api_key)
@@ -6,13 +6,33 @@ Computes on-demand queries for skill gaps, readiness, and learning paths
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import sys
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from app.services.graph_db import get_graph_db
 from app.utils.graph_queries import CypherQueries
 from app.models.graph_models import SkillGapResult, ReadinessScore
 
 logger = logging.getLogger(__name__)
 
+# Graph rows repeat the same few labels/types/property keys thousands of times.
+# Bounded so arbitrary node labels can't grow the cache without limit.
+_intern = lru_cache(maxsize=4096)(sys.intern)
+
+
+def _graph_row(record, interned: Tuple[str, ...]) -> Dict[str, Any]:
+    """Node/edge record as a dict with repeated strings interned"""
+    row = record.data()
+    for field in interned:
+        if isinstance(row[field], str):
+            row[field] = _intern(row[field])
+    # Neo4j temporal values (e.g. HAS_SKILL.added_at) aren't JSON-native
+    row["properties"] = {
+        _intern(key): value.iso_format() if hasattr(value, "iso_format") else value
+        for key, value in row["properties"].items()
+    }
+    return row
+
 
 class HybridGraphService:
     """
@@ -384,6 +404,45 @@ class HybridGraphService:
         
         return paths
     
+    # ========================
+    # GRAPH VISUALIZATION
+    # ========================
+    
+    def get_user_graph(self, user_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch the user's 2-hop neighbourhood as node and edge rows.
+        Only the user's own nodes and shared catalogue nodes are included;
+        the User node's properties are withheld (id/label/type only).
+        """
+        if not self.graph_db.driver:
+            return {"nodes": [], "edges": []}
+        
+        with self.graph_db.driver.session() as session:
+            nodes = [
+                _graph_row(record, ("label", "type"))
+                for record in session.run(self.queries.GET_USER_GRAPH_NODES, user_id=user_id)
+            ]
+            edges = [
+                _graph_row(record, ("type",))
+                for record in session.run(self.queries.GET_USER_GRAPH_EDGES, user_id=user_id)
+            ]
+        
+        return {"nodes": nodes, "edges": edges}
+    
+    def iter_user_graph(self, user_id: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield ("node", row) then ("edge", row) straight off the Neo4j cursors.
+        Same rows as get_user_graph, without holding the whole graph in memory.
+        """
+        if not self.graph_db.driver:
+            return
+        
+        with self.graph_db.driver.session() as session:
+            for record in session.run(self.queries.GET_USER_GRAPH_NODES, user_id=user_id):
+                yield "node", _graph_row(record, ("label", "type"))
+            for record in session.run(self.queries.GET_USER_GRAPH_EDGES, user_id=user_id):
+                yield "edge", _graph_row(record, ("type",))
+    
     # ========================
     # SKILL RECOMMENDATION ENGINE
     # ========================
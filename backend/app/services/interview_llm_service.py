@@ -1,6 +1,6 @@
 # backend/app/services/interview_llm_service.py
 
-from groq import Groq
+from app.services.groq_client import get_groq_client
 from typing import List, Dict, Any, Optional
 from app.config.settings import settings
 import json
@@ -21,7 +21,7 @@ class InterviewLLMService:
         self.client = None
         if settings.GROQ_API_KEY_INTERVIEW:
             try:
-                self.client = Groq(api_key=settings.GROQ_API_KEY_INTERVIEW)
+                self.client = get_groq_client(settings.GROQ_API_KEY_INTERVIEW)
             except Exception as e:
                 logger.warning(f"Could not initialize Groq client for interviews: {e}")
         self.model = "llama3-70b-8192"  # Best for reasoning
@@ -150,7 +150,7 @@ Return ONLY valid JSON, no markdown."""}
         ]
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=0.7,
@@ -232,7 +232,7 @@ Return JSON:
 }}"""
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.fast_model,  # Fast evaluation
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -315,7 +315,7 @@ Provide comprehensive evaluation in JSON:
 }}"""
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,  # Use powerful model for final eval
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -368,12 +368,11 @@ Return JSON format:
         if not history:
             return "No previous conversation (this is the first question)."
         
-        formatted = []
-        for msg in history[-6:]:  # Last 6 exchanges (3 Q&A pairs)
-            speaker = "Interviewer" if msg["speaker"] == "ai" else "Candidate"
-            formatted.append(f"{speaker}: {msg['message']}")
-        
-        return "\n".join(formatted)
+        # Last 6 exchanges (3 Q&A pairs)
+        return "\n".join(
+            f"{'Interviewer' if msg['speaker'] == 'ai' else 'Candidate'}: {msg['message']}"
+            for msg in history[-6:]
+        )
     
     def _summarize_conversations(self, conversations: List[Dict]) -> str:
         """Summarize all conversations for final eval"""
@@ -33,8 +33,9 @@ from app.schemas.interview_schemas import (
     AnswerSubmit,
     AnswerFeedback,
     EvaluationResponse,
+    InterviewAnalytics,
     InterviewHistoryItem,
-    InterviewAnalytics
+    ScorePoint
 )
 
 # Services
@@ -95,10 +96,10 @@ class InterviewService:
                 id=str(uuid.uuid4()),
                 interview_id=interview.id,
                 round_number=i + 1,
-                round_type=round_config["type"],
-                difficulty=round_config.get("difficulty", "medium"),
+                round_type=round_config.type,
+                difficulty=round_config.difficulty,
                 status="unlocked" if i == 0 else "locked",  # First round unlocked
-                pass_threshold=round_config.get("pass_threshold", 70.0)
+                pass_threshold=round_config.pass_threshold
             )
             db.add(round_obj)
         
@@ -106,7 +107,7 @@ class InterviewService:
         db.refresh(interview)
         
         logger.info(f"✅ Created interview {interview.id} for user {user_id}")
-        return InterviewResponse.from_orm(interview)
+        return InterviewResponse.from_orm_fast(interview)
     
     async def start_interview(
         self,
@@ -523,7 +524,7 @@ class InterviewService:
         if not evaluation:
             raise ValueError("Evaluation not found")
         
-        return EvaluationResponse.from_orm(evaluation)
+        return EvaluationResponse.from_orm_fast(evaluation)
     
     async def get_history(
         self,
@@ -543,7 +544,7 @@ class InterviewService:
                 id=i.id,
                 company_name=i.company_name,
                 custom_topics=i.custom_topics,
-                overall_score=i.overall_score or 0,
+                overall_score=i.overall_score or 0.0,
                 pass_fail_status=i.pass_fail_status or "pending",
                 created_at=i.created_at
             )
@@ -577,14 +578,15 @@ class InterviewService:
         
         # Score trend
         trend = [
-            {
-                "date": i.completed_at.strftime("%Y-%m-%d"),
-                "score": i.overall_score or 0
-            }
+            ScorePoint(
+                date=i.completed_at.strftime("%Y-%m-%d"),
+                score=float(i.overall_score or 0)
+            )
             for i in sorted(interviews, key=lambda x: x.completed_at)
         ]
         
-        return InterviewAnalytics(
+        # Values are already typed above; skip re-validating every trend point
+        return InterviewAnalytics.model_construct(
             total_interviews=total,
             pass_rate=round(passed / total * 100, 1),
             average_score=round(avg_score, 1),
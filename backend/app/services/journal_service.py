@@ -5,6 +5,7 @@ from app.services.vector_db import get_vector_db
 from typing import Dict, Any, List
 import logging
 import json
+import random
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -307,11 +308,9 @@ Recommendations: {', '.join(response.get('recommendations', []))}"""
         }
         
         if category and category in prompts:
-            import random
             return random.sample(prompts[category], min(3, len(prompts[category])))
         
         # Return mixed prompts
-        import random
         all_prompts = [p for category_prompts in prompts.values() for p in category_prompts]
         return random.sample(all_prompts, 5)
     
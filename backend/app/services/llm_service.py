@@ -1,14 +1,76 @@
 # backend/app/services/llm_service.py - FIXED
 
-from groq import Groq
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Final, Optional, Union
 from app.config.settings import settings
-import json
+from app.services.groq_client import get_groq_client
 import logging
 import re
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; used to dig JSON out of responses that aren't bare JSON
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_JSON_ARRAY_RE = re.compile(r'\[\s*\{.*?\}\s*\]', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{\s*".*?\}\s*', re.DOTALL)
+
+# Static system prompts: built once at import, and an identical prefix on every
+# request lets the provider reuse its prompt cache.
+_DEFAULT_JSON_SYSTEM_PROMPT: Final[str] = "You are a helpful assistant that responds in JSON format."
+
+_ROADMAP_SYSTEM_PROMPT: Final[str] = """You are an expert career strategist and learning path designer. 
+Create comprehensive, realistic roadmaps for transitioning to the user's target role.
+Focus on practical, achievable steps with real resources.
+Prioritize in-demand skills and hands-on projects.
+Always return valid JSON without markdown formatting."""
+
+_RESUME_SYSTEM_PROMPT: Final[str] = """You are an expert career advisor and resume reviewer. 
+Provide detailed, actionable feedback in JSON format with the following structure:
+{
+  "score": 85,
+  "strengths": ["list of strengths"],
+  "weaknesses": ["list of weaknesses"],
+  "gaps": ["missing skills or experience"],
+  "recommendations": ["specific improvement suggestions"]
+}"""
+
+_JOB_MATCH_SYSTEM_PROMPT: Final[str] = """You are a job matching expert. Return JSON:
+{
+  "compatibility_score": 75,
+  "matching_skills": ["skill1", "skill2"],
+  "missing_skills": ["skill1", "skill2"],
+  "experience_match": "good|partial|poor",
+  "recommendations": ["rec1", "rec2"],
+  "should_apply": true
+}"""
+
+_INTERVIEW_QUESTIONS_SYSTEM_PROMPT: Final[str] = """You are an interview coach. Return JSON:
+{
+  "questions": [
+    {
+      "question": "Tell me about...",
+      "category": "behavioral",
+      "difficulty": "medium",
+      "sample_answer": "A good answer would include...",
+      "evaluation_criteria": ["criteria1", "criteria2"]
+    }
+  ]
+}"""
+
+_INTERVIEW_EVAL_SYSTEM_PROMPT: Final[str] = """You are an interview evaluator. Provide honest, constructive feedback in JSON:
+{
+  "content_score": 75,
+  "clarity_score": 80,
+  "relevance_score": 90,
+  "overall_score": 82,
+  "strengths": ["strength1", "strength2"],
+  "improvements": ["improvement1", "improvement2"],
+  "feedback": "Detailed feedback paragraph"
+}"""
+
+_MOTIVATION_SYSTEM_PROMPT: Final[str] = "You are a supportive career coach who provides genuine, warm encouragement."
+
+
 class LLMService:
     """
     LLM Service using Groq (FREE API)
@@ -22,7 +84,7 @@ class LLMService:
         if not api_key:
             raise ValueError("GROQ_API_KEY or GROQ_API_KEY_INTERVIEW must be set in .env")
         
-        self.client = Groq(api_key=api_key)
+        self.client = get_groq_client(api_key)
         self.default_model = "llama-3.3-70b-versatile"  # Fast and capable
     
     async def generate(
@@ -43,7 +105,7 @@ class LLMService:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
             
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=model or self.default_model,
                 messages=messages,
                 temperature=temperature,
@@ -65,42 +127,24 @@ class LLMService:
             logger.error("Empty response received")
             return None
         
-        try:
-            # Try direct JSON parse first
-            return json.loads(response)
-        except json.JSONDecodeError:
-            pass
-        
-        # Try extracting from markdown code blocks
-        code_block_pattern = re.compile(
-            r"``````",
-            re.DOTALL | re.IGNORECASE
-        )
-        
-        match = code_block_pattern.search(response)
-        if match:
-            json_str = match.group(1).strip()
+        # Fenced responses never parse as-is, so try the fence contents first;
+        # each candidate is encoded once and handed to orjson as bytes
+        text = response.strip()
+        match = _FENCE_RE.search(text)
+        for candidate in ((match.group(1).strip(), text) if match else (text,)):
             try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
+                return orjson.loads(candidate.encode("utf-8"))
+            except orjson.JSONDecodeError:
                 pass
         
         # Last resort: try to find JSON-like structure
-        # Look for array
-        array_match = re.search(r'\[\s*\{.*?\}\s*\]', response, re.DOTALL)
-        if array_match:
-            try:
-                return json.loads(array_match.group(0))
-            except json.JSONDecodeError:
-                pass
-        
-        # Look for object
-        object_match = re.search(r'\{\s*".*?\}\s*', response, re.DOTALL)
-        if object_match:
-            try:
-                return json.loads(object_match.group(0))
-            except json.JSONDecodeError:
-                pass
+        for pattern in (_JSON_ARRAY_RE, _JSON_OBJECT_RE):
+            found = pattern.search(response)
+            if found:
+                try:
+                    return orjson.loads(found.group(0))
+                except orjson.JSONDecodeError:
+                    pass
         
         logger.error(f"Could not extract JSON from response: {response[:500]}")
         return None
@@ -114,7 +158,7 @@ class LLMService:
         """
         Generate JSON output (can return dict or list)
         """
-        system = system_prompt or "You are a helpful assistant that responds in JSON format."
+        system = system_prompt or _DEFAULT_JSON_SYSTEM_PROMPT
         
         # Add explicit JSON instruction to prompt
         if "Return ONLY valid JSON" not in prompt:
@@ -238,11 +282,7 @@ Return ONLY valid JSON with this EXACT structure:
 }}
 """
 
-        system_prompt = f"""You are an expert career strategist and learning path designer. 
-Create comprehensive, realistic roadmaps for transitioning to {target_role}.
-Focus on practical, achievable steps with real resources.
-Prioritize in-demand skills and hands-on projects.
-Always return valid JSON without markdown formatting."""
+        system_prompt = _ROADMAP_SYSTEM_PROMPT
 
         try:
             result = await self.generate_json(prompt, system_prompt)
@@ -449,15 +489,7 @@ Provide:
 4. Missing sections or details
 """
         
-        system_prompt = """You are an expert career advisor and resume reviewer. 
-Provide detailed, actionable feedback in JSON format with the following structure:
-{
-  "score": 85,
-  "strengths": ["list of strengths"],
-  "weaknesses": ["list of weaknesses"],
-  "gaps": ["missing skills or experience"],
-  "recommendations": ["specific improvement suggestions"]
-}"""
+        system_prompt = _RESUME_SYSTEM_PROMPT
         
         return await self.generate_json(prompt, system_prompt)
     
@@ -487,15 +519,7 @@ Calculate:
 5. Recommendations for application
 """
         
-        system_prompt = """You are a job matching expert. Return JSON:
-{
-  "compatibility_score": 75,
-  "matching_skills": ["skill1", "skill2"],
-  "missing_skills": ["skill1", "skill2"],
-  "experience_match": "good|partial|poor",
-  "recommendations": ["rec1", "rec2"],
-  "should_apply": true
-}"""
+        system_prompt = _JOB_MATCH_SYSTEM_PROMPT
         
         return await self.generate_json(prompt, system_prompt)
     
@@ -520,18 +544,7 @@ Create 10 questions covering:
 - Company-specific
 """
         
-        system_prompt = """You are an interview coach. Return JSON:
-{
-  "questions": [
-    {
-      "question": "Tell me about...",
-      "category": "behavioral",
-      "difficulty": "medium",
-      "sample_answer": "A good answer would include...",
-      "evaluation_criteria": ["criteria1", "criteria2"]
-    }
-  ]
-}"""
+        system_prompt = _INTERVIEW_QUESTIONS_SYSTEM_PROMPT
         
         result = await self.generate_json(prompt, system_prompt)
         return result.get("questions", [])
@@ -557,16 +570,7 @@ Evaluate the response on:
 6. Overall score (0-100)
 """
         
-        system_prompt = """You are an interview evaluator. Provide honest, constructive feedback in JSON:
-{
-  "content_score": 75,
-  "clarity_score": 80,
-  "relevance_score": 90,
-  "overall_score": 82,
-  "strengths": ["strength1", "strength2"],
-  "improvements": ["improvement1", "improvement2"],
-  "feedback": "Detailed feedback paragraph"
-}"""
+        system_prompt = _INTERVIEW_EVAL_SYSTEM_PROMPT
         
         return await self.generate_json(prompt, system_prompt)
     
@@ -589,12 +593,15 @@ Generate a warm, encouraging, personalized message that:
 - Keeps it concise (2-3 sentences)
 """
         
-        system_prompt = "You are a supportive career coach who provides genuine, warm encouragement."
+        system_prompt = _MOTIVATION_SYSTEM_PROMPT
         
         return await self.generate(prompt, system_prompt, temperature=0.9)
-def get_llm_service() -> LLMService:
-    """Factory function to get LLM service instance"""
-    return LLMService()
+
 
 # Singleton instance
 llm_service = LLMService()
+
+
+def get_llm_service() -> LLMService:
+    """Factory function to get LLM service instance"""
+    return llm_service
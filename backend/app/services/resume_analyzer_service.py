@@ -5,9 +5,13 @@ from typing import Dict, Any, List, Optional
 import logging
 import json
 import re
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; strips a ```json ... ``` fence around an LLM response
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
 class ResumeAnalyzerService:
     """AI-powered resume analysis using Groq LLM"""
     
@@ -491,41 +495,30 @@ Return ONLY valid JSON:
         if not experience:
             return "- No experience listed"
         
-        lines = []
-        for exp in experience[:3]:
-            title = exp.get("title", "N/A")
-            company = exp.get("company", "N/A")
-            duration = exp.get("duration", "N/A")
-            lines.append(f"- {title} at {company} ({duration})")
-        
-        return "\n".join(lines)
+        return "\n".join(
+            f"- {exp.get('title', 'N/A')} at {exp.get('company', 'N/A')} ({exp.get('duration', 'N/A')})"
+            for exp in experience[:3]
+        )
     
     def _format_projects_summary(self, projects: List[Dict]) -> str:
         """Format projects for prompt"""
         if not projects:
             return "- No projects listed"
         
-        lines = []
-        for proj in projects[:3]:
-            name = proj.get("name", "N/A")
-            techs = proj.get("technologies", [])
-            tech_str = ', '.join(techs[:5]) if techs else "N/A"
-            lines.append(f"- {name} ({tech_str})")
-        
-        return "\n".join(lines)
+        return "\n".join(
+            f"- {proj.get('name', 'N/A')} ({', '.join((proj.get('technologies') or [])[:5]) or 'N/A'})"
+            for proj in projects[:3]
+        )
     
     def _format_education_summary(self, education: List[Dict]) -> str:
         """Format education for prompt"""
         if not education:
             return "- No education listed"
         
-        lines = []
-        for edu in education:
-            degree = edu.get("degree", "N/A")
-            institution = edu.get("institution", "N/A")
-            lines.append(f"- {degree} from {institution}")
-        
-        return "\n".join(lines)
+        return "\n".join(
+            f"- {edu.get('degree', 'N/A')} from {edu.get('institution', 'N/A')}"
+            for edu in education
+        )
     
     # backend/app/services/resume_analyzer_service.py - FIX LINE 464
 
@@ -542,18 +535,13 @@ Return ONLY valid JSON:
             logger.debug(f"Raw LLM response (first 500 chars):\n{cleaned[:500]}")
 
             # 🔹 Extract JSON inside markdown code fences if present
-            code_block_pattern = re.compile(
-                r"```(?:json)?\s*(.*?)\s*```",
-                re.DOTALL | re.IGNORECASE
-            )
-
-            match = code_block_pattern.search(cleaned)
+            match = _FENCE_RE.search(cleaned)
             if match:
                 cleaned = match.group(1)
 
             logger.debug(f"Cleaned JSON (first 500 chars):\n{cleaned[:500]}")
 
-            parsed = json.loads(cleaned)
+            parsed = orjson.loads(cleaned.encode("utf-8"))
 
             logger.debug(f"Successfully parsed JSON of type: {type(parsed)}")
             return parsed
@@ -6,6 +6,7 @@ import os
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 import asyncio
+import orjson
 from pathlib import Path
 import pdfplumber
 from docx import Document
@@ -15,6 +16,9 @@ from app.config.settings import settings
 import logging
 logger = logging.getLogger(__name__)
 
+# Compiled once; strips a ```json ... ``` fence around an LLM response
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
 
 class ResumeParserService:
     """
@@ -28,8 +32,8 @@ class ResumeParserService:
         self.model = None
         if settings.GROQ_API_KEY:
             try:
-                from groq import Groq
-                self.client = Groq(api_key=settings.GROQ_API_KEY)
+                from app.services.groq_client import get_groq_client
+                self.client = get_groq_client(settings.GROQ_API_KEY)
                 self.model = "llama-3.3-70b-versatile"
                 logger.info("✅ Resume Parser Service initialized with Groq")
             except Exception as e:
@@ -41,16 +45,13 @@ class ResumeParserService:
     
     async def call_llm(self, prompt: str, max_retries: int = 3) -> str:
         """Call Groq LLM with retry logic"""
-        import time
-        
         if not self.client:
             logger.debug("LLM client not available — skipping LLM calls")
             return ""
 
         for attempt in range(max_retries):
             try:
-                response = await asyncio.to_thread(
-                    self.client.chat.completions.create,
+                response = await self.client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "You are a precise resume parser. Always return valid JSON when asked. Extract ALL information accurately."},
@@ -88,18 +89,13 @@ class ResumeParserService:
         text = text.strip()
 
         # 🔹 Remove markdown code blocks (```json ... ``` or ``` ... ```)
-        code_block_pattern = re.compile(
-            r"```(?:json)?\s*(.*?)\s*```",
-            re.DOTALL | re.IGNORECASE
-        )
-
-        match = code_block_pattern.search(text)
+        match = _FENCE_RE.search(text)
         if match:
             text = match.group(1)
 
         # 🔹 Try parsing JSON
         try:
-            return json.loads(text)
+            return orjson.loads(text.encode("utf-8"))
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}")
             logger.debug(f"Failed to parse JSON text:\n{text[:500]}")
@@ -1,5 +1,6 @@
 # backend/app/services/tts_service.py
 
+import io
 import os
 from pathlib import Path
 from app.config.settings import settings
@@ -102,8 +103,6 @@ class TTSService:
             return b""
         
         try:
-            import io
-            
             model = self._load_model()
             if model is None:
                 return b""
@@ -1,6 +1,7 @@
 # backend/app/services/user_graph_sync.py
 
 import logging
+from contextlib import nullcontext
 from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from app.models.database import User, Skill, Project, Experience, CareerGoal
@@ -20,18 +21,22 @@ class UserGraphSync:
         self.graph_db = get_graph_db()
         self.queries = CypherQueries()
     
+    def _session(self, session=None):
+        """Reuse the caller's session if given, otherwise open a new one"""
+        return nullcontext(session) if session is not None else self.graph_db.driver.session()
+    
     # ========================
     # SYNC USER NODE
     # ========================
     
-    def sync_user_node(self, user: User) -> bool:
+    def sync_user_node(self, user: User, session=None) -> bool:
         """Create or update User node in Neo4j"""
         if not self.graph_db.driver:
             logger.warning("GraphDB not available")
             return False
         
         try:
-            with self.graph_db.driver.session() as session:
+            with self._session(session) as session:
                 session.run(
                     self.queries.MERGE_USER,
                     id=user.id,
@@ -49,7 +54,7 @@ class UserGraphSync:
     # SYNC USER SKILLS
     # ========================
     
-    def sync_user_skills(self, user_id: str, db: Session) -> int:
+    def sync_user_skills(self, user_id: str, db: Session, session=None) -> int:
         """Sync user skills from SQL to Neo4j"""
         if not self.graph_db.driver:
             return 0
@@ -57,7 +62,7 @@ class UserGraphSync:
         skills = db.query(Skill).filter(Skill.user_id == user_id).all()
         
         count = 0
-        with self.graph_db.driver.session() as session:
+        with self._session(session) as session:
             for skill in skills:
                 try:
                     session.run(
@@ -78,7 +83,7 @@ class UserGraphSync:
     # SYNC USER PROJECTS
     # ========================
     
-    def sync_user_projects(self, user_id: str, db: Session) -> int:
+    def sync_user_projects(self, user_id: str, db: Session, session=None) -> int:
         """Sync user projects from SQL to Neo4j"""
         if not self.graph_db.driver:
             return 0
@@ -86,7 +91,7 @@ class UserGraphSync:
         projects = db.query(Project).filter(Project.user_id == user_id).all()
         
         count = 0
-        with self.graph_db.driver.session() as session:
+        with self._session(session) as session:
             for project in projects:
                 try:
                     # Create project node
@@ -127,7 +132,7 @@ class UserGraphSync:
     # SYNC CAREER GOALS
     # ========================
     
-    def sync_career_goals(self, user_id: str, db: Session) -> int:
+    def sync_career_goals(self, user_id: str, db: Session, session=None) -> int:
         """Sync career goals from SQL to Neo4j"""
         if not self.graph_db.driver:
             return 0
@@ -138,7 +143,7 @@ class UserGraphSync:
             return 0
         
         count = 0
-        with self.graph_db.driver.session() as session:
+        with self._session(session) as session:
             # Create career goal node
             try:
                 session.run(
@@ -177,8 +182,8 @@ class UserGraphSync:
     # COMPLETE USER SYNC
     # ========================
     
-    def sync_complete_user(self, user_id: str, db: Session) -> Dict[str, int]:
-        """Complete synchronization of user data to Neo4j"""
+    def sync_complete_user(self, user_id: str, db: Session, session=None) -> Dict[str, int]:
+        """Complete synchronization of user data to Neo4j (one Neo4j session for all steps)"""
         logger.info(f"Starting complete sync for user: {user_id}")
         
         results = {}
@@ -189,18 +194,23 @@ class UserGraphSync:
             logger.error(f"User {user_id} not found")
             return results
         
-        # Sync user node
-        if self.sync_user_node(user):
-            results["user"] = 1
-        
-        # Sync skills
-        results["skills"] = self.sync_user_skills(user_id, db)
-        
-        # Sync projects
-        results["projects"] = self.sync_user_projects(user_id, db)
+        if not self.graph_db.driver:
+            logger.warning("GraphDB not available")
+            return {"skills": 0, "projects": 0, "goals": 0}
         
-        # Sync career goals
-        results["goals"] = self.sync_career_goals(user_id, db)
+        with self._session(session) as session:
+            # Sync user node
+            if self.sync_user_node(user, session):
+                results["user"] = 1
+            
+            # Sync skills
+            results["skills"] = self.sync_user_skills(user_id, db, session)
+            
+            # Sync projects
+            results["projects"] = self.sync_user_projects(user_id, db, session)
+            
+            # Sync career goals
+            results["goals"] = self.sync_career_goals(user_id, db, session)
         
         logger.info(f"Sync completed for user {user_id}: {results}")
         return results
@@ -231,6 +241,88 @@ class UserGraphSync:
         logger.info(f"Batch sync completed: {results}")
         return results
     
+    # ========================
+    # BULK SYNC
+    # ========================
+    
+    def sync_users_bulk(self, users: List[User], db: Session) -> Dict[str, int]:
+        """
+        Sync a chunk of users (and their skills, projects, goals) in one write transaction.
+        Each entity type is a single UNWIND statement instead of one statement per row.
+        """
+        results = {"users": 0, "skills": 0, "projects": 0, "goals": 0}
+        if not self.graph_db.driver or not users:
+            return results
+        
+        user_ids = [user.id for user in users]
+        
+        user_rows = [
+            {
+                "id": user.id,
+                "props": {
+                    "name": user.full_name or user.username,
+                    "email": user.email,
+                    "target_role": None  # Will be set separately
+                }
+            }
+            for user in users
+        ]
+        
+        skill_rows = [
+            {
+                "user_id": skill.user_id,
+                "skill": skill.skill,
+                "level": skill.level.value if skill.level else "intermediate",
+                "verified": skill.verified
+            }
+            for skill in db.query(Skill).filter(Skill.user_id.in_(user_ids))
+        ]
+        
+        project_rows = [
+            {
+                "id": str(project.id),
+                "user_id": project.user_id,
+                "title": project.title,
+                "description": project.description or "",
+                "skills": [s.strip() for s in (project.tech_stack or "").split(',') if s.strip()]
+            }
+            for project in db.query(Project).filter(Project.user_id.in_(user_ids))
+        ]
+        
+        # One goal per user, as in sync_career_goals
+        goals = {}
+        for goal in db.query(CareerGoal).filter(CareerGoal.user_id.in_(user_ids)):
+            goals.setdefault(goal.user_id, goal)
+        goal_rows = [
+            {
+                "id": str(goal.id),
+                "user_id": goal.user_id,
+                "target_roles": goal.target_roles or [],
+                "timeline": goal.target_timeline or "6 Months"
+            }
+            for goal in goals.values()
+        ]
+        
+        # Users first so the relationship statements can MATCH them
+        statements = (
+            ("users", self.queries.BULK_MERGE_USERS, user_rows),
+            ("skills", self.queries.BULK_CREATE_USER_HAS_SKILL, skill_rows),
+            ("projects", self.queries.BULK_MERGE_PROJECTS, project_rows),
+            ("goals", self.queries.BULK_MERGE_CAREER_GOALS, goal_rows),
+        )
+        
+        def write_chunk(tx):
+            return {
+                key: tx.run(query, rows=rows).single()["count"]
+                for key, query, rows in statements
+            }
+        
+        with self.graph_db.driver.session() as session:
+            results = session.execute_write(write_chunk)
+        
+        logger.info(f"Bulk synced {len(users)} users: {results}")
+        return results
+    
     # ========================
     # DELETE USER
     # ========================
@@ -6,6 +6,7 @@ from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Any, Optional
 from app.config.settings import settings
 import logging
+import uuid
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +74,6 @@ class VectorDBService:
             Document ID
         """
         if not doc_id:
-            import uuid
             doc_id = f"{user_id}_{metadata.get('source', 'unknown')}_{uuid.uuid4().hex[:8]}"
         
         # Add user_id to metadata
@@ -12,10 +12,14 @@ class CypherQueries:
     # SCHEMA SETUP
     # ========================
     
-    CREATE_CONSTRAINTS = [
+    # Keys the static graph builders MERGE on; backed by unique indexes so MERGE seeks
+    STATIC_KEY_CONSTRAINTS = [
         "CREATE CONSTRAINT IF NOT EXISTS FOR (j:JobRole) REQUIRE j.name IS UNIQUE",
         "CREATE CONSTRAINT IF NOT EXISTS FOR (s:Skill) REQUIRE s.name IS UNIQUE",
         "CREATE CONSTRAINT IF NOT EXISTS FOR (r:Resource) REQUIRE r.title IS UNIQUE",
+    ]
+    
+    CREATE_CONSTRAINTS = STATIC_KEY_CONSTRAINTS + [
         "CREATE CONSTRAINT IF NOT EXISTS FOR (u:User) REQUIRE u.id IS UNIQUE",
         "CREATE CONSTRAINT IF NOT EXISTS FOR (p:Project) REQUIRE p.id IS UNIQUE",
         "CREATE CONSTRAINT IF NOT EXISTS FOR (i:Interview) REQUIRE i.id IS UNIQUE",
@@ -34,39 +38,41 @@ class CypherQueries:
     # STATIC GRAPH: Job-Skill Requirements
     # ========================
     
+    # Static graph queries are batched: $rows is a list of parameter maps. They return
+    # nothing; GraphBuilder reads nodes/relationships created from the summary counters.
     MERGE_JOB_ROLE = """
-        MERGE (j:JobRole {name: $name})
-        SET j.short_description = $short_description,
-            j.industry = $industry,
-            j.seniority_levels = $seniority_levels,
+        UNWIND $rows as row
+        MERGE (j:JobRole {name: row.name})
+        SET j.short_description = row.short_description,
+            j.industry = row.industry,
+            j.seniority_levels = row.seniority_levels,
             j.updated_at = datetime()
-        RETURN j
     """
     
     MERGE_SKILL = """
-        MERGE (s:Skill {name: $name})
-        SET s.category = $category,
-            s.description = $description,
+        UNWIND $rows as row
+        MERGE (s:Skill {name: row.name})
+        SET s.category = row.category,
+            s.description = row.description,
             s.updated_at = datetime()
-        RETURN s
     """
     
     CREATE_JOB_REQUIRES_SKILL = """
-        MATCH (j:JobRole {name: $job_role})
-        MATCH (s:Skill {name: $skill})
+        UNWIND $rows as row
+        MATCH (j:JobRole {name: row.job_role})
+        MATCH (s:Skill {name: row.skill})
         MERGE (j)-[r:REQUIRES]->(s)
         SET r.importance = 'core',
             r.created_at = coalesce(r.created_at, datetime())
-        RETURN r
     """
     
     CREATE_JOB_NICE_TO_HAVE_SKILL = """
-        MATCH (j:JobRole {name: $job_role})
-        MATCH (s:Skill {name: $skill})
+        UNWIND $rows as row
+        MATCH (j:JobRole {name: row.job_role})
+        MATCH (s:Skill {name: row.skill})
         MERGE (j)-[r:NICE_TO_HAVE]->(s)
         SET r.importance = 'optional',
             r.created_at = coalesce(r.created_at, datetime())
-        RETURN r
     """
     
     # ========================
@@ -74,19 +80,19 @@ class CypherQueries:
     # ========================
     
     CREATE_SKILL_PREREQUISITE = """
-        MATCH (s1:Skill {name: $skill_from})
-        MATCH (s2:Skill {name: $skill_to})
+        UNWIND $rows as row
+        MATCH (s1:Skill {name: row.skill_from})
+        MATCH (s2:Skill {name: row.skill_to})
         MERGE (s1)-[r:PREREQUISITE_OF]->(s2)
         SET r.created_at = coalesce(r.created_at, datetime())
-        RETURN r
     """
     
     CREATE_SKILL_RELATED = """
-        MATCH (s1:Skill {name: $skill1})
-        MATCH (s2:Skill {name: $skill2})
+        UNWIND $rows as row
+        MATCH (s1:Skill {name: row.skill1})
+        MATCH (s2:Skill {name: row.skill2})
         MERGE (s1)-[r:RELATED_TO]->(s2)
         SET r.created_at = coalesce(r.created_at, datetime())
-        RETURN r
     """
     
     # ========================
@@ -94,19 +100,19 @@ class CypherQueries:
     # ========================
     
     MERGE_RESOURCE = """
-        MERGE (r:Resource {title: $title})
-        SET r.resource_type = $resource_type,
-            r.url = $url,
+        UNWIND $rows as row
+        MERGE (r:Resource {title: row.title})
+        SET r.resource_type = row.resource_type,
+            r.url = row.url,
             r.updated_at = datetime()
-        RETURN r
     """
     
     CREATE_RESOURCE_TEACHES_SKILL = """
-        MATCH (r:Resource {title: $resource_title})
-        MATCH (s:Skill {name: $skill})
+        UNWIND $rows as row
+        MATCH (r:Resource {title: row.resource_title})
+        MATCH (s:Skill {name: row.skill})
         MERGE (r)-[rel:TEACHES]->(s)
         SET rel.created_at = coalesce(rel.created_at, datetime())
-        RETURN rel
     """
     
     # ========================
@@ -208,6 +214,71 @@ class CypherQueries:
         RETURN r
     """
     
+    # ========================
+    # USER GRAPH: Bulk sync ($rows = one map per user / skill / goal / project)
+    # ========================
+    
+    BULK_MERGE_USERS = """
+        UNWIND $rows as row
+        MERGE (u:User {id: row.id})
+        SET u += row.props,
+            u.updated_at = datetime(),
+            u.created_at = coalesce(u.created_at, datetime())
+        RETURN count(u) as count
+    """
+    
+    BULK_CREATE_USER_HAS_SKILL = """
+        UNWIND $rows as row
+        MATCH (u:User {id: row.user_id})
+        MERGE (s:Skill {name: row.skill})
+        MERGE (u)-[r:HAS_SKILL]->(s)
+        SET r.level = row.level,
+            r.verified = row.verified,
+            r.added_at = coalesce(r.added_at, datetime()),
+            r.updated_at = datetime()
+        RETURN count(r) as count
+    """
+    
+    BULK_MERGE_CAREER_GOALS = """
+        UNWIND $rows as row
+        MATCH (u:User {id: row.user_id})
+        MERGE (cg:CareerGoal {id: row.id})
+        SET cg.user_id = row.user_id,
+            cg.target_roles = row.target_roles,
+            cg.timeline = row.timeline,
+            cg.updated_at = datetime(),
+            cg.created_at = coalesce(cg.created_at, datetime())
+        MERGE (u)-[hg:HAS_GOAL]->(cg)
+        SET hg.created_at = coalesce(hg.created_at, datetime())
+        WITH u, row
+        UNWIND row.target_roles as role
+        MERGE (j:JobRole {name: role})
+        MERGE (u)-[r:ASPIRES_TO]->(j)
+        SET r.timeline = row.timeline,
+            r.created_at = coalesce(r.created_at, datetime()),
+            r.priority = 1
+        RETURN count(r) as count
+    """
+    
+    BULK_MERGE_PROJECTS = """
+        UNWIND $rows as row
+        MATCH (u:User {id: row.user_id})
+        MERGE (p:Project {id: row.id})
+        SET p.user_id = row.user_id,
+            p.title = row.title,
+            p.description = row.description,
+            p.updated_at = datetime(),
+            p.created_at = coalesce(p.created_at, datetime())
+        MERGE (u)-[b:BUILT]->(p)
+        SET b.created_at = coalesce(b.created_at, datetime())
+        FOREACH (skill IN row.skills |
+            MERGE (s:Skill {name: skill})
+            MERGE (p)-[r:USES]->(s)
+            SET r.created_at = coalesce(r.created_at, datetime())
+        )
+        RETURN count(p) as count
+    """
+    
     # ========================
     # USER GRAPH: Feedback-Outcome
     # ========================
@@ -341,6 +412,31 @@ class CypherQueries:
         ORDER BY depth
     """
     
+    # ========================
+    # STATIC GRAPH: Validation
+    # ========================
+    
+    # Every node/relationship count in one round trip; each CALL returns a single row
+    VALIDATE_STATIC_GRAPHS = """
+        CALL { MATCH (j:JobRole) RETURN count(j) as job_roles_count }
+        CALL { MATCH (s:Skill) RETURN count(s) as skills_count }
+        CALL { MATCH (r:Resource) RETURN count(r) as resources_count }
+        CALL { MATCH ()-[r:REQUIRES]->() RETURN count(r) as requires_count }
+        CALL { MATCH ()-[r:NICE_TO_HAVE]->() RETURN count(r) as nice_to_have_count }
+        CALL { MATCH ()-[r:PREREQUISITE_OF]->() RETURN count(r) as prerequisites_count }
+        CALL { MATCH ()-[r:TEACHES]->() RETURN count(r) as teaches_count }
+        CALL {
+            MATCH (s:Skill)
+            WHERE NOT EXISTS {
+                MATCH (s)-[]-()
+            }
+            RETURN count(s) as orphaned_skills
+        }
+        RETURN job_roles_count, skills_count, resources_count,
+               requires_count, nice_to_have_count, prerequisites_count,
+               teaches_count, orphaned_skills
+    """
+    
     # ========================
     # UTILITY QUERIES
     # ========================
@@ -379,3 +475,30 @@ class CypherQueries:
                collect(DISTINCT p) as projects,
                collect(DISTINCT ps) as project_skills
     """
+    
+    # Node/edge rows for the user's 2-hop neighbourhood (visualization). Shared Skill
+    # nodes connect every user, so paths may only cross the user, catalogue nodes
+    # (Skill/JobRole/Resource) and nodes the user owns; other users' nodes never surface.
+    GET_USER_GRAPH_NODES = """
+        MATCH path = (u:User {id: $user_id})-[*0..2]-()
+        WHERE all(x IN nodes(path) WHERE x = u OR x:Skill OR x:JobRole OR x:Resource
+                                         OR x.user_id = $user_id)
+        UNWIND nodes(path) as n
+        WITH DISTINCT n
+        RETURN elementId(n) as id,
+               coalesce(n.name, n.title, n.id, labels(n)[0], elementId(n)) as label,
+               labels(n)[0] as type,
+               CASE WHEN n:User THEN {} ELSE properties(n) END as properties
+    """
+    
+    GET_USER_GRAPH_EDGES = """
+        MATCH path = (u:User {id: $user_id})-[*1..2]-()
+        WHERE all(x IN nodes(path) WHERE x = u OR x:Skill OR x:JobRole OR x:Resource
+                                         OR x.user_id = $user_id)
+        UNWIND relationships(path) as r
+        WITH DISTINCT r
+        RETURN elementId(startNode(r)) as source,
+               elementId(endNode(r)) as target,
+               type(r) as type,
+               properties(r) as properties
+    """
@@ -0,0 +1,11 @@
+# backend/app/utils/ids.py
+
+import os
+import uuid
+from typing import List
+
+
+def uuid4_strings(count: int) -> List[str]:
+    """`count` random (version 4) UUID strings drawn from a single os.urandom call"""
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
@@ -0,0 +1,10 @@
+# backend/app/utils/timestamps.py
+
+from datetime import datetime, timezone
+
+_UTC = timezone.utc
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO-8601 string at seconds resolution, e.g. 2025-01-01T12:00:00+00:00"""
+    return datetime.now(_UTC).isoformat(timespec="seconds")